@@ -123,32 +123,32 @@ class PerformanceVisualizer:
             monthly_returns = trades_df.groupby('year_month')['pnl'].sum().reset_index()
             
             # 플롯 생성
-            plt.figure(figsize=(12, 6))
+            fig, ax = plt.subplots(figsize=(12, 6))
             
             # 양수 및 음수 수익 구분
             positive_returns = monthly_returns[monthly_returns['pnl'] >= 0]
             negative_returns = monthly_returns[monthly_returns['pnl'] < 0]
             
-            plt.bar(positive_returns['year_month'], positive_returns['pnl'], color='green', alpha=0.7)
-            plt.bar(negative_returns['year_month'], negative_returns['pnl'], color='red', alpha=0.7)
+            ax.bar(positive_returns['year_month'], positive_returns['pnl'], color='green', alpha=0.7)
+            ax.bar(negative_returns['year_month'], negative_returns['pnl'], color='red', alpha=0.7)
             
-            plt.title('Monthly Returns')
-            plt.xlabel('Month')
-            plt.ylabel('Profit/Loss (USDT)')
-            plt.xticks(rotation=45)
-            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            ax.set_title('Monthly Returns')
+            ax.set_xlabel('Month')
+            ax.set_ylabel('Profit/Loss (USDT)')
+            ax.tick_params(axis='x', labelrotation=45)
+            ax.grid(axis='y', linestyle='--', alpha=0.7)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             if save_path:
-                plt.savefig(save_path)
-                plt.close()
+                fig.savefig(save_path)
+                plt.close(fig)
                 return save_path
             else:
                 # Base64 인코딩된 이미지 반환
                 buf = io.BytesIO()
-                plt.savefig(buf, format='png')
-                plt.close()
+                fig.savefig(buf, format='png')
+                plt.close(fig)
                 buf.seek(0)
                 img_str = base64.b64encode(buf.read()).decode('utf-8')
                 return img_str
@@ -239,25 +239,25 @@ class PerformanceVisualizer:
             trades_df['duration'] = (trades_df['close_time'] - trades_df['open_time']).dt.total_seconds() / 3600
             
             # 플롯 생성
-            plt.figure(figsize=(10, 6))
+            fig, ax = plt.subplots(figsize=(10, 6))
             
-            plt.hist(trades_df['duration'], bins=20, color='blue', alpha=0.7)
-            plt.title('Trade Duration Distribution')
-            plt.xlabel('Duration (hours)')
-            plt.ylabel('Frequency')
-            plt.grid(linestyle='--', alpha=0.7)
+            ax.hist(trades_df['duration'], bins=20, color='blue', alpha=0.7)
+            ax.set_title('Trade Duration Distribution')
+            ax.set_xlabel('Duration (hours)')
+            ax.set_ylabel('Frequency')
+            ax.grid(linestyle='--', alpha=0.7)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             if save_path:
-                plt.savefig(save_path)
-                plt.close()
+                fig.savefig(save_path)
+                plt.close(fig)
                 return save_path
             else:
                 # Base64 인코딩된 이미지 반환
                 buf = io.BytesIO()
-                plt.savefig(buf, format='png')
-                plt.close()
+                fig.savefig(buf, format='png')
+                plt.close(fig)
                 buf.seek(0)
                 img_str = base64.b64encode(buf.read()).decode('utf-8')
                 return img_str
@@ -6,13 +6,15 @@
 
 import logging
 import asyncio
-import json
 import os
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query, Path, Request
+import orjson
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
@@ -83,9 +85,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 의존성 주입: 리스크 관리자 가져오기
-async def get_risk_manager_dependency():
-    """리스크 관리자 의존성"""
+# 응답 압축 미들웨어 설정 (대시보드 폴링 시 /status, /positions 전송량 감소)
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
+
+# 리스크 관리자 가져오기 (Depends 대신 핸들러에서 직접 호출하여 의존성 해석 비용 제거)
+def get_risk_manager_dependency():
+    """리스크 관리자 조회, 초기화되지 않은 경우 500 오류"""
     risk_manager = get_risk_manager()
     if risk_manager is None:
         raise HTTPException(status_code=500, detail="리스크 관리자가 초기화되지 않았습니다")
@@ -95,6 +100,34 @@ async def get_risk_manager_dependency():
 templates_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
 templates = Jinja2Templates(directory=templates_dir)
 
+# /status 응답 캐시: (상태 키, 직렬화된 응답 바이트)
+_status_cache = (None, b"")
+# /status의 오늘 거래 수 캐시 유지 시간 (초, 폴링할 때마다 Redis를 조회하지 않도록 짧게 재사용)
+_TRADE_COUNT_TTL = 1.0
+# 오늘 거래 수 캐시: (만료 시각, 리스크 관리자 id, 거래 수)
+_trade_count_cache = (0.0, None, 0)
+
+async def _get_status_trade_count(risk_manager) -> int:
+    """
+    /status용 오늘 거래 수 조회 (_TRADE_COUNT_TTL 동안은 Redis 조회 없이 이전 값 반환)
+    
+    Args:
+        risk_manager: 리스크 관리자 인스턴스
+        
+    Returns:
+        int: 오늘 거래 수 (최대 _TRADE_COUNT_TTL초 지연될 수 있음)
+    """
+    global _trade_count_cache
+    
+    expires_at, manager_id, count = _trade_count_cache
+    now = time.monotonic()
+    if manager_id == id(risk_manager) and now < expires_at:
+        return count
+    
+    count = await risk_manager.get_daily_trade_count()
+    _trade_count_cache = (now + _TRADE_COUNT_TTL, id(risk_manager), count)
+    return count
+
 # API 라우트 정의
 # DEAD CODE: @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
@@ -102,39 +135,52 @@ async def root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 @app.get("/status", response_model=RiskStatus, tags=["상태"])
-async def get_status(risk_manager = Depends(get_risk_manager_dependency)):
+async def get_status() -> RiskStatus:
     """리스크 관리 상태 조회"""
-    today_date = datetime.now().date().isoformat()
-    daily_trade_count = risk_manager.daily_trades.get(today_date, 0)
+    global _status_cache
     
-    # 현재 드로다운 계산
-    current_drawdown = 0.0
-    if risk_manager.peak_balance > 0:
-        current_drawdown = 1 - (risk_manager.current_balance / risk_manager.peak_balance)
+    risk_manager = get_risk_manager_dependency()
+    daily_trade_count = await _get_status_trade_count(risk_manager)
     
-    return {
-        "kill_switch_active": risk_manager.kill_switch_active,
-        "circuit_breaker_active": risk_manager.circuit_breaker_active,
-        "peak_balance": risk_manager.peak_balance,
-        "current_balance": risk_manager.current_balance,
-        "current_drawdown": current_drawdown,
-        "daily_trade_count": daily_trade_count,
-        "max_drawdown": risk_manager.max_drawdown,
-        "per_trade_stop_loss": risk_manager.per_trade_stop_loss,
-        "risk_per_trade": risk_manager.risk_per_trade,
-        "daily_trade_limit": risk_manager.daily_trade_limit,
-        "circuit_breaker": risk_manager.circuit_breaker
-    }
+    # 상태가 바뀌지 않았으면 이전에 직렬화한 응답을 그대로 반환 (거래 수 캐시가 유효하면 Redis 조회도 없음)
+    cache_key = (
+        id(risk_manager),
+        risk_manager.kill_switch_active,
+        risk_manager.circuit_breaker_active,
+        risk_manager.peak_balance,
+        risk_manager.current_balance,
+        risk_manager.current_drawdown,
+        daily_trade_count
+    )
+    if cache_key == _status_cache[0]:
+        return Response(content=_status_cache[1], media_type="application/json")
+    
+    # 서버 내부 상태이므로 검증을 생략하고 모델을 직접 구성
+    status = RiskStatus.model_construct(
+        kill_switch_active=risk_manager.kill_switch_active,
+        circuit_breaker_active=risk_manager.circuit_breaker_active,
+        peak_balance=risk_manager.peak_balance,
+        current_balance=risk_manager.current_balance,
+        current_drawdown=risk_manager.current_drawdown,
+        daily_trade_count=daily_trade_count,
+        max_drawdown=risk_manager.max_drawdown,
+        per_trade_stop_loss=risk_manager.per_trade_stop_loss,
+        risk_per_trade=risk_manager.risk_per_trade,
+        daily_trade_limit=risk_manager.daily_trade_limit,
+        circuit_breaker=risk_manager.circuit_breaker
+    )
+    
+    # Response 객체를 직접 반환하여 response_model 재검증 단계를 건너뜀 (response_model은 문서화 용도로 유지)
+    body = orjson.dumps(status.model_dump())
+    _status_cache = (cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 @app.post("/balance", tags=["잔액"])
-async def update_balance(balance_update: BalanceUpdate, risk_manager = Depends(get_risk_manager_dependency)):
+async def update_balance(balance_update: BalanceUpdate):
     """잔액 업데이트"""
+    risk_manager = get_risk_manager_dependency()
     result = await risk_manager.update_balance(balance_update.balance)
-    
-    # 드로다운 계산
-    current_drawdown = 0.0
-    if risk_manager.peak_balance > 0:
-        current_drawdown = 1 - (risk_manager.current_balance / risk_manager.peak_balance)
+    current_drawdown = risk_manager.current_drawdown
     
     return {
         "success": result,
@@ -146,8 +192,9 @@ async def update_balance(balance_update: BalanceUpdate, risk_manager = Depends(g
     }
 
 # DEAD CODE: @app.post("/check-trade", tags=["거래"])
-async def check_trade(trade_check: TradeCheck, risk_manager = Depends(get_risk_manager_dependency)):
+async def check_trade(trade_check: TradeCheck):
     """거래 허용 여부 검사"""
+    risk_manager = get_risk_manager_dependency()
     result = await risk_manager.check_trade_allowed(
         pair=trade_check.pair,
         side=trade_check.side,
@@ -172,8 +219,7 @@ async def check_trade(trade_check: TradeCheck, risk_manager = Depends(get_risk_m
             response["reason"] = "서킷 브레이커 활성화"
         else:
             # 일일 거래 제한 검사
-            today_date = datetime.now().date().isoformat()
-            daily_trade_count = risk_manager.daily_trades.get(today_date, 0)
+            daily_trade_count = await risk_manager.get_daily_trade_count()
             if daily_trade_count >= risk_manager.daily_trade_limit:
                 response["reason"] = "일일 거래 제한 초과"
             else:
@@ -182,13 +228,16 @@ async def check_trade(trade_check: TradeCheck, risk_manager = Depends(get_risk_m
     return response
 
 @app.post("/position-size", tags=["포지션"])
-async def calculate_position_size(
-    pair: str = Query(..., description="거래 페어 (예: BTC/USDT)"),
-    price: float = Query(..., description="현재 가격"),
-    risk_level: str = Query("normal", description="리스크 레벨 (low, normal, high)"),
-    risk_manager = Depends(get_risk_manager_dependency)
-):
-    """적절한 포지션 크기 계산"""
+async def calculate_position_size(pair: str, price: float, risk_level: str = "normal"):
+    """
+    적절한 포지션 크기 계산
+    
+    Args:
+        pair: 거래 페어 (예: BTC/USDT)
+        price: 현재 가격
+        risk_level: 리스크 레벨 (low, normal, high)
+    """
+    risk_manager = get_risk_manager_dependency()
     position_size = await risk_manager.calculate_position_size(pair, price, risk_level)
     
     return {
@@ -201,8 +250,9 @@ async def calculate_position_size(
     }
 
 # DEAD CODE: @app.get("/positions", tags=["포지션"])
-async def get_positions(risk_manager = Depends(get_risk_manager_dependency)):
+async def get_positions():
     """현재 포지션 정보 조회"""
+    risk_manager = get_risk_manager_dependency()
     positions = {}
     
     # Redis에서 포지션 정보 가져오기
@@ -211,14 +261,16 @@ async def get_positions(risk_manager = Depends(get_risk_manager_dependency)):
             # position: 키를 가진 모든 키 가져오기
             position_keys = await risk_manager.redis_client.keys("position:*")
             
-            for key in position_keys:
-                pair = key.split(":")[1]  # position:BTC/USDT에서 BTC/USDT 추출
-                position_data = await risk_manager.redis_client.get(key)
+            if position_keys:
+                # 한 번의 MGET 왕복으로 모든 포지션 데이터 조회
+                position_values = await risk_manager.redis_client.mget(position_keys)
                 
-                if position_data:
-                    position = json.loads(position_data)
-                    if position["amount"] > 0:  # 수량이 있는 포지션만 추가
-                        positions[pair] = position
+                # position:BTC/USDT에서 BTC/USDT 추출, 수량이 있는 포지션만 추가
+                positions = {
+                    key.split(":", 1)[1]: position
+                    for key, value in zip(position_keys, position_values)
+                    if value and (position := orjson.loads(value))["amount"] > 0
+                }
         except Exception as e:
             logger.error(f"포지션 정보 조회 실패: {e}")
     
@@ -228,8 +280,14 @@ async def get_positions(risk_manager = Depends(get_risk_manager_dependency)):
     }
 
 @app.get("/position/{pair}", tags=["포지션"])
-async def get_position(pair: str = Path(..., description="거래 페어 (예: BTC/USDT)"), risk_manager = Depends(get_risk_manager_dependency)):
-    """특정 페어의 포지션 정보 조회"""
+async def get_position(pair: str):
+    """
+    특정 페어의 포지션 정보 조회
+    
+    Args:
+        pair: 거래 페어 (예: BTC/USDT)
+    """
+    risk_manager = get_risk_manager_dependency()
     position = await risk_manager.get_position(pair)
     
     if position is None:
@@ -249,38 +307,43 @@ async def get_position(pair: str = Path(..., description="거래 페어 (예: BT
     }
 
 @app.post("/kill-switch/activate", tags=["킬 스위치"])
-async def activate_kill_switch(request: KillSwitchRequest, risk_manager = Depends(get_risk_manager_dependency)):
+async def activate_kill_switch(request: KillSwitchRequest):
     """킬 스위치 활성화"""
+    risk_manager = get_risk_manager_dependency()
     await risk_manager.activate_kill_switch(request.reason)
+    timestamp = datetime.now().isoformat()
     
     return {
         "success": True,
         "kill_switch_active": risk_manager.kill_switch_active,
         "reason": request.reason,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": timestamp
     }
 
 @app.post("/kill-switch/deactivate", tags=["킬 스위치"])
-async def deactivate_kill_switch(request: KillSwitchRequest, risk_manager = Depends(get_risk_manager_dependency)):
+async def deactivate_kill_switch(request: KillSwitchRequest):
     """킬 스위치 비활성화"""
+    risk_manager = get_risk_manager_dependency()
     risk_manager.kill_switch_active = False
+    timestamp = datetime.now().isoformat()
     
     # 리스크 이벤트 발행
     await risk_manager.publish_risk_event('KILL_SWITCH_DEACTIVATED', {
         'reason': request.reason,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': timestamp
     })
     
     return {
         "success": True,
         "kill_switch_active": risk_manager.kill_switch_active,
         "reason": request.reason,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": timestamp
     }
 
 @app.post("/circuit-breaker/check", tags=["서킷 브레이커"])
-async def check_circuit_breaker(request: CircuitBreakerCheck, risk_manager = Depends(get_risk_manager_dependency)):
+async def check_circuit_breaker(request: CircuitBreakerCheck):
     """서킷 브레이커 검사"""
+    risk_manager = get_risk_manager_dependency()
     result = await risk_manager.check_circuit_breaker(request.price_change)
     
     return {
@@ -291,122 +354,53 @@ async def check_circuit_breaker(request: CircuitBreakerCheck, risk_manager = Dep
     }
 
 # DEAD CODE: @app.post("/circuit-breaker/reset", tags=["서킷 브레이커"])
-async def reset_circuit_breaker(risk_manager = Depends(get_risk_manager_dependency)):
+async def reset_circuit_breaker():
     """서킷 브레이커 재설정"""
+    risk_manager = get_risk_manager_dependency()
     risk_manager.circuit_breaker_active = False
+    timestamp = datetime.now().isoformat()
     
     # 리스크 이벤트 발행
     await risk_manager.publish_risk_event('CIRCUIT_BREAKER_RESET', {
-        'timestamp': datetime.now().isoformat()
+        'timestamp': timestamp
     })
     
     return {
         "success": True,
         "circuit_breaker_active": risk_manager.circuit_breaker_active,
-        "timestamp": datetime.now().isoformat()
-    }
-    
-    # 드로다운 계산
-    current_drawdown = 0.0
-    if risk_manager.peak_balance > 0:
-        current_drawdown = 1 - (risk_manager.current_balance / risk_manager.peak_balance)
-    
-    return {
-        "kill_switch_active": risk_manager.kill_switch_active,
-        "circuit_breaker_active": risk_manager.circuit_breaker_active,
-        "peak_balance": risk_manager.peak_balance,
-        "current_balance": risk_manager.current_balance,
-        "current_drawdown": current_drawdown,
-        "daily_trade_count": daily_trade_count,
-        "max_drawdown": risk_manager.max_drawdown,
-        "per_trade_stop_loss": risk_manager.per_trade_stop_loss,
-        "risk_per_trade": risk_manager.risk_per_trade,
-        "daily_trade_limit": risk_manager.daily_trade_limit,
-        "circuit_breaker": risk_manager.circuit_breaker
+        "timestamp": timestamp
     }
 
-@app.post("/balance", tags=["잔액"])
-async def update_balance(
-    balance_update: BalanceUpdate,
-    risk_manager = Depends(get_risk_manager_dependency)
-):
-    """잔액 업데이트 및 드로다운 검사"""
-    result = await risk_manager.update_balance(balance_update.balance)
-    return {"success": result, "message": "잔액 업데이트됨"}
-
-# DEAD CODE: @app.post("/trade/check", tags=["거래"])
-async def check_trade(
-    trade_check: TradeCheck,
-    risk_manager = Depends(get_risk_manager_dependency)
-):
-    """거래 허용 여부 검사"""
-    result = await risk_manager.check_trade_allowed(
-        trade_check.pair,
-        trade_check.side,
-        trade_check.amount,
-        trade_check.price
-    )
-    return {"allowed": result}
-
 @app.post("/trade/position-size", tags=["거래"])
-async def calculate_position_size(
-    request: PositionSizeRequest,
-    risk_manager = Depends(get_risk_manager_dependency)
+async def calculate_trade_position_size(
+    request: PositionSizeRequest
 ):
     """포지션 크기 계산"""
+    risk_manager = get_risk_manager_dependency()
     position_size = await risk_manager.calculate_position_size(
-        request.account_balance,
         request.pair,
-        request.entry_price
+        request.entry_price,
+        account_balance=request.account_balance
     )
     return {"position_size": position_size}
 
 # DEAD CODE: @app.post("/trade/increment", tags=["거래"])
 async def increment_trade_count(
-    trade_check: TradeCheck,
-    risk_manager = Depends(get_risk_manager_dependency)
+    trade_check: TradeCheck
 ):
     """거래 수 증가"""
+    risk_manager = get_risk_manager_dependency()
     await risk_manager.increment_daily_trade_count(trade_check.pair)
-    
-    today_date = datetime.now().date().isoformat()
-    daily_trade_count = risk_manager.daily_trades.get(today_date, 0)
+    daily_trade_count = await risk_manager.get_daily_trade_count()
     
     return {"success": True, "daily_trade_count": daily_trade_count}
 
-@app.post("/circuit-breaker/check", tags=["서킷 브레이커"])
-async def check_circuit_breaker(
-    request: CircuitBreakerCheck,
-    risk_manager = Depends(get_risk_manager_dependency)
-):
-    """서킷 브레이커 검사"""
-    result = await risk_manager.check_circuit_breaker(request.price_change)
-    return {"allowed": result, "circuit_breaker_active": risk_manager.circuit_breaker_active}
-
-@app.post("/kill-switch/activate", tags=["킬 스위치"])
-async def activate_kill_switch(
-    request: KillSwitchRequest,
-    risk_manager = Depends(get_risk_manager_dependency)
-):
-    """킬 스위치 활성화"""
-    await risk_manager.activate_kill_switch(request.reason)
-    return {"success": True, "kill_switch_active": risk_manager.kill_switch_active}
-
-@app.post("/kill-switch/deactivate", tags=["킬 스위치"])
-async def deactivate_kill_switch(
-    request: KillSwitchRequest,
-    risk_manager = Depends(get_risk_manager_dependency)
-):
-    """킬 스위치 비활성화"""
-    await risk_manager.deactivate_kill_switch(request.reason)
-    return {"success": True, "kill_switch_active": risk_manager.kill_switch_active}
-
 # DEAD CODE: @app.post("/events/publish", tags=["이벤트"])
 async def publish_event(
-    event: RiskEvent,
-    risk_manager = Depends(get_risk_manager_dependency)
+    event: RiskEvent
 ):
     """리스크 이벤트 발행"""
+    risk_manager = get_risk_manager_dependency()
     await risk_manager.publish_risk_event(event.type, event.data)
     return {"success": True, "event": event}
 
@@ -449,6 +443,9 @@ async def shutdown_event():
 def main():
     """메인 함수"""
     import uvicorn
+    
+    # 킬 스위치/서킷 브레이커/잔고 상태가 프로세스별 RiskManager에 있으므로 단일 워커로 실행
+    # (다중 워커는 한 워커에서 활성화한 킬 스위치가 다른 워커에 적용되지 않음)
     uvicorn.run("src.risk_manager.api:app", host="0.0.0.0", port=8000, reload=True)
 
 if __name__ == "__main__":
@@ -6,21 +6,60 @@
 
 import logging
 import asyncio
-import json
+import orjson
 from typing import Dict, Any, Callable, List, Optional, Awaitable
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 채널 이름 상수 (decode_responses 설정에 따라 str 또는 bytes 로 수신됨)
+_CH_RISK = 'risk_events'
+_CH_ALERT = 'alerts'
+_CH_RISK_BYTES = _CH_RISK.encode()
+_CH_ALERT_BYTES = _CH_ALERT.encode()
+
+# 구독자별 이벤트 큐 최대 크기 (가득 차면 새 이벤트를 버림)
+_SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+async def _forward_risk_event(telegram_bot, data: Dict[str, Any]):
+    """리스크 이벤트를 텔레그램 봇에 전달"""
+    await telegram_bot.on_risk_event(data)
+
+
+async def _forward_alert(telegram_bot, data: Dict[str, Any]):
+    """알림 이벤트를 텔레그램 봇에 전달"""
+    level = data.get('level', 'info')
+    title = data.get('title', '')
+    message = data.get('message', '')
+    # send_message는 동기 HTTP 요청이므로 스레드 풀에서 실행하여 이벤트 루프 차단 방지
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, telegram_bot.send_message, f"*{title}*\n{message}", level)
+
+
+# 채널별 텔레그램 전달 함수 (str/bytes 채널 이름 모두 한 번의 dict 조회로 처리)
+_TELEGRAM_DISPATCH = {
+    _CH_RISK: _forward_risk_event,
+    _CH_RISK_BYTES: _forward_risk_event,
+    _CH_ALERT: _forward_alert,
+    _CH_ALERT_BYTES: _forward_alert,
+}
+
 class EventSubscriber:
     """리스크 이벤트 구독자 클래스"""
     
     def __init__(self):
         """이벤트 구독자 초기화"""
         self.subscribers = {}
+        # str/bytes 채널 이름 모두를 같은 구독자 큐 리스트에 매핑하는 조회 테이블
+        self._channel_queues = {}
+        # (채널, 콜백) 별 이벤트 큐와 워커 태스크
+        self._queues = {}
+        self._workers = {}
         self.running = False
         self.redis_client = None
         self.pubsub = None
+        self._telegram_bot_getter = None
     
     async def connect(self, redis_client):
         """Redis 연결 설정"""
@@ -28,14 +67,26 @@ class EventSubscriber:
         self.pubsub = self.redis_client.pubsub()
         
         # 리스크 이벤트 채널 구독
-        await self.pubsub.subscribe('risk_events')
-        await self.pubsub.subscribe('alerts')
+        await self.pubsub.subscribe(_CH_RISK)
+        await self.pubsub.subscribe(_CH_ALERT)
         
         logger.info("이벤트 구독자가 Redis에 연결되었습니다.")
         
+        # 텔레그램 봇 접근 함수는 한 번만 임포트 (순환 참조 문제를 피하기 위해 모듈 로드 시점이 아닌 연결 시점에 임포트)
+        if self._telegram_bot_getter is None:
+            try:
+                from src.notifications.telegram_bot import get_telegram_bot
+                self._telegram_bot_getter = get_telegram_bot
+            except ImportError as e:
+                logger.warning(f"텔레그램 봇 임포트 실패: {e}")
+        
         # 이벤트 처리 태스크 시작
         if not self.running:
             self.running = True
+            # 연결 전에 등록된 구독자의 워커 시작
+            for key, queue in self._queues.items():
+                if key not in self._workers:
+                    self._start_worker(key, queue)
             asyncio.create_task(self._process_events())
     
     async def _process_events(self):
@@ -52,36 +103,28 @@ class EventSubscriber:
                 if message:
                     try:
                         channel = message['channel']
-                        data = json.loads(message['data'])
+                        data = orjson.loads(message['data'])
                         
                         logger.debug(f"이벤트 수신: {channel} - {data}")
                         
-                        # 채널에 등록된 구독자들에게 이벤트 전달
-                        if channel in self.subscribers:
-                            for callback in self.subscribers[channel]:
+                        # 채널에 등록된 구독자 큐에 이벤트 전달 (콜백은 워커 태스크에서 실행)
+                        queues = self._channel_queues.get(channel)
+                        if queues:
+                            for queue in queues:
                                 try:
-                                    await callback(data)
-                                except Exception as e:
-                                    logger.error(f"구독자 콜백 실행 중 오류 발생: {e}")
+                                    queue.put_nowait(data)
+                                except asyncio.QueueFull:
+                                    logger.warning(f"구독자 큐가 가득 차 이벤트를 버립니다: {channel}")
                         
                         # 텔레그램 봇에 이벤트 전달
-                        try:
-                            # 순환 참조 문제를 피하기 위해 함수 내부에서 임포트
-                            from src.notifications.telegram_bot import get_telegram_bot
-                            
-                            telegram_bot = get_telegram_bot()
-                            if telegram_bot:
-                                if channel == b'risk_events':
-                                    await telegram_bot.on_risk_event(data)
-                                elif channel == b'alerts':
-                                    level = data.get('level', 'info')
-                                    title = data.get('title', '')
-                                    message = data.get('message', '')
-                                    telegram_bot.send_message(f"*{title}*\n{message}", level)
-                        except ImportError as e:
-                            logger.warning(f"텔레그램 봇 임포트 실패: {e}")
-                        except Exception as e:
-                            logger.error(f"텔레그램 봇 이벤트 전달 중 오류: {e}")
+                        forward = _TELEGRAM_DISPATCH.get(channel)
+                        if forward and self._telegram_bot_getter:
+                            try:
+                                telegram_bot = self._telegram_bot_getter()
+                                if telegram_bot:
+                                    await forward(telegram_bot, data)
+                            except Exception as e:
+                                logger.error(f"텔레그램 봇 이벤트 전달 중 오류: {e}")
                     except Exception as e:
                         logger.error(f"이벤트 처리 중 오류 발생: {e}")
                 
@@ -91,6 +134,25 @@ class EventSubscriber:
         except Exception as e:
             logger.error(f"이벤트 처리 루프 오류: {e}")
     
+    def _start_worker(self, key, queue: asyncio.Queue):
+        """구독자 워커 태스크 시작"""
+        self._workers[key] = asyncio.create_task(self._run_subscriber(key[1], queue))
+    
+    async def _run_subscriber(self, callback: Callable[[Dict[str, Any]], Awaitable[None]], queue: asyncio.Queue):
+        """
+        구독자 워커 루프
+        
+        느린 콜백이 Redis 메시지 수신을 지연시키지 않도록 큐에서 이벤트를 꺼내 콜백을 실행합니다.
+        """
+        while True:
+            data = await queue.get()
+            try:
+                await callback(data)
+            except Exception as e:
+                logger.error(f"구독자 콜백 실행 중 오류 발생: {e}")
+            finally:
+                queue.task_done()
+    
     def subscribe(self, channel: str, callback: Callable[[Dict[str, Any]], Awaitable[None]]):
         """
         이벤트 채널 구독
@@ -101,8 +163,26 @@ class EventSubscriber:
         """
         if channel not in self.subscribers:
             self.subscribers[channel] = []
+            # 같은 리스트 객체를 공유하므로 한쪽만 갱신하면 됨
+            queues = []
+            self._channel_queues[channel] = queues
+            self._channel_queues[channel.encode()] = queues
+        
+        key = (channel, callback)
+        if key in self._queues:
+            logger.info(f"채널 '{channel}'에 이미 등록된 구독자입니다")
+            return
         
         self.subscribers[channel].append(callback)
+        
+        queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        self._queues[key] = queue
+        self._channel_queues[channel].append(queue)
+        
+        # 연결 전이면 connect()에서 워커 시작
+        if self.running:
+            self._start_worker(key, queue)
+        
         logger.info(f"채널 '{channel}'에 구독자 추가됨")
     
     def unsubscribe(self, channel: str, callback: Callable[[Dict[str, Any]], Awaitable[None]]):
@@ -115,12 +195,25 @@ class EventSubscriber:
         """
         if channel in self.subscribers and callback in self.subscribers[channel]:
             self.subscribers[channel].remove(callback)
+            
+            key = (channel, callback)
+            queue = self._queues.pop(key, None)
+            if queue is not None:
+                self._channel_queues[channel].remove(queue)
+            worker = self._workers.pop(key, None)
+            if worker is not None:
+                worker.cancel()
+            
             logger.info(f"채널 '{channel}'에서 구독자 제거됨")
     
     async def close(self):
         """리소스 정리"""
         self.running = False
         
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+        
         if self.pubsub:
             await self.pubsub.unsubscribe()
             self.pubsub = None
@@ -3,16 +3,20 @@
 
 이 모듈은 거래 시스템의 리스크를 관리하는 기능을 제공합니다.
 글로벌 드로다운 보호, 거래별 손절, 포지션 크기 조정 등의 기능을 포함합니다.
+
+uvloop가 설치되어 있으면 모듈 로드 시 기본 이벤트 루프 정책을 uvloop로 교체합니다.
+이미 실행 중인 루프에는 영향이 없으므로 애플리케이션 진입점에서 루프 생성 전에 임포트해야 합니다.
 """
 
 import logging
-import json
 import time
 import asyncio
 from typing import Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime, timedelta, date
 import uuid
+from contextvars import ContextVar, Token
 
+import orjson
 import redis
 from redis.asyncio import Redis
 
@@ -21,9 +25,89 @@ from src.database.models import Order, OrderStatus, OrderSide
 
 logger = logging.getLogger(__name__)
 
+# 선택 의존성: uvloop 이벤트 루프 (Redis pub/sub 비동기 I/O 처리량 향상)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Redis 파이프라인 배치 설정
+_PIPELINE_BATCH_WINDOW = 0.005  # 배치 수집 대기 시간 (5ms)
+_PIPELINE_MAX_BATCH = 100  # 한 번에 전송할 최대 명령 수
+
+# 프로세스 내 포지션 캐시 유효 시간 (초)
+_POSITION_CACHE_TTL = 0.5
+
+# 드로다운 이력 샘플링 (변화량이 이 값 미만이고 간격이 이 시간 미만이면 기록 생략)
+_DRAWDOWN_SAMPLE_DELTA = 0.001
+_DRAWDOWN_SAMPLE_INTERVAL = 5.0  # 초
+
+# 리스크 레벨별 포지션 크기 조정 계수
+_RISK_MULTIPLIERS = {
+    'low': 0.5,      # 리스크 레벨 낮음: 기본 리스크의 50%
+    'normal': 1.0,   # 리스크 레벨 보통: 기본 리스크 적용
+    'high': 1.5      # 리스크 레벨 높음: 기본 리스크의 150%
+}
+
+# 전략 통계가 설정되지 않은 페어의 기본값
+_DEFAULT_STRATEGY_STATS = {
+    'win_rate': 0.55,         # 기본 승률 55%
+    'win_loss_ratio': 1.5,    # 기본 손익비 1.5
+    'avg_profit': 0.03,       # 평균 이익 3%
+    'avg_loss': 0.02,         # 평균 손실 2%
+    'max_position_size': 0.1  # 최대 포지션 크기 (잔액의 10%)
+}
+
+# 기본 이익 실현 단계
+_DEFAULT_TAKE_PROFIT_LEVELS = [
+    {'threshold': 3.0, 'percentage': 0.25},  # 3% 이익 시 25% 매도
+    {'threshold': 5.0, 'percentage': 0.5},   # 5% 이익 시 50% 매도
+    {'threshold': 10.0, 'percentage': 0.75},  # 10% 이익 시 75% 매도
+    {'threshold': 15.0, 'percentage': 1.0}    # 15% 이익 시 전체 매도
+]
+
+# 일일 거래 수 HASH(trades:{날짜})에서 전체 거래 수를 저장하는 필드 (나머지 필드는 페어별 거래 수)
+_TRADES_TOTAL_FIELD = '_total'
+
+# 배치/비동기 전송 대신 즉시 발행하고 응답까지 확인하는 리스크 이벤트 (킬 스위치 상태 변경)
+_CRITICAL_EVENT_TYPES = frozenset({'KILL_SWITCH_ACTIVATED', 'KILL_SWITCH_DEACTIVATED'})
+
+# 거래 차단 게이트 비트
+_GATE_KILL_SWITCH = 1
+_GATE_CIRCUIT_BREAKER = 2
+
+def _dumps(obj: Any) -> bytes:
+    """Redis 전송용 JSON 직렬화 (orjson, bytes 반환)"""
+    return orjson.dumps(obj)
+
+# 초 단위로 캐싱한 ISO 타임스탬프 [epoch 초, ISO 문자열]
+_TS_CACHE = [0, '']
+
+def _now_iso() -> str:
+    """현재 시각의 ISO 문자열 (이벤트 타임스탬프용, 1초 단위로 갱신)"""
+    t = int(time.time())
+    c = _TS_CACHE
+    if c[0] != t:
+        c[0] = t
+        c[1] = datetime.fromtimestamp(t).isoformat()
+    return c[1]
+
 class RiskManager:
     """리스크 관리 클래스"""
     
+    # 인스턴스 __dict__ 제거로 메모리 사용량 감소 및 속성 접근 속도 향상
+    __slots__ = (
+        'config', 'risk_config', 'max_drawdown', 'per_trade_stop_loss', 'risk_per_trade',
+        'daily_trade_limit', 'circuit_breaker', '_warning_threshold', '_stop_loss_pct_neg',
+        '_take_profit_levels_desc', '_auto_stop_loss', '_auto_take_profit',
+        '_default_pair_params', '_pair_cache', '_gate', 'peak_balance', '_inv_peak',
+        'current_balance', 'current_drawdown', '_last_recorded_dd', '_last_dd_ts', '_dd_history_key',
+        '_daily_trade_count', '_today', '_day_end',
+        'redis_config', 'redis_client', 'pubsub', '_event_task', '_event_handlers', '_pub_queue', '_flusher_task',
+        'db_manager', '_position_cache'
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         리스크 관리자 초기화
@@ -41,24 +125,118 @@ class RiskManager:
         self.daily_trade_limit = self.risk_config.get('daily_trade_limit', 60)  # 일일 거래 제한 (60건)
         self.circuit_breaker = self.risk_config.get('circuit_breaker', 0.05)  # 서킷 브레이커 (5%)
         
+        # 미리 계산한 임계값
+        self._warning_threshold = self.max_drawdown * 0.8  # 드로다운 경고 임계값 (최대 허용의 80%)
+        self._stop_loss_pct_neg = -self.per_trade_stop_loss * 100  # 손절 임계 손익률 (%)
+        
+        # 손절/이익 실현 시 자동 매도 허용 여부
+        self._auto_stop_loss = bool(self.risk_config.get('auto_stop_loss', True))
+        self._auto_take_profit = bool(self.risk_config.get('auto_take_profit', False))
+        
+        # 이익 실현 단계 (임계값 내림차순, 가장 높은 임계값부터 검사)
+        self._take_profit_levels_desc = sorted(
+            self.risk_config.get('take_profit_levels', _DEFAULT_TAKE_PROFIT_LEVELS),
+            key=lambda level: -level['threshold']
+        )
+        
+        # 페어별 포지션 크기 계산 파라미터 (half_kelly, max_position_size, min_trade_amount, max_trade_amount)
+        strategy_stats = self.risk_config.get('strategy_stats', {})
+        min_trade_amounts = self.risk_config.get('min_trade_amount', {})
+        max_trade_amounts = self.risk_config.get('max_trade_amount', {})
+        self._default_pair_params = self._build_pair_params(_DEFAULT_STRATEGY_STATS, 0.001, float('inf'))
+        self._pair_cache = {
+            pair: self._build_pair_params(
+                strategy_stats.get(pair, _DEFAULT_STRATEGY_STATS),
+                min_trade_amounts.get(pair, 0.001),
+                max_trade_amounts.get(pair, float('inf'))
+            )
+            for pair in {*strategy_stats, *min_trade_amounts, *max_trade_amounts}
+        }
+        
         # 리스크 상태
-        self.kill_switch_active = False
-        self.circuit_breaker_active = False
+        self._gate = 0  # 킬 스위치/서킷 브레이커 활성화 비트 (0이면 거래 가능)
         self.peak_balance = 0.0
+        self._inv_peak = 0.0  # 1 / peak_balance
         self.current_balance = 0.0
-        self.daily_trades = {}  # 일별 거래 수 추적
+        self.current_drawdown = 0.0  # 잔액 갱신 시에만 재계산되는 현재 드로다운
+        
+        # 드로다운 이력 샘플링 상태
+        self._last_recorded_dd = -1.0
+        self._last_dd_ts = 0.0
+        self._dd_history_key = ''  # 만료 시간을 이미 설정한 당일 이력 키
+        
+        # 일일 거래 수 추적 (Redis 카운터, 연결이 없거나 실패하면 로컬 카운터 사용)
+        self._daily_trade_count = 0
+        self._today = ''
+        self._day_end = 0.0  # 다음 자정 타임스탬프 (날짜 문자열 갱신 시점)
         
         # Redis 연결 설정
         self.redis_config = config.get('redis', {})
         self.redis_client = None
         self.pubsub = None
+        self._event_task = None
+        
+        # 이벤트 유형별 처리 함수 (메시지마다 if/elif 비교 대신 dict 조회 한 번)
+        self._event_handlers = {
+            'MAX_DRAWDOWN_EXCEEDED': self._handle_max_drawdown_event,
+            'CIRCUIT_BREAKER_TRIGGERED': self._handle_circuit_breaker_event,
+            'KILL_SWITCH_ACTIVATED': self._handle_kill_switch_event,
+            'DAILY_TRADE_LIMIT_REACHED': self._handle_trade_limit_event,
+        }
+        
+        # Redis 쓰기 명령 배치 큐 (publish/lpush/expire를 파이프라인으로 묶어 전송)
+        self._pub_queue = None
+        self._flusher_task = None
         
         # 데이터베이스 관리자
         self.db_manager = get_db_manager()
         
+        # 페어별 포지션 캐시: pair -> (만료 시각(monotonic), 포지션)
+        self._position_cache = {}
+        
         logger.info(f"리스크 관리자 초기화됨: max_drawdown={self.max_drawdown}, stop_loss={self.per_trade_stop_loss}, "
                    f"risk_per_trade={self.risk_per_trade}, daily_trade_limit={self.daily_trade_limit}")
     
+    @staticmethod
+    def _build_pair_params(strategy: Dict[str, Any], min_trade_amount: float,
+                           max_trade_amount: float) -> Tuple[float, float, float, float]:
+        """
+        페어별 포지션 크기 계산 파라미터 생성
+        
+        Kelly = W - (1-W)/R (W: 승률, R: 손익비), 너무 공격적이므로 절반만 사용 (Half Kelly)
+        """
+        win_rate = strategy.get('win_rate', 0.55)
+        win_loss_ratio = strategy.get('win_loss_ratio', 1.5)
+        max_position_size = strategy.get('max_position_size', 0.1)
+        
+        kelly = win_rate - ((1 - win_rate) / win_loss_ratio)
+        
+        return (kelly * 0.5, max_position_size, min_trade_amount, max_trade_amount)
+    
+    @property
+    def kill_switch_active(self) -> bool:
+        """킬 스위치 활성화 여부"""
+        return bool(self._gate & _GATE_KILL_SWITCH)
+    
+    @kill_switch_active.setter
+    def kill_switch_active(self, active: bool):
+        if active:
+            self._gate |= _GATE_KILL_SWITCH
+        else:
+            self._gate &= ~_GATE_KILL_SWITCH
+    
+    @property
+    def circuit_breaker_active(self) -> bool:
+        """서킷 브레이커 활성화 여부"""
+        return bool(self._gate & _GATE_CIRCUIT_BREAKER)
+    
+    @circuit_breaker_active.setter
+    def circuit_breaker_active(self, active: bool):
+        if active:
+            self._gate |= _GATE_CIRCUIT_BREAKER
+        else:
+            self._gate &= ~_GATE_CIRCUIT_BREAKER
+    
     async def connect_redis(self):
         """Redis 연결 설정"""
         try:
@@ -75,7 +253,11 @@ class RiskManager:
             logger.info(f"Redis 연결 설정됨: {host}:{port}/{db}")
             
             # 리스크 이벤트 처리 태스크 시작
-            asyncio.create_task(self._process_risk_events())
+            self._event_task = asyncio.create_task(self._process_risk_events())
+            
+            # 파이프라인 배치 전송 태스크 시작
+            self._pub_queue = asyncio.Queue()
+            self._flusher_task = asyncio.create_task(self._pipeline_flusher())
             
             return True
         except Exception as e:
@@ -91,29 +273,24 @@ class RiskManager:
         logger.info("리스크 이벤트 처리 루프 시작")
         
         try:
-            while True:
-                message = await self.pubsub.get_message(ignore_subscribe_messages=True)
-                if message:
-                    try:
-                        channel = message['channel']
-                        data = json.loads(message['data'])
-                        
-                        logger.info(f"리스크 이벤트 수신: {data}")
-                        
-                        # 이벤트 유형에 따른 처리
-                        event_type = data.get('type')
-                        if event_type == 'MAX_DRAWDOWN_EXCEEDED':
-                            await self._handle_max_drawdown_event(data)
-                        elif event_type == 'CIRCUIT_BREAKER_TRIGGERED':
-                            await self._handle_circuit_breaker_event(data)
-                        elif event_type == 'KILL_SWITCH_ACTIVATED':
-                            await self._handle_kill_switch_event(data)
-                        elif event_type == 'DAILY_TRADE_LIMIT_REACHED':
-                            await self._handle_trade_limit_event(data)
-                    except Exception as e:
-                        logger.error(f"리스크 이벤트 처리 중 오류 발생: {e}")
+            handlers = self._event_handlers
+            
+            # 메시지가 도착할 때만 깨어나는 이벤트 기반 수신 (폴링 대기 없음)
+            async for message in self.pubsub.listen():
+                if message['type'] != 'message':
+                    continue
                 
-                await asyncio.sleep(0.1)  # CPU 사용량 감소를 위한 짧은 대기
+                try:
+                    data = orjson.loads(message['data'])
+                    
+                    logger.info(f"리스크 이벤트 수신: {data}")
+                    
+                    # 이벤트 유형에 따른 처리
+                    handler = handlers.get(data.get('type'))
+                    if handler:
+                        await handler(data)
+                except Exception as e:
+                    logger.error(f"리스크 이벤트 처리 중 오류 발생: {e}")
         except asyncio.CancelledError:
             logger.info("리스크 이벤트 처리 루프 종료")
         except Exception as e:
@@ -163,19 +340,80 @@ class RiskManager:
         # 알림 전송
         await self._send_alert("서킷 브레이커 재설정", "거래가 재개됩니다")
     
+    async def _enqueue_redis_op(self, op: str, *args):
+        """
+        Redis 쓰기 명령 예약
+        
+        connect_redis() 이후에는 큐에 넣어 배치 전송 태스크가 파이프라인으로 묶어 전송합니다 (응답 대기 없음).
+        배치 전송 태스크가 없을 때 (connect_redis() 없이 redis_client를 설정한 경우, close() 이후)는
+        명령을 즉시 실행하고 응답을 기다립니다.
+        
+        Args:
+            op: Redis 명령 이름 (publish, lpush, expire)
+            *args: 명령 인자
+        """
+        if self._pub_queue is not None:
+            self._pub_queue.put_nowait((op, args))
+        else:
+            await getattr(self.redis_client, op)(*args)
+    
+    async def _flush_redis_ops(self, batch: List[Tuple[str, tuple]]):
+        """예약된 Redis 명령을 하나의 파이프라인으로 전송"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for op, args in batch:
+                getattr(pipe, op)(*args)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis 파이프라인 전송 실패 ({len(batch)}건): {e}")
+    
+    async def _pipeline_flusher(self):
+        """
+        Redis 명령 배치 전송 루프
+        
+        큐에서 None을 꺼내면 그 전까지 쌓인 명령을 모두 전송한 뒤 종료합니다.
+        """
+        queue = self._pub_queue
+        
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                batch = [item]
+                stop = False
+                
+                # 배치 윈도우 동안 쌓인 명령을 함께 전송
+                await asyncio.sleep(_PIPELINE_BATCH_WINDOW)
+                while len(batch) < _PIPELINE_MAX_BATCH:
+                    try:
+                        item = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                
+                await self._flush_redis_ops(batch)
+                if stop:
+                    return
+        except asyncio.CancelledError:
+            logger.info("Redis 파이프라인 배치 전송 종료")
+    
     async def _send_alert(self, title: str, message: str):
         """알림 전송"""
         try:
             alert_data = {
                 'title': title,
                 'message': message,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _now_iso(),
                 'level': 'warning'
             }
             
             # Redis에 알림 발행
             if self.redis_client:
-                await self.redis_client.publish('alerts', json.dumps(alert_data))
+                await self._enqueue_redis_op('publish', 'alerts', _dumps(alert_data))
                 logger.info(f"알림 전송됨: {title}")
             else:
                 logger.warning(f"Redis 연결 없음, 알림 전송 실패: {title}")
@@ -197,12 +435,15 @@ class RiskManager:
             event_data = {
                 'type': event_type,
                 'data': data,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
             
-            # Redis에 이벤트 발행
+            # Redis에 이벤트 발행 (킬 스위치 이벤트는 즉시 발행, 나머지는 응답을 기다리지 않는 배치 전송)
             if self.redis_client:
-                await self.redis_client.publish('risk_events', json.dumps(event_data))
+                if event_type in _CRITICAL_EVENT_TYPES:
+                    await self.redis_client.publish('risk_events', _dumps(event_data))
+                else:
+                    await self._enqueue_redis_op('publish', 'risk_events', _dumps(event_data))
                 logger.info(f"리스크 이벤트 발행됨: {event_type}")
             else:
                 logger.warning(f"Redis 연결 없음, 리스크 이벤트 발행 실패: {event_type}")
@@ -228,11 +469,14 @@ class RiskManager:
         # 최고 잔액 업데이트
         if current_balance > self.peak_balance:
             self.peak_balance = current_balance
+            self._inv_peak = 1.0 / current_balance
             logger.info(f"최고 잔액 갱신: {self.peak_balance:.2f}")
         
-        # 드로다운 계산
+        # 드로다운 계산 (조회 경로에서 재계산하지 않도록 캐싱)
+        self.current_drawdown = 0.0 if self.peak_balance <= 0 else 1 - current_balance * self._inv_peak
+        
         if self.peak_balance > 0:
-            drawdown = 1 - (current_balance / self.peak_balance)
+            drawdown = self.current_drawdown
             drawdown_percent = drawdown * 100
             
             # 드로다운 기록 저장
@@ -273,8 +517,7 @@ class RiskManager:
                 return False
             
             # 경고 임계값 검사 (80% 수준에서 경고)
-            warning_threshold = self.max_drawdown * 0.8
-            if drawdown > warning_threshold:
+            if drawdown > self._warning_threshold:
                 logger.warning(f"드로다운 경고 임계값 접근: {drawdown_percent:.2f}% (최대 허용의 {(drawdown/self.max_drawdown)*100:.1f}%)")
                 
                 # 경고 알림 전송
@@ -286,41 +529,32 @@ class RiskManager:
         return True
         
     async def _record_drawdown_history(self, drawdown: float):
-        """드로다운 이력 기록"""
+        """드로다운 이력 기록 (변화가 작고 최근에 기록했다면 생략)"""
+        now = time.monotonic()
+        if abs(drawdown - self._last_recorded_dd) < _DRAWDOWN_SAMPLE_DELTA and now - self._last_dd_ts < _DRAWDOWN_SAMPLE_INTERVAL:
+            return
+        
         try:
             # Redis에 드로다운 이력 기록
             if self.redis_client:
-                key = f"drawdown:history:{datetime.now().strftime('%Y-%m-%d')}"
-                await self.redis_client.lpush(key, json.dumps({
-                    'timestamp': datetime.now().isoformat(),
+                timestamp = datetime.now()
+                key = f"drawdown:history:{timestamp.strftime('%Y-%m-%d')}"
+                await self._enqueue_redis_op('lpush', key, _dumps({
+                    'timestamp': timestamp.isoformat(),
                     'drawdown': drawdown,
                     'current_balance': self.current_balance,
                     'peak_balance': self.peak_balance
                 }))
                 
-                # 기록 유지 기간 설정 (30일)
-                await self.redis_client.expire(key, 60 * 60 * 24 * 30)
+                # 기록 유지 기간 설정 (30일, 날짜별 키마다 한 번만)
+                if key != self._dd_history_key:
+                    await self._enqueue_redis_op('expire', key, 60 * 60 * 24 * 30)
+                    self._dd_history_key = key
+                
+                self._last_recorded_dd = drawdown
+                self._last_dd_ts = now
         except Exception as e:
             logger.error(f"드로다운 이력 기록 실패: {e}")
-        
-        # 드로다운 계산
-        if self.peak_balance > 0:
-            drawdown = 1 - (current_balance / self.peak_balance)
-            
-            # 최대 드로다운 초과 검사
-            if drawdown > self.max_drawdown:
-                logger.warning(f"최대 드로다운 초과: {drawdown:.4f} > {self.max_drawdown:.4f}")
-                
-                # 리스크 이벤트 발행
-                await self.publish_risk_event('MAX_DRAWDOWN_EXCEEDED', {
-                    'drawdown': drawdown,
-                    'current_balance': current_balance,
-                    'peak_balance': self.peak_balance
-                })
-                
-                return False
-        
-        return True
     
     async def check_global_drawdown(self) -> bool:
         """
@@ -329,20 +563,17 @@ class RiskManager:
         Returns:
             bool: 드로다운 제한 내이면 True, 초과하면 False
         """
-        if self.kill_switch_active:
-            logger.warning("킬 스위치가 활성화되어 있어 거래가 중지됩니다")
+        if self._gate:
+            if self._gate & _GATE_KILL_SWITCH:
+                logger.warning("킬 스위치가 활성화되어 있어 거래가 중지됩니다")
+            else:
+                logger.warning("서킷 브레이커가 활성화되어 있어 거래가 중지됩니다")
             return False
         
-        if self.circuit_breaker_active:
-            logger.warning("서킷 브레이커가 활성화되어 있어 거래가 중지됩니다")
+        if self.current_drawdown > self.max_drawdown:
+            logger.warning(f"최대 드로다운 초과: {self.current_drawdown:.4f} > {self.max_drawdown:.4f}")
             return False
         
-        if self.peak_balance > 0:
-            drawdown = 1 - (self.current_balance / self.peak_balance)
-            if drawdown > self.max_drawdown:
-                logger.warning(f"최대 드로다운 초과: {drawdown:.4f} > {self.max_drawdown:.4f}")
-                return False
-        
         return True
     
     async def check_circuit_breaker(self, price_change: float) -> bool:
@@ -370,6 +601,51 @@ class RiskManager:
         
         return True
     
+    def _get_today(self) -> str:
+        """오늘 날짜 문자열 (날짜가 바뀔 때만 재계산)"""
+        if time.time() >= self._day_end:
+            today = date.today()
+            self._today = today.isoformat()
+            self._day_end = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+            self._daily_trade_count = 0
+        
+        return self._today
+    
+    async def get_daily_trade_count(self) -> int:
+        """
+        오늘 거래 수 조회
+        
+        Returns:
+            int: 오늘 거래 수
+        """
+        today = self._get_today()
+        
+        if self.redis_client:
+            try:
+                count = await self.redis_client.hget(f"trades:{today}", _TRADES_TOTAL_FIELD)
+                return int(count or 0)
+            except Exception as e:
+                logger.error(f"일일 거래 수 조회 실패: {e}")
+        
+        return self._daily_trade_count
+    
+    async def get_daily_trade_counts_by_pair(self) -> Dict[str, int]:
+        """
+        오늘 페어별 거래 수 조회 (HGETALL 한 번)
+        
+        Returns:
+            Dict[str, int]: 페어별 거래 수
+        """
+        if not self.redis_client:
+            return {}
+        
+        try:
+            counts = await self.redis_client.hgetall(f"trades:{self._get_today()}")
+            return {pair: int(count) for pair, count in counts.items() if pair != _TRADES_TOTAL_FIELD}
+        except Exception as e:
+            logger.error(f"페어별 일일 거래 수 조회 실패: {e}")
+            return {}
+    
     async def check_daily_trade_limit(self, pair: str) -> bool:
         """
         일일 거래 제한 검사
@@ -380,21 +656,18 @@ class RiskManager:
         Returns:
             bool: 거래 제한 내이면 True, 초과하면 False
         """
-        today = date.today().isoformat()
-        
         # 오늘 거래 수 가져오기
-        if today not in self.daily_trades:
-            self.daily_trades = {today: 0}  # 새 날짜로 초기화
+        trade_count = await self.get_daily_trade_count()
         
         # 거래 제한 검사
-        if self.daily_trades[today] >= self.daily_trade_limit:
-            logger.warning(f"일일 거래 제한 초과: {self.daily_trades[today]} >= {self.daily_trade_limit}")
+        if trade_count >= self.daily_trade_limit:
+            logger.warning(f"일일 거래 제한 초과: {trade_count} >= {self.daily_trade_limit}")
             
             # 리스크 이벤트 발행
             await self.publish_risk_event('DAILY_TRADE_LIMIT_REACHED', {
-                'trade_count': self.daily_trades[today],
+                'trade_count': trade_count,
                 'limit': self.daily_trade_limit,
-                'date': today
+                'date': self._today
             })
             
             return False
@@ -408,124 +681,72 @@ class RiskManager:
         Args:
             pair: 거래 페어
         """
-        today = date.today().isoformat()
-        
-        # 오늘 거래 수 가져오기
-        if today not in self.daily_trades:
-            self.daily_trades = {today: 0}  # 새 날짜로 초기화
+        today = self._get_today()
         
-        # 거래 수 증가
-        self.daily_trades[today] += 1
-        logger.info(f"일일 거래 수 증가: {pair}, 오늘 총 {self.daily_trades[today]} 건")
-    
-    async def calculate_position_size(self, account_balance: float, pair: str, entry_price: float) -> float:
-        """
-        포지션 크기 계산 (RISK_FIXED 모드)
-        
-        Args:
-            account_balance: 계정 잔액
-            pair: 거래 페어
-            entry_price: 진입 가격
-            
-        Returns:
-            float: 포지션 크기 (수량)
-        """
-        # 리스크 금액 계산 (계정 잔액의 2%)
-        risk_amount = account_balance * self.risk_per_trade
-        
-        # 손절 가격 계산 (진입 가격의 3.5% 하락)
-        stop_loss_price = entry_price * (1 - self.per_trade_stop_loss)
-        
-        # 손실 금액 계산
-        price_difference = entry_price - stop_loss_price
-        
-        # 포지션 크기 계산
-        if price_difference > 0:
-            position_size = risk_amount / price_difference
-        else:
-            position_size = 0
-            logger.warning(f"포지션 크기 계산 오류: 가격 차이가 0 이하입니다 ({price_difference})")
+        # 로컬 카운터 증가 (Redis 장애 시 사용)
+        self._daily_trade_count += 1
+        trade_count = self._daily_trade_count
         
-        logger.info(f"포지션 크기 계산: {pair}, 잔액={account_balance}, 리스크={risk_amount}, "
-                   f"진입가={entry_price}, 손절가={stop_loss_price}, 포지션={position_size}")
+        # Redis 카운터 증가 (날짜별 HASH 하나에 전체/페어별 거래 수를 함께 저장)
+        if self.redis_client:
+            try:
+                key = f"trades:{today}"
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.hincrby(key, _TRADES_TOTAL_FIELD, 1)
+                pipe.hincrby(key, pair, 1)
+                trade_count, _ = await pipe.execute()
+                if trade_count == 1:
+                    await self.redis_client.expire(key, 60 * 60 * 24 * 2)  # 2일 후 만료
+            except Exception as e:
+                logger.error(f"일일 거래 수 증가 실패: {e}")
         
-        return position_size
+        logger.info(f"일일 거래 수 증가: {pair}, 오늘 총 {trade_count} 건")
     
-    async def calculate_position_size(self, pair: str, price: float, risk_level: str = 'normal') -> float:
+    async def calculate_position_size(self, pair: str, price: float, risk_level: str = 'normal',
+                                      account_balance: Optional[float] = None) -> float:
         """
-        적절한 포지션 크기 계산
+        적절한 포지션 크기 계산 (Half Kelly 기반)
         
         Args:
             pair: 거래 페어
             price: 현재 가격
             risk_level: 리스크 레벨 ('low', 'normal', 'high')
+            account_balance: 계정 잔액 (선택 사항, 없으면 현재 잔액 사용)
             
         Returns:
             float: 계산된 포지션 크기 (거래량)
         """
         try:
-            # 리스크 레벨에 따른 조정 계수
-            risk_multipliers = {
-                'low': 0.5,      # 리스크 레벨 낮음: 기본 리스크의 50%
-                'normal': 1.0,   # 리스크 레벨 보통: 기본 리스크 적용
-                'high': 1.5      # 리스크 레벨 높음: 기본 리스크의 150%
-            }
-            
-            # 기본 리스크 레벨이 없으면 'normal' 사용
-            multiplier = risk_multipliers.get(risk_level, 1.0)
+            # 리스크 레벨에 따른 조정 계수 (기본 리스크 레벨이 없으면 'normal' 사용)
+            multiplier = _RISK_MULTIPLIERS.get(risk_level, 1.0)
             
             # 현재 잔액
-            balance = self.current_balance
+            balance = self.current_balance if account_balance is None else account_balance
             
             # 잔액이 없으면 기본값 사용
             if balance <= 0:
                 logger.warning(f"잔액이 없어 포지션 크기 계산 불가능: {balance}")
                 return 0.0
             
-            # Kelly Criterion 기반 포지션 크기 계산
-            # Kelly = W - (1-W)/R where W is win rate and R is win/loss ratio
-            
-            # 전략별 승률 및 손익비 가져오기
-            strategy = self.risk_config.get('strategy_stats', {}).get(pair, {
-                'win_rate': 0.55,         # 기본 승률 55%
-                'win_loss_ratio': 1.5,    # 기본 손익비 1.5
-                'avg_profit': 0.03,       # 평균 이익 3%
-                'avg_loss': 0.02,         # 평균 손실 2%
-                'max_position_size': 0.1  # 최대 포지션 크기 (잔액의 10%)
-            })
-            
-            win_rate = strategy.get('win_rate', 0.55)
-            win_loss_ratio = strategy.get('win_loss_ratio', 1.5)
-            max_position_size = strategy.get('max_position_size', 0.1)
-            
-            # Kelly 계수 계산
-            kelly = win_rate - ((1 - win_rate) / win_loss_ratio)
+            # 페어별로 미리 계산한 Half Kelly 및 거래량 제한
+            half_kelly, max_position_size, min_trade_amount, max_trade_amount = self._pair_cache.get(
+                pair, self._default_pair_params
+            )
             
             # Kelly가 음수면 거래하지 않음
-            if kelly <= 0:
-                logger.warning(f"Kelly 계수가 음수여서 거래 불가: {kelly}")
+            if half_kelly <= 0:
+                logger.warning(f"Kelly 계수가 음수여서 거래 불가: {half_kelly * 2}")
                 return 0.0
             
-            # Kelly는 일반적으로 너무 공격적이므로 절반만 사용 (Half Kelly)
-            kelly = kelly * 0.5
-            
-            # 리스크 레벨에 따라 조정
-            adjusted_kelly = kelly * multiplier
-            
-            # 전체 잔액에 대한 비율로 계산
-            position_size_ratio = min(adjusted_kelly, max_position_size)
+            # 리스크 레벨에 따라 조정한 뒤 전체 잔액에 대한 비율로 계산
+            position_size_ratio = min(half_kelly * multiplier, max_position_size)
             
             # 실제 포지션 크기 계산 (가격 고려)
-            position_size_in_base = balance * position_size_ratio
-            position_size = position_size_in_base / price
+            position_size = balance * position_size_ratio / price
             
-            # 최소 거래량 적용
-            min_trade_amount = self.risk_config.get('min_trade_amount', {}).get(pair, 0.001)
+            # 최소/최대 거래량 적용
             if position_size < min_trade_amount:
                 position_size = min_trade_amount
-            
-            # 최대 거래량 적용
-            max_trade_amount = self.risk_config.get('max_trade_amount', {}).get(pair, float('inf'))
             if position_size > max_trade_amount:
                 position_size = max_trade_amount
             
@@ -549,14 +770,10 @@ class RiskManager:
         Returns:
             bool: 거래 허용되면 True, 그렇지 않으면 False
         """
-        # 킬 스위치 검사
-        if self.kill_switch_active:
-            logger.warning(f"거래 거부됨 (킬 스위치 활성화): {pair} {side} {amount}")
-            return False
-        
-        # 서킷 브레이커 검사
-        if self.circuit_breaker_active:
-            logger.warning(f"거래 거부됨 (서킷 브레이커 활성화): {pair} {side} {amount}")
+        # 킬 스위치/서킷 브레이커 검사 (단일 비트마스크 비교)
+        if self._gate:
+            reason = "킬 스위치 활성화" if self._gate & _GATE_KILL_SWITCH else "서킷 브레이커 활성화"
+            logger.warning(f"거래 거부됨 ({reason}): {pair} {side} {amount}")
             return False
         
         # 글로벌 드로다운 검사
@@ -582,7 +799,7 @@ class RiskManager:
                     profit_percent = (price / avg_buy_price - 1) * 100
                     
                     # 손절 검사
-                    stop_loss_threshold = -self.per_trade_stop_loss * 100
+                    stop_loss_threshold = self._stop_loss_pct_neg
                     if profit_percent < stop_loss_threshold:
                         logger.warning(f"손절 발동: {pair}, 손익률: {profit_percent:.2f}%, 임계값: {stop_loss_threshold:.2f}%")
                         
@@ -602,22 +819,14 @@ class RiskManager:
                         )
                         
                         # 손절 발동 시 자동 전체 매도 실행 여부 검사
-                        if self.risk_config.get('auto_stop_loss', True):
+                        if self._auto_stop_loss:
                             logger.info(f"자동 손절 매도 허용: {pair}")
                             return True
                         else:
                             logger.info(f"자동 손절 비활성화됨, 수동 매도 필요: {pair}")
                     
-                    # 이익 실현 검사
-                    take_profit_levels = self.risk_config.get('take_profit_levels', [
-                        {'threshold': 3.0, 'percentage': 0.25},  # 3% 이익 시 25% 매도
-                        {'threshold': 5.0, 'percentage': 0.5},   # 5% 이익 시 50% 매도
-                        {'threshold': 10.0, 'percentage': 0.75},  # 10% 이익 시 75% 매도
-                        {'threshold': 15.0, 'percentage': 1.0}    # 15% 이익 시 전체 매도
-                    ])
-                    
-                    # 이익 실현 검사
-                    for level in take_profit_levels:
+                    # 이익 실현 검사 (내림차순이므로 처음 일치하는 단계가 가장 높은 임계값)
+                    for level in self._take_profit_levels_desc:
                         if profit_percent >= level['threshold']:
                             suggested_amount = position['amount'] * level['percentage']
                             
@@ -639,7 +848,7 @@ class RiskManager:
                             )
                             
                             # 자동 이익 실현 여부 검사
-                            if self.risk_config.get('auto_take_profit', False):
+                            if self._auto_take_profit:
                                 # 수량 조정 (제안된 비율로 매도)
                                 if amount > suggested_amount:
                                     logger.info(f"자동 이익 실현: {pair}, 수량 조정 {amount} -> {suggested_amount}")
@@ -662,13 +871,19 @@ class RiskManager:
             Optional[Dict[str, float]]: 포지션 정보 (수량, 평균가) 또는 None
         """
         try:
+            # 짧은 시간 내 반복 조회는 로컬 캐시에서 반환
+            cached = self._position_cache.get(pair)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            
             # Redis에서 포지션 정보 가져오기
             if self.redis_client:
                 position_key = f"position:{pair}"
                 position_data = await self.redis_client.get(position_key)
                 
                 if position_data:
-                    position = json.loads(position_data)
+                    position = orjson.loads(position_data)
+                    self._position_cache[pair] = (time.monotonic() + _POSITION_CACHE_TTL, position)
                     return position
             
             # 데이터베이스에서 평균 매수가 가져오기
@@ -677,34 +892,29 @@ class RiskManager:
                     # 심볼 포맷 변환 (BTC/USDT -> BTCUSDT)
                     symbol = pair.replace('/', '')
                     
-                    # 매수 주문만 조회 (체결된 주문)
+                    # 체결된 주문의 매수/매도 수량과 비용을 SQL에서 집계
                     from src.database.models import Order, OrderStatus, OrderSide
-                    from sqlalchemy import and_, func
-                    
-                    buy_orders = session.query(Order).filter(
-                        and_(
-                            Order.symbol == symbol,
-                            Order.side == OrderSide.BUY,
-                            Order.status == OrderStatus.FILLED,
-                            Order.filled_quantity > 0
-                        )
-                    ).all()
+                    from sqlalchemy import func
                     
-                    sell_orders = session.query(Order).filter(
-                        and_(
-                            Order.symbol == symbol,
-                            Order.side == OrderSide.SELL,
-                            Order.status == OrderStatus.FILLED,
-                            Order.filled_quantity > 0
-                        )
-                    ).all()
-                    
-                    # 총 매수량과 총 비용 계산
-                    total_buy_quantity = sum(order.filled_quantity or 0 for order in buy_orders)
-                    total_buy_cost = sum((order.filled_quantity or 0) * (order.average_price or 0) for order in buy_orders)
+                    rows = session.query(
+                        Order.side,
+                        func.sum(Order.filled_quantity).label('q'),
+                        func.sum(Order.filled_quantity * Order.average_price).label('c')
+                    ).filter(
+                        Order.symbol == symbol,
+                        Order.status == OrderStatus.FILLED,
+                        Order.filled_quantity > 0
+                    ).group_by(Order.side).all()
                     
-                    # 총 매도량 계산
-                    total_sell_quantity = sum(order.filled_quantity or 0 for order in sell_orders)
+                    total_buy_quantity = 0
+                    total_buy_cost = 0
+                    total_sell_quantity = 0
+                    for side, quantity, cost in rows:
+                        if side == OrderSide.BUY:
+                            total_buy_quantity = quantity or 0
+                            total_buy_cost = cost or 0
+                        elif side == OrderSide.SELL:
+                            total_sell_quantity = quantity or 0
                     
                     # 현재 포지션 계산
                     current_amount = total_buy_quantity - total_sell_quantity
@@ -720,10 +930,11 @@ class RiskManager:
                         if self.redis_client:
                             await self.redis_client.set(
                                 position_key,
-                                json.dumps(position),
+                                _dumps(position),
                                 ex=60 * 60  # 1시간 동안 캐싱
                             )
                         
+                        self._position_cache[pair] = (time.monotonic() + _POSITION_CACHE_TTL, position)
                         return position
             
             return None
@@ -764,10 +975,13 @@ class RiskManager:
                 position_key = f"position:{pair}"
                 await self.redis_client.set(
                     position_key,
-                    json.dumps(position),
+                    _dumps(position),
                     ex=60 * 60  # 1시간 동안 캐싱
                 )
             
+            # 로컬 캐시 무효화 (다음 조회 시 갱신된 포지션을 읽도록)
+            self._position_cache.pop(pair, None)
+            
             logger.info(f"포지션 업데이트: {pair}, 수량={position['amount']:.6f}, 평균가={position['avg_price']:.2f}")
         except Exception as e:
             logger.error(f"포지션 업데이트 실패: {e}")
@@ -786,7 +1000,7 @@ class RiskManager:
         await self.publish_risk_event('KILL_SWITCH_ACTIVATED', {
             'reason': reason,
             'activated_by': 'manual',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         })
         
         # 알림 전송
@@ -806,7 +1020,7 @@ class RiskManager:
         await self.publish_risk_event('KILL_SWITCH_DEACTIVATED', {
             'reason': reason,
             'deactivated_by': 'manual',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         })
         
         # 알림 전송
@@ -814,6 +1028,28 @@ class RiskManager:
     
     async def close(self):
         """리소스 정리"""
+        if self.pubsub:
+            await self.pubsub.unsubscribe()
+        
+        if self._event_task:
+            self._event_task.cancel()
+            self._event_task = None
+        
+        # 배치 전송 태스크에 종료 신호를 보내 진행 중인 배치까지 전송한 뒤 종료
+        if self._flusher_task:
+            if not self._flusher_task.done():
+                self._pub_queue.put_nowait(None)
+                await self._flusher_task
+            self._flusher_task = None
+        
+        if self._pub_queue is not None:
+            pending = []
+            while not self._pub_queue.empty():
+                pending.append(self._pub_queue.get_nowait())
+            self._pub_queue = None
+            if pending and self.redis_client:
+                await self._flush_redis_ops(pending)
+        
         if self.redis_client:
             await self.redis_client.close()
             logger.info("Redis 연결 종료됨")
@@ -821,6 +1057,9 @@ class RiskManager:
 
 # 싱글톤 인스턴스
 _risk_manager = None
+_risk_manager_lock = asyncio.Lock()  # 동시 초기화 시 Redis 연결이 끝난 인스턴스만 공개
+# 태스크별 인스턴스 재정의 (테스트 등에서 전역 싱글톤을 건드리지 않고 교체할 때 사용, set_risk_manager() 참조)
+_risk_manager_cv: ContextVar[Optional[RiskManager]] = ContextVar('risk_manager', default=None)
 
 async def init_risk_manager(config: Dict[str, Any]) -> RiskManager:
     """
@@ -835,10 +1074,13 @@ async def init_risk_manager(config: Dict[str, Any]) -> RiskManager:
     global _risk_manager
     
     if _risk_manager is None:
-        _risk_manager = RiskManager(config)
-        
-        # Redis 연결 설정
-        await _risk_manager.connect_redis()
+        async with _risk_manager_lock:
+            if _risk_manager is None:
+                risk_manager = RiskManager(config)
+                
+                # Redis 연결 설정
+                await risk_manager.connect_redis()
+                _risk_manager = risk_manager
     
     return _risk_manager
 
@@ -846,12 +1088,34 @@ def get_risk_manager() -> Optional[RiskManager]:
     """
     리스크 관리자 가져오기
     
+    현재 컨텍스트에 재정의된 인스턴스가 있으면 그것을, 없으면 init_risk_manager()로 초기화된
+    전역 인스턴스를 반환합니다. 초기화 전에는 None을 반환합니다.
+    
     Returns:
         Optional[RiskManager]: 리스크 관리자 인스턴스
     """
-    global _risk_manager
+    return _risk_manager_cv.get() or _risk_manager
+
+def set_risk_manager(risk_manager: Optional[RiskManager]) -> Token:
+    """
+    현재 컨텍스트에서 get_risk_manager()가 반환할 인스턴스 재정의
     
-    if _risk_manager is None:
-        logger.warning("리스크 관리자가 초기화되지 않았습니다. init_risk_manager()를 먼저 호출하세요.")
+    전역 싱글톤은 바꾸지 않습니다. 이후 생성되는 태스크는 현재 컨텍스트를 복사하므로 재정의를 물려받고,
+    다른 태스크에는 영향이 없습니다.
     
-    return _risk_manager
+    Args:
+        risk_manager: 재정의할 리스크 관리자 인스턴스 (None이면 전역 인스턴스 사용)
+        
+    Returns:
+        Token: reset_risk_manager()에 전달할 토큰
+    """
+    return _risk_manager_cv.set(risk_manager)
+
+def reset_risk_manager(token: Token) -> None:
+    """
+    set_risk_manager() 호출 이전의 재정의 상태로 복원
+    
+    Args:
+        token: set_risk_manager()가 반환한 토큰
+    """
+    _risk_manager_cv.reset(token)
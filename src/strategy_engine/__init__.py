@@ -5,14 +5,30 @@ This module provides the strategy engine for the trading bot,
 including strategy management, evaluation, and technical indicators.
 """
 
+import importlib
+
 from src.strategy_engine.strategy_manager import StrategyManager
-from src.strategy_engine.strategy_evaluator import StrategyEvaluator
-from src.strategy_engine.nasos_strategy import NASOSStrategy
-from src.strategy_engine.indicators import (
-    calculate_ema, calculate_sma, calculate_rsi, calculate_ewo,
-    calculate_stoch_rsi, calculate_bollinger_bands, calculate_macd,
-    calculate_wma, calculate_hma
-)
+
+# pandas/talib-backed exports are imported on first access so that importing the package
+# (e.g. for StrategyManager or StrategyLoader) does not load the indicator stack
+_LAZY_IMPORTS = {
+    'StrategyEvaluator': 'src.strategy_engine.strategy_evaluator',
+    'NASOSStrategy': 'src.strategy_engine.nasos_strategy',
+    **{name: 'src.strategy_engine.indicators' for name in (
+        'calculate_ema', 'calculate_sma', 'calculate_rsi', 'calculate_ewo',
+        'calculate_stoch_rsi', 'calculate_bollinger_bands', 'calculate_macd',
+        'calculate_wma', 'calculate_hma',
+    )},
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'StrategyManager',
@@ -15,6 +15,7 @@ import numpy as np
 import tempfile
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any, Union
 from pathlib import Path
 import matplotlib.pyplot as plt
@@ -30,13 +31,14 @@ logger = logging.getLogger(__name__)
 class BacktestingFramework:
     """백테스팅 프레임워크 클래스"""
     
-    def __init__(self, config_path: str, data_dir: str):
+    def __init__(self, config_path: str, data_dir: str, data_format: Optional[str] = None):
         """
         백테스팅 프레임워크 초기화
         
         Args:
             config_path: Freqtrade 설정 파일 경로
             data_dir: 백테스트 데이터 디렉토리
+            data_format: OHLCV 데이터 저장 형식 (없으면 설정 파일의 dataformat_ohlcv, 기본 feather)
         """
         self.config_path = config_path
         self.data_dir = data_dir
@@ -54,6 +56,9 @@ class BacktestingFramework:
         with open(config_path, 'r') as f:
             self.config = json.load(f)
         
+        # OHLCV 데이터 형식 (feather: Arrow IPC 파일을 메모리 맵으로 읽어 반복 백테스트/최적화 시 재파싱 없음)
+        self.data_format = data_format or self.config.get('dataformat_ohlcv', 'feather')
+        
         logger.info(f"백테스팅 프레임워크 초기화됨 (설정: {config_path}, 데이터: {data_dir})")
         
         # 결과 저장을 위한 최근 백테스트 결과
@@ -82,6 +87,7 @@ class BacktestingFramework:
                 '--timeframes', ','.join(timeframes),
                 '--exchange', self.config.get('exchange', {}).get('name', 'binance'),
                 '--datadir', self.data_dir,
+                '--data-format-ohlcv', self.data_format,
                 '--timerange', f'{start_date}-{end_date}'
             ]
             
@@ -127,7 +133,8 @@ class BacktestingFramework:
                 'freqtrade', 'backtesting',
                 '--config', self.config_path,
                 '--strategy', strategy,
-                '--datadir', self.data_dir
+                '--datadir', self.data_dir,
+                '--data-format-ohlcv', self.data_format
             ]
             
             # 시간 범위 추가
@@ -150,7 +157,7 @@ class BacktestingFramework:
             
             # 결과 저장 활성화
             command.extend(['--export', 'trades'])
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")  # 동시 실행되는 창끼리 파일명 충돌 방지
             result_filename = f"{strategy}_{timestamp}"
             export_filename = os.path.join(self.results_dir, result_filename)
             command.extend(['--export-filename', export_filename])
@@ -275,7 +282,7 @@ class BacktestingFramework:
     
     def run_hyperopt(self, strategy: str, epochs: int = 100, spaces: Optional[List[str]] = None,
                     timerange: Optional[str] = None, hyperopt_loss: str = 'SharpeHyperOptLoss',
-                    max_open_trades: Optional[int] = None) -> Dict[str, Any]:
+                    max_open_trades: Optional[int] = None, job_workers: int = -1) -> Dict[str, Any]:
         """
         하이퍼파라미터 최적화 실행
         
@@ -299,7 +306,8 @@ class BacktestingFramework:
                 '--hyperopt-loss', hyperopt_loss,
                 '--epochs', str(epochs),
                 '--datadir', self.data_dir,
-                '--job-workers', '-1'  # 사용 가능한 모든 CPU 코어 사용
+                '--data-format-ohlcv', self.data_format,
+                '--job-workers', str(job_workers)  # 기본 -1: 사용 가능한 모든 CPU 코어 사용
             ]
             
             # 최적화 공간 추가
@@ -315,7 +323,7 @@ class BacktestingFramework:
                 command.extend(['--max-open-trades', str(max_open_trades)])
             
             # 결과 저장 활성화
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")  # 동시 실행되는 창끼리 파일명 충돌 방지
             result_filename = f"hyperopt_{strategy}_{timestamp}"
             export_filename = os.path.join(self.results_dir, result_filename)
             command.extend(['--hyperopt-filename', export_filename])
@@ -417,12 +425,13 @@ class BacktestingFramework:
     def run_walk_forward(self, strategy: str, start_date: str, end_date: str, 
                        window_size_days: int = 30, step_size_days: int = 7,
                        optimize_epochs: int = 50, optimize_spaces: Optional[List[str]] = None,
-                       max_open_trades: Optional[int] = None) -> Dict[str, Any]:
+                       max_open_trades: Optional[int] = None, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         워크포워드 테스팅 실행
         
         워크포워드 테스팅은 시간을 여러 구간으로 나누어 각 구간에서 최적화를 수행하고 다음 구간에서 테스트하는 방식으로,
         과적합(overfitting)을 방지하는 데 도움이 됩니다.
+        최적화는 창 순서대로 실행하고, 테스트 기간 백테스트는 서로 독립적이므로 동시에 실행합니다.
         
         Args:
             strategy: 전략 이름
@@ -433,6 +442,7 @@ class BacktestingFramework:
             optimize_epochs: 최적화 반복 횟수
             optimize_spaces: 최적화할 공간 목록
             max_open_trades: 최대 동시 거래 수
+            max_workers: 동시에 실행할 테스트 기간 백테스트 수 (기본: CPU 코어 수의 절반)
             
         Returns:
             Dict[str, Any]: 워크포워드 테스팅 결과
@@ -453,6 +463,7 @@ class BacktestingFramework:
             }
             
             # 테스트 창 생성
+            windows = []
             current_start = start
             window_id = 1
             
@@ -471,76 +482,46 @@ class BacktestingFramework:
                     break
                 
                 # 날짜 형식 변환
-                train_start_str = current_start.strftime("%Y%m%d")
-                train_end_str = train_end.strftime("%Y%m%d")
-                test_start_str = test_start.strftime("%Y%m%d")
-                test_end_str = test_end.strftime("%Y%m%d")
-                
-                logger.info(f"\n\n워크포워드 창 {window_id}:")
-                logger.info(f"\ud559습 기간: {train_start_str} - {train_end_str}")
-                logger.info(f"\ud14c스트 기간: {test_start_str} - {test_end_str}")
-                
-                # 1. 학습 기간에 대한 최적화 수행
-                train_timerange = f"{train_start_str}-{train_end_str}"
-                logger.info(f"\ud559습 기간 최적화 시작...")
+                windows.append((
+                    window_id,
+                    f"{current_start.strftime('%Y%m%d')}-{train_end.strftime('%Y%m%d')}",
+                    f"{test_start.strftime('%Y%m%d')}-{test_end.strftime('%Y%m%d')}"
+                ))
                 
-                hyperopt_results = self.run_hyperopt(
-                    strategy=strategy,
-                    epochs=optimize_epochs,
-                    spaces=optimize_spaces,
-                    timerange=train_timerange,
+                # 다음 창으로 이동
+                current_start = test_end
+                window_id += 1
+            
+            # freqtrade는 user_data 디렉토리당 hyperopt 하나만 허용하므로(hyperopt.lock) 최적화는 창 순서대로 실행
+            optimized_windows = []
+            for window in windows:
+                hyperopt_results = self._optimize_walk_forward_window(
+                    strategy, *window,
+                    optimize_epochs=optimize_epochs,
+                    optimize_spaces=optimize_spaces,
                     max_open_trades=max_open_trades
                 )
-                
-                if not hyperopt_results or 'best_params' not in hyperopt_results:
-                    logger.warning(f"\ucc3d {window_id} 최적화 실패, 다음 창으로 이동")
-                    current_start = test_end
-                    window_id += 1
-                    continue
-                
-                # 2. 최적 매개변수로 테스트 기간에 백테스트 실행
-                test_timerange = f"{test_start_str}-{test_end_str}"
-                logger.info(f"\ud14c스트 기간 백테스트 시작...")
-                
-                # 최적 매개변수를 임시 파일로 저장
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                    json.dump(hyperopt_results['best_params'], temp_file)
-                    temp_file_path = temp_file.name
-                
-                try:
-                    # 테스트 기간에 대한 백테스트 실행
-                    backtest_results = self.run_backtest(
-                        strategy=strategy,
-                        timerange=test_timerange,
-                        parameter_file=temp_file_path,
+                if hyperopt_results:
+                    optimized_windows.append((window, hyperopt_results))
+            
+            # 테스트 기간 백테스트는 freqtrade 하위 프로세스에서 실행되므로 스레드로 동시에 대기
+            cpu_count = os.cpu_count() or 1
+            workers = max(1, min(max_workers or cpu_count // 2, len(optimized_windows) or 1))
+            
+            logger.info(f"워크포워드 테스트 기간 백테스트 {len(optimized_windows)}개를 최대 {workers}개씩 동시에 실행합니다")
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                window_results = executor.map(
+                    lambda item: self._run_walk_forward_window(
+                        strategy, *item[0],
+                        hyperopt_results=item[1],
                         max_open_trades=max_open_trades
-                    )
-                    
-                    # 창 결과 저장
-                    window_result = {
-                        'window_id': window_id,
-                        'train_period': f"{train_start_str}-{train_end_str}",
-                        'test_period': f"{test_start_str}-{test_end_str}",
-                        'train_results': hyperopt_results,
-                        'test_results': backtest_results
-                    }
-                    
-                    results['windows'].append(window_result)
-                    
-                    # 결과 로깅
-                    logger.info(f"\ucc3d {window_id} 결과:")
-                    logger.info(f"\ud559습 기간 최적 수익: {hyperopt_results.get('best_profit', 0):.2f}%")
-                    logger.info(f"\ud14c스트 기간 수익: {backtest_results.get('total_profit', 0):.2f}%")
-                    logger.info(f"\ud14c스트 기간 거래 수: {backtest_results.get('total_trades', 0)}")
-                    
-                finally:
-                    # 임시 파일 삭제
-                    if os.path.exists(temp_file_path):
-                        os.remove(temp_file_path)
+                    ),
+                    optimized_windows
+                )
                 
-                # 다음 창으로 이동
-                current_start = test_end
-                window_id += 1
+                # 창 순서대로 결과 저장
+                results['windows'] = [window_result for window_result in window_results if window_result]
             
             # 전체 결과 집계
             if results['windows']:
@@ -573,3 +554,101 @@ class BacktestingFramework:
             import traceback
             logger.error(traceback.format_exc())
             return {'windows': [], 'error': str(e)}
+    
+    def _optimize_walk_forward_window(self, strategy: str, window_id: int, train_timerange: str, test_timerange: str,
+                                      optimize_epochs: int, optimize_spaces: Optional[List[str]],
+                                      max_open_trades: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        워크포워드 창 하나의 학습 기간 최적화 실행
+        
+        Args:
+            strategy: 전략 이름
+            window_id: 창 번호
+            train_timerange: 학습 기간 (YYYYMMDD-YYYYMMDD 형식)
+            test_timerange: 테스트 기간 (YYYYMMDD-YYYYMMDD 형식)
+            optimize_epochs: 최적화 반복 횟수
+            optimize_spaces: 최적화할 공간 목록
+            max_open_trades: 최대 동시 거래 수
+            
+        Returns:
+            Optional[Dict[str, Any]]: 최적화 결과 (최적화 실패 시 None)
+        """
+        logger.info(f"\n\n워크포워드 창 {window_id}:")
+        logger.info(f"\ud559습 기간: {train_timerange}")
+        logger.info(f"\ud14c스트 기간: {test_timerange}")
+        
+        # 학습 기간에 대한 최적화 수행
+        logger.info(f"\ud559습 기간 최적화 시작...")
+        
+        hyperopt_results = self.run_hyperopt(
+            strategy=strategy,
+            epochs=optimize_epochs,
+            spaces=optimize_spaces,
+            timerange=train_timerange,
+            max_open_trades=max_open_trades
+        )
+        
+        # 최적 매개변수가 비어 있으면 (실행 실패, 출력 파싱 실패 등) 빈 매개변수로 백테스트하지 않음
+        if not hyperopt_results or not hyperopt_results.get('best_params'):
+            logger.warning(f"\ucc3d {window_id} 최적화 실패, 다음 창으로 이동")
+            return None
+        
+        return hyperopt_results
+    
+    def _run_walk_forward_window(self, strategy: str, window_id: int, train_timerange: str, test_timerange: str,
+                                 hyperopt_results: Dict[str, Any],
+                                 max_open_trades: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        워크포워드 창 하나의 테스트 기간 백테스트 실행 (학습 기간 최적 매개변수 사용)
+        
+        Args:
+            strategy: 전략 이름
+            window_id: 창 번호
+            train_timerange: 학습 기간 (YYYYMMDD-YYYYMMDD 형식)
+            test_timerange: 테스트 기간 (YYYYMMDD-YYYYMMDD 형식)
+            hyperopt_results: 학습 기간 최적화 결과
+            max_open_trades: 최대 동시 거래 수
+            
+        Returns:
+            Optional[Dict[str, Any]]: 창 결과 (최적 매개변수가 없으면 None)
+        """
+        if not hyperopt_results.get('best_params'):
+            logger.warning(f"\ucc3d {window_id} 최적 매개변수 없음, 다음 창으로 이동")
+            return None
+        
+        # 최적 매개변수로 테스트 기간에 백테스트 실행
+        logger.info(f"\ucc3d {window_id} 테스트 기간 백테스트 시작...")
+        
+        # 최적 매개변수를 임시 파일로 저장
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
+            json.dump(hyperopt_results['best_params'], temp_file)
+            temp_file_path = temp_file.name
+        
+        try:
+            # 테스트 기간에 대한 백테스트 실행
+            backtest_results = self.run_backtest(
+                strategy=strategy,
+                timerange=test_timerange,
+                parameter_file=temp_file_path,
+                max_open_trades=max_open_trades
+            )
+            
+            # 결과 로깅
+            logger.info(f"\ucc3d {window_id} 결과:")
+            logger.info(f"\ud559습 기간 최적 수익: {hyperopt_results.get('best_profit', 0):.2f}%")
+            logger.info(f"\ud14c스트 기간 수익: {backtest_results.get('total_profit', 0):.2f}%")
+            logger.info(f"\ud14c스트 기간 거래 수: {backtest_results.get('total_trades', 0)}")
+            
+            # 창 결과
+            return {
+                'window_id': window_id,
+                'train_period': train_timerange,
+                'test_period': test_timerange,
+                'train_results': hyperopt_results,
+                'test_results': backtest_results
+            }
+            
+        finally:
+            # 임시 파일 삭제
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
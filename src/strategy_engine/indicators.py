@@ -4,9 +4,42 @@ This module provides common technical indicators used by trading strategies.
 """
 import numpy as np
 import pandas as pd
+import talib
 import talib.abstract as ta
 from typing import Dict, Optional, Tuple, Union, List
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the numpy convolution path is used without it
+    njit = None
+
+# Largest WMA period computed with the numba kernel (longer periods use the convolution)
+_NJIT_MAX_PERIOD = 64
+
+if njit is not None:
+    # fastmath without 'nnan' so windows containing NaN (HMA warm-up) still produce NaN
+    @njit(cache=True, fastmath={'contract', 'arcp', 'reassoc'}, parallel=True)
+    def _wma_njit(x, period, out):
+        """Weighted Moving Average kernel writing into out[period - 1:]"""
+        w_sum = period * (period + 1) / 2.0
+        for i in prange(period - 1, len(x)):
+            s = 0.0
+            for j in range(period):
+                s += (j + 1) * x[i - period + 1 + j]
+            out[i] = s / w_sum
+    
+    # Compile at import so the first indicator call does not pay the JIT cost
+    _wma_njit(np.zeros(1), 1, np.empty(1))
+else:
+    _wma_njit = None
+
+# Probe talib WMA support once instead of catching failures on every calculate_wma call
+try:
+    talib.WMA(np.ones(5), timeperiod=3)
+    _HAS_TALIB_WMA = True
+except Exception:
+    _HAS_TALIB_WMA = False
+
 
 def calculate_ema(dataframe: pd.DataFrame, period: int, field='close') -> pd.Series:
     """
@@ -53,11 +86,11 @@ def calculate_ewo(dataframe: pd.DataFrame, ema_short=5, ema_long=35) -> pd.Serie
     :param ema_long: Long period for EMA calculation
     :return: Series with EWO values
     """
-    df = dataframe.copy()
-    df['ema_short'] = ta.EMA(df, timeperiod=ema_short)
-    df['ema_long'] = ta.EMA(df, timeperiod=ema_long)
-    df['ewo'] = (df['ema_short'] - df['ema_long']) / df['close'] * 100
-    return df['ewo']
+    # Compute on the raw close array (no dataframe copy or intermediate columns)
+    close = dataframe['close'].to_numpy(dtype=np.float64)
+    es = talib.EMA(close, timeperiod=ema_short)
+    el = talib.EMA(close, timeperiod=ema_long)
+    return pd.Series((es - el) / close * 100.0, index=dataframe.index, name='ewo')
 
 
 def calculate_stoch_rsi(dataframe: pd.DataFrame, period=14, rsi_period=14, k=3, d=3) -> Tuple[pd.Series, pd.Series]:
@@ -71,18 +104,17 @@ def calculate_stoch_rsi(dataframe: pd.DataFrame, period=14, rsi_period=14, k=3,
     :param d: D line period
     :return: Tuple of Series (k_line, d_line)
     """
-    rsi = ta.RSI(dataframe, timeperiod=rsi_period)
-    stoch_k, stoch_d = ta.STOCH(
-        pd.DataFrame({
-            'high': rsi,
-            'low': rsi,
-            'close': rsi,
-        }),
+    # Run the talib function API on the raw RSI array (passed as high/low/close)
+    # instead of building a three-column DataFrame for the abstract interface
+    close = dataframe['close'].to_numpy(dtype=np.float64)
+    rsi = talib.RSI(close, timeperiod=rsi_period)
+    stoch_k, stoch_d = talib.STOCH(
+        rsi, rsi, rsi,
         fastk_period=period,
         slowk_period=k,
         slowd_period=d
     )
-    return stoch_k, stoch_d
+    return pd.Series(stoch_k, index=dataframe.index), pd.Series(stoch_d, index=dataframe.index)
 
 
 def calculate_bollinger_bands(dataframe: pd.DataFrame, period=20, stddev=2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
@@ -94,7 +126,10 @@ def calculate_bollinger_bands(dataframe: pd.DataFrame, period=20, stddev=2.0) ->
     :param stddev: Standard deviation multiplier
     :return: Tuple of Series (upper, middle, lower)
     """
-    return ta.BBANDS(dataframe, timeperiod=period, nbdevup=stddev, nbdevdn=stddev)
+    close = dataframe['close'].to_numpy(dtype=np.float64)
+    upper, middle, lower = talib.BBANDS(close, timeperiod=period, nbdevup=stddev, nbdevdn=stddev)
+    index = dataframe.index
+    return pd.Series(upper, index=index), pd.Series(middle, index=index), pd.Series(lower, index=index)
 
 
 def calculate_macd(dataframe: pd.DataFrame, fast=12, slow=26, signal=9) -> Tuple[pd.Series, pd.Series, pd.Series]:
@@ -107,7 +142,31 @@ def calculate_macd(dataframe: pd.DataFrame, fast=12, slow=26, signal=9) -> Tuple
     :param signal: Signal period
     :return: Tuple of Series (macd, signal, histogram)
     """
-    return ta.MACD(dataframe, fastperiod=fast, slowperiod=slow, signalperiod=signal)
+    close = dataframe['close'].to_numpy(dtype=np.float64)
+    macd, macd_signal, macd_hist = talib.MACD(close, fastperiod=fast, slowperiod=slow, signalperiod=signal)
+    index = dataframe.index
+    return pd.Series(macd, index=index), pd.Series(macd_signal, index=index), pd.Series(macd_hist, index=index)
+
+
+def _wma_np(data: np.ndarray, period: int, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate Weighted Moving Average on a raw array
+    (numba kernel for short periods when numba is installed, otherwise a single vectorized convolution)
+    
+    :param data: Input values
+    :param period: Period for WMA calculation
+    :param dtype: Floating point dtype used for the calculation and the result (default: float64)
+    :return: Array with WMA values (NaN for the first period - 1 rows)
+    """
+    data = np.asarray(data, dtype=dtype)
+    result = np.full(len(data), np.nan, dtype=dtype)
+    if len(data) >= period and _wma_njit is not None and period <= _NJIT_MAX_PERIOD:
+        _wma_njit(np.ascontiguousarray(data), period, result)
+    elif len(data) >= period:
+        weights = np.arange(1, period + 1, dtype=dtype)
+        weights /= weights.sum()
+        result[period - 1:] = np.convolve(data, weights[::-1], mode='valid')
+    return result
 
 
 def calculate_wma(dataframe: pd.DataFrame, period: int, field='close') -> pd.Series:
@@ -119,19 +178,14 @@ def calculate_wma(dataframe: pd.DataFrame, period: int, field='close') -> pd.Ser
     :param field: Field to use for calculation (default: close)
     :return: Series with WMA values
     """
-    try:
-        # Try using talib if available
-        return ta.WMA(dataframe, timeperiod=period, price=field)
-    except:
+    data = dataframe[field] if isinstance(field, str) else field
+    data = data.to_numpy(dtype=np.float64)
+    if _HAS_TALIB_WMA:
+        result = talib.WMA(data, timeperiod=period)
+    else:
         # Fallback to manual calculation
-        weights = np.arange(1, period + 1)
-        data = dataframe[field].values if isinstance(field, str) else field.values
-        wma = pd.Series(
-            index=dataframe.index,
-            data=np.nan_to_num(pd.Series(data).rolling(period).apply(
-                lambda x: np.sum(weights * x) / np.sum(weights), raw=True).values)
-        )
-        return wma
+        result = _wma_np(data, period)
+    return pd.Series(result, index=dataframe.index)
 
 
 def calculate_hma(dataframe: pd.DataFrame, period: int, field='close') -> pd.Series:
@@ -147,14 +201,11 @@ def calculate_hma(dataframe: pd.DataFrame, period: int, field='close') -> pd.Ser
     half_length = period // 2
     sqrt_length = int(np.sqrt(period))
     
-    # Calculate WMAs
-    wma_half = calculate_wma(dataframe, half_length, field)
-    wma_full = calculate_wma(dataframe, period, field)
+    # Work on the raw array to avoid intermediate Series/DataFrame allocations
+    data = dataframe[field].to_numpy(dtype=np.float64)
     
     # Calculate 2*WMA(n/2) - WMA(n)
-    hma_data = 2 * wma_half - wma_full
+    hma_data = 2 * _wma_np(data, half_length) - _wma_np(data, period)
     
     # Calculate final HMA
-    hma = calculate_wma(pd.DataFrame({field: hma_data}), sqrt_length, field)
-    
-    return hma
+    return pd.Series(_wma_np(hma_data, sqrt_length), index=dataframe.index)
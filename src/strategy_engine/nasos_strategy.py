@@ -13,9 +13,46 @@ from src.strategy_engine.indicators import (
     calculate_stoch_rsi, calculate_bollinger_bands, calculate_macd,
     calculate_wma, calculate_hma
 )
+from src.strategy_engine.strategy_evaluator import evaluate_expr
 
 logger = logging.getLogger(__name__)
 
+# Signal rules as constant expressions over the indicator columns; base_ma (the baseline
+# MA column) and the thresholds are supplied as variables (see NASOSStrategy._signal_variables)
+_SIGNAL_THRESHOLDS = ('low_offset', 'low_offset_2', 'high_offset', 'high_offset_2',
+                      'rsi_buy', 'rsi_fast_buy', 'ewo_low', 'ewo_high_2')
+
+# Buy condition for normal/neutral market
+_BUY_BULL_EXPR = (
+    "(close < base_ma * low_offset) & "  # price below baseline * offset
+    "(rsi < rsi_buy) & "  # RSI below threshold
+    "(rsi_fast < rsi_fast_buy) & "  # fast RSI below its threshold
+    "(EWO > ewo_low) & "    # EWO above bear threshold
+    "(EWO < ewo_high_2) & "  # EWO below upper bound (not during extreme pump)
+    "(volume > 0) & "
+    "(recentispumping == 0)"         # no recent pump activity
+)
+
+# Buy condition for bearish market (allow deeper dip buy)
+_BUY_BEAR_EXPR = (
+    "(close < base_ma * low_offset_2) & "  # price much below baseline
+    "(rsi < rsi_buy) & "
+    "(rsi_fast < rsi_fast_buy) & "
+    "(EWO < ewo_low) & "   # EWO below bearish threshold (strong downtrend)
+    "(volume > 0) & "
+    "(recentispumping == 0)"
+)
+
+# Sell conditions (any triggers a sell)
+_SELL_EXPR = (
+    "(close > sma_9) | "  # price above SMA9
+    "((close > base_ma * high_offset) & (EWO >= ewo_low)) | "
+    "((close > base_ma * high_offset_2) & (EWO < ewo_low)) | "
+    "(rsi > 50) | "  # RSI above 50
+    "(rsi_fast > rsi_slow) | "  # RSI fast > RSI slow (upward RSI cross)
+    "((close < hma_50) & (rsi_fast > rsi_slow))"  # price fell below HMA50 while RSI momentum up
+)
+
 
 class NASOSStrategy:
     """
@@ -128,29 +165,11 @@ class NASOSStrategy:
         df['buy'] = 0
         df['buy_tag'] = None
         
-        base_length = self.params["base_nb_candles_buy"]
-        base_ma_col = f"ma_{base_length}"
-        
-        # Buy condition for normal/neutral market
-        cond_bull = (
-            (df['close'] < df[base_ma_col] * self.params["low_offset"]) &  # price below baseline * offset
-            (df['rsi'] < self.params["rsi_buy"]) &  # RSI below threshold
-            (df['rsi_fast'] < self.params["rsi_fast_buy"]) &  # fast RSI below its threshold
-            (df['EWO'] > self.params["ewo_low"]) &    # EWO above bear threshold
-            (df['EWO'] < self.params["ewo_high_2"]) & # EWO below upper bound (not during extreme pump)
-            (df['volume'] > 0) &
-            (df['recentispumping'] == 0)         # no recent pump activity
-        )
-        
-        # Buy condition for bearish market (allow deeper dip buy)
-        cond_bear = (
-            (df['close'] < df[base_ma_col] * self.params["low_offset_2"]) &  # price much below baseline
-            (df['rsi'] < self.params["rsi_buy"]) &
-            (df['rsi_fast'] < self.params["rsi_fast_buy"]) &
-            (df['EWO'] < self.params["ewo_low"]) &   # EWO below bearish threshold (strong downtrend)
-            (df['volume'] > 0) &
-            (df['recentispumping'] == 0)
-        )
+        # Buy conditions are evaluated as single fused expressions over the columns
+        # (thresholds are passed as variables so the expression strings stay constant)
+        variables = self._signal_variables(df)
+        cond_bull = evaluate_expr(df, _BUY_BULL_EXPR, variables)
+        cond_bear = evaluate_expr(df, _BUY_BEAR_EXPR, variables)
         
         df.loc[cond_bear, ['buy', 'buy_tag']] = (1, 'ewo_bear')
         df.loc[cond_bull, ['buy', 'buy_tag']] = (1, 'ewo_bull')
@@ -167,22 +186,24 @@ class NASOSStrategy:
         df = dataframe.copy()
         df['sell'] = 0
         
-        base_length = self.params["base_nb_candles_buy"]
-        base_ma_col = f"ma_{base_length}"
-        
-        # Sell conditions (any triggers a sell)
-        sell_cond1 = df['close'] > df['sma_9']  # price above SMA9
-        sell_cond2_bull = (df['close'] > df[base_ma_col] * self.params["high_offset"]) & (df['EWO'] >= self.params["ewo_low"])
-        sell_cond2_bear = (df['close'] > df[base_ma_col] * self.params["high_offset_2"]) & (df['EWO'] < self.params["ewo_low"])
-        sell_cond3 = df['rsi'] > 50  # RSI above 50
-        sell_cond4 = df['rsi_fast'] > df['rsi_slow']  # RSI fast > RSI slow (upward RSI cross)
-        sell_cond5 = (df['close'] < df['hma_50']) & (df['rsi_fast'] > df['rsi_slow'])  # price fell below HMA50 while RSI momentum up
-        
-        if_sell = sell_cond1 | sell_cond2_bull | sell_cond2_bear | sell_cond3 | sell_cond4 | sell_cond5
+        # Sell conditions (any triggers a sell), evaluated as one fused expression
+        if_sell = evaluate_expr(df, _SELL_EXPR, self._signal_variables(df))
         df.loc[if_sell, 'sell'] = 1
         
         return df
     
+    def _signal_variables(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Build the named variables used by the buy/sell expressions.
+        
+        :param df: Dataframe with indicators
+        :return: Dictionary with the baseline MA column as base_ma and the thresholds as floats
+        """
+        p = self.params
+        variables = {name: float(p[name]) for name in _SIGNAL_THRESHOLDS}
+        variables['base_ma'] = df[f"ma_{p['base_nb_candles_buy']}"].values
+        return variables
+    
 # DEAD CODE:     def calculate_custom_stoploss(self, current_profit: float) -> float:
         """
         Calculate custom stoploss based on current profit.
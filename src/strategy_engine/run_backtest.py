@@ -8,20 +8,23 @@
 
 import os
 import sys
-import json
+import asyncio
 import logging
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime
 
+import orjson
+
 # 프로젝트 루트 경로 추가
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from src.strategy_engine.backtesting import BacktestingFramework
-from src.strategy_engine.visualization import BacktestVisualizer
+from src.strategy_engine.visualization import BacktestVisualizer, create_chart_executor
 
 # 로깅 설정
 logging.basicConfig(
@@ -30,8 +33,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def parse_arguments():
-    """명령줄 인수 파싱"""
+# 결과 파일 JSON 직렬화 옵션 (numpy 값과 비문자열 키를 그대로 인코딩)
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """명령줄 인수 파서 생성 (한 번만 생성하여 재사용)"""
     parser = argparse.ArgumentParser(description='NASOSv5_mod3 백테스팅 프레임워크')
     
     # 기본 인수
@@ -41,6 +48,8 @@ def parse_arguments():
                       help='백테스트 데이터 디렉토리')
     parser.add_argument('--strategy', type=str, default='NASOSv5_mod3',
                       help='백테스트할 전략 이름')
+    parser.add_argument('--data-format', type=str, choices=['json', 'jsongz', 'hdf5', 'feather', 'parquet'],
+                      help='OHLCV 데이터 저장 형식 (기본: 설정 파일 값 또는 feather)')
     
     # 서브 파서 생성
     subparsers = parser.add_subparsers(dest='command', help='실행할 명령')
@@ -100,8 +109,14 @@ def parse_arguments():
                                   help='최대 동시 거래 수')
     walkforward_parser.add_argument('--visualize', action='store_true',
                                   help='워크포워드 결과 시각화')
+    walkforward_parser.add_argument('--workers', type=int,
+                                  help='동시에 실행할 창 수 (기본: CPU 코어 수의 절반)')
     
-    return parser.parse_args()
+    return parser
+
+def parse_arguments():
+    """명령줄 인수 파싱"""
+    return _build_parser().parse_args()
 
 def run_download_data(args, backtesting_framework):
     """데이터 다운로드 실행"""
@@ -193,15 +208,18 @@ def run_hyperopt(args, backtesting_framework):
     os.makedirs(params_dir, exist_ok=True)
     
     params_file = os.path.join(params_dir, f"{args.strategy}_params_{timestamp}.json")
-    with open(params_file, 'w') as f:
-        json.dump(best_params, f, indent=4)
+    Path(params_file).write_bytes(orjson.dumps(best_params, option=_JSON_OPTIONS))
     
     logger.info(f"최적 매개변수 저장됨: {params_file}")
     
     return hyperopt_results
 
-def run_walkforward(args, backtesting_framework):
-    """워크포워드 테스팅 실행"""
+async def run_walkforward(args, backtesting_framework):
+    """
+    워크포워드 테스팅 실행
+    
+    결과 파일 저장은 백그라운드 스레드에서 진행하고, 그동안 창별 보고서를 생성합니다.
+    """
     logger.info(f"워크포워드 테스팅 시작: {args.strategy}")
     
     spaces = args.optimize_spaces.split(',') if args.optimize_spaces else None
@@ -214,7 +232,8 @@ def run_walkforward(args, backtesting_framework):
         step_size_days=args.step_size,
         optimize_epochs=args.optimize_epochs,
         optimize_spaces=spaces,
-        max_open_trades=args.max_open_trades
+        max_open_trades=args.max_open_trades,
+        max_workers=args.workers
     )
     
     if not walkforward_results or 'error' in walkforward_results:
@@ -235,38 +254,47 @@ def run_walkforward(args, backtesting_framework):
     os.makedirs(results_dir, exist_ok=True)
     
     results_file = os.path.join(results_dir, f"{args.strategy}_walkforward_{timestamp}.json")
-    with open(results_file, 'w') as f:
-        json.dump(walkforward_results, f, indent=4)
+    save_task = asyncio.create_task(asyncio.to_thread(
+        Path(results_file).write_bytes, orjson.dumps(walkforward_results, option=_JSON_OPTIONS)
+    ))
     
+    # 시각화 실행 (각 창별 결과, matplotlib은 스레드 안전하지 않으므로 하나의 스레드에서 순서대로 생성)
+    if args.visualize and 'windows' in walkforward_results:
+        await asyncio.to_thread(_create_window_reports, args.strategy, walkforward_results['windows'], results_dir)
+    
+    await save_task
     logger.info(f"워크포워드 결과 저장됨: {results_file}")
     
-    # 시각화 실행 (각 창별 결과)
-    if args.visualize and 'windows' in walkforward_results:
-        visualizer = BacktestVisualizer(os.path.join(project_root, 'results'))
-        
-        # 각 창별 테스트 결과 시각화
-        for window in walkforward_results['windows']:
+    return walkforward_results
+
+def _create_window_reports(strategy: str, windows: List[Dict[str, Any]], results_dir: str):
+    """워크포워드 창별 테스트 결과 보고서 생성"""
+    visualizer = BacktestVisualizer(os.path.join(project_root, 'results'))
+    
+    # 각 창별 테스트 결과 시각화 (차트 작업 프로세스 풀은 모든 창에서 재사용)
+    with create_chart_executor() as executor:
+        for window in windows:
             if 'test_results' in window:
                 window_id = window['window_id']
                 test_period = window['test_period']
                 
                 report_dir = visualizer.create_performance_report(
                     window['test_results'],
-                    f"{args.strategy}_Window{window_id}_{test_period}",
-                    os.path.join(results_dir, f"window_{window_id}")
+                    f"{strategy}_Window{window_id}_{test_period}",
+                    os.path.join(results_dir, f"window_{window_id}"),
+                    executor=executor
                 )
                 logger.info(f"창 {window_id} 보고서 생성 완료: {report_dir}")
-    
-    return walkforward_results
 
-def main():
+async def main():
     """메인 함수"""
     args = parse_arguments()
     
     # 백테스팅 프레임워크 초기화
     backtesting_framework = BacktestingFramework(
         config_path=args.config,
-        data_dir=args.datadir
+        data_dir=args.datadir,
+        data_format=args.data_format
     )
     
     # 명령에 따라 실행
@@ -277,7 +305,7 @@ def main():
     elif args.command == 'hyperopt':
         run_hyperopt(args, backtesting_framework)
     elif args.command == 'walkforward':
-        run_walkforward(args, backtesting_framework)
+        await run_walkforward(args, backtesting_framework)
     else:
         logger.error(f"알 수 없는 명령: {args.command}")
         sys.exit(1)
@@ -285,4 +313,4 @@ def main():
     logger.info("실행 완료")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
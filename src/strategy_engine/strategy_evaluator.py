@@ -2,18 +2,138 @@
 Strategy evaluator for trading strategies.
 This module handles the evaluation of trading strategies and generates signals.
 """
+import ast
+import functools
 import logging
+import operator
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Union
+import talib
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
-from src.strategy_engine.indicators import (
-    calculate_ema, calculate_sma, calculate_rsi, calculate_ewo,
-    calculate_stoch_rsi, calculate_bollinger_bands, calculate_macd
-)
+
+try:
+    import numexpr
+except ImportError:  # numexpr is optional; expressions are evaluated with numpy without it
+    numexpr = None
 
 logger = logging.getLogger(__name__)
 
+# Periods of the recursive indicators advanced incrementally between calls
+_EMA_PERIODS = (5, 8, 14, 26, 35, 50)
+_RSI_PERIODS = (14, 4)
+
+# Indicator columns added by prepare_dataframes, in the row order of the indicator arrays
+INDICATOR_COLUMNS = (
+    'rsi', 'rsi_fast', 'ema_8', 'ema_14', 'ema_26', 'ema_50', 'sma_200', 'ewo',
+    'bb_upperband', 'bb_middleband', 'bb_lowerband', 'macd', 'macd_signal', 'macd_hist',
+)
+INDICATOR_INDEX = {name: i for i, name in enumerate(INDICATOR_COLUMNS)}
+
+
+def _wilder_state(close: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate Wilder's smoothed average gain and loss (the running state behind talib.RSI)
+    at the last two bars, which is all the incremental update needs.
+    
+    The recursion avg = (avg * (period - 1) + x) / period is an EMA with alpha = 1 / period,
+    i.e. talib.EMA with timeperiod 2 * period - 1. talib seeds the EMA with the mean of its
+    first timeperiod values, so those are all set to Wilder's first-period mean.
+    
+    :param close: Close prices
+    :param period: RSI period
+    :return: Tuple of length-2 arrays (avg_gain, avg_loss) at bars -2 and -1, NaN where
+             the bar lies before the first full period
+    """
+    if len(close) <= period:
+        return np.full(2, np.nan), np.full(2, np.nan)
+    
+    delta = np.diff(close)
+    span = 2 * period - 1
+    
+    def smooth(moves: np.ndarray) -> np.ndarray:
+        seeded = np.empty(len(moves) - period + span)
+        seeded[:span] = moves[:period].mean()
+        seeded[span:] = moves[period:]
+        return talib.EMA(seeded, timeperiod=span)[-2:]
+    
+    # fmax maps NaN moves to 0, like np.where(delta > 0, delta, 0.0)
+    return smooth(np.fmax(delta, 0.0)), smooth(np.fmax(-delta, 0.0))
+
+
+# Operators allowed in expressions evaluated without numexpr (see _eval_expr_node)
+_EXPR_BINOPS = {
+    ast.BitAnd: operator.and_, ast.BitOr: operator.or_,
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+}
+_EXPR_CMPOPS = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge,
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+_EXPR_UNARYOPS = {ast.Invert: operator.invert, ast.USub: operator.neg}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_expr(expr: str) -> ast.expr:
+    """
+    Parse an expression string once per distinct string.
+    
+    :param expr: Expression string
+    :return: Root node of the parsed expression
+    """
+    return ast.parse(expr, mode='eval').body
+
+
+def _eval_expr_node(node: ast.expr, local_dict: Dict[str, Any]) -> Any:
+    """
+    Evaluate a parsed expression with numpy, allowing only names, numeric constants,
+    comparisons, &, |, ~ and arithmetic. Anything else (calls, attributes, subscripts...)
+    is rejected instead of being evaluated.
+    
+    :param node: Expression node
+    :param local_dict: Values of the names used in the expression
+    :return: Result of the expression
+    :raises ValueError: If the expression contains an unsupported element
+    """
+    if isinstance(node, ast.Name):
+        return local_dict[node.id]
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _EXPR_BINOPS:
+        return _EXPR_BINOPS[type(node.op)](_eval_expr_node(node.left, local_dict),
+                                           _eval_expr_node(node.right, local_dict))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _EXPR_UNARYOPS:
+        return _EXPR_UNARYOPS[type(node.op)](_eval_expr_node(node.operand, local_dict))
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in _EXPR_CMPOPS:
+        return _EXPR_CMPOPS[type(node.ops[0])](_eval_expr_node(node.left, local_dict),
+                                               _eval_expr_node(node.comparators[0], local_dict))
+    raise ValueError(f"Unsupported element in expression: {ast.dump(node)}")
+
+
+def evaluate_expr(df: pd.DataFrame, expr: str, variables: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    Evaluate an element-wise expression over dataframe columns in a single pass.
+    
+    Column names are used as variables, e.g. "(rsi < 30) & (close < bb_lowerband)".
+    With numexpr installed the whole expression is compiled once (cached per string) and
+    fused, so no intermediate boolean arrays are allocated for the sub-expressions. Without it,
+    the expression is parsed and evaluated with numpy operators, restricted to names, numeric
+    constants, comparisons, &, |, ~ and arithmetic (no function calls).
+    Pass thresholds through variables instead of formatting them into the string, so the
+    expression stays constant (and cached) whatever the parameter values and their types are.
+    
+    :param df: Dataframe whose columns are referenced by the expression
+    :param expr: Expression string using numpy operator syntax (&, |, ~, comparisons)
+    :param variables: Extra named scalars or arrays for the expression (take precedence over columns)
+    :return: Array with the result for each row
+    """
+    local_dict = {c: df[c].values for c in df.columns}
+    if variables:
+        local_dict.update(variables)
+    if numexpr is not None:
+        return numexpr.evaluate(expr, local_dict=local_dict)
+    return np.asarray(_eval_expr_node(_parse_expr(expr), local_dict))
+
 
 class StrategyEvaluator:
     """
@@ -30,50 +150,224 @@ class StrategyEvaluator:
         self.timeframes = ['5m', '15m', '1h']  # Default timeframes for multi-timeframe analysis
 # DEAD CODE:         self.required_indicators = []
         self.entry_retries = {}  # For slippage protection
+        self.dtype = np.float32  # Output dtype of indicator columns (talib computes in float64)
+        self._indicator_state: Dict[str, Dict] = {}  # Per-timeframe state for incremental indicator updates
+        # Per-timeframe indicator values as one contiguous (len(INDICATOR_COLUMNS), N) array,
+        # one row per indicator (row order given by INDICATOR_INDEX), for numpy-only signal rules
+        self.indicator_arrays: Dict[str, np.ndarray] = {}
         
     def prepare_dataframes(self, dataframes: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
         """
         Prepare dataframes with required indicators for strategy evaluation.
         
+        When a timeframe only gained one bar (or its last bar was updated) since the previous
+        call, the indicators are advanced one step from the cached state instead of being
+        recomputed over the whole history.
+        
         :param dataframes: Dictionary of dataframes for different timeframes
         :return: Dictionary of prepared dataframes
         """
         prepared_dataframes = {}
         
         for timeframe, df in dataframes.items():
-            if df.empty:
-                logger.warning(f"Empty dataframe for timeframe {timeframe}")
-                continue
-                
-            # Create a copy to avoid modifying the original
-            prepared_df = df.copy()
-            
-            # Calculate common indicators
-            prepared_df['rsi'] = calculate_rsi(prepared_df, 14)
-            prepared_df['rsi_fast'] = calculate_rsi(prepared_df, 4)
-            prepared_df['ema_8'] = calculate_ema(prepared_df, 8)
-            prepared_df['ema_14'] = calculate_ema(prepared_df, 14)
-            prepared_df['ema_26'] = calculate_ema(prepared_df, 26)
-            prepared_df['ema_50'] = calculate_ema(prepared_df, 50)
-            prepared_df['sma_200'] = calculate_sma(prepared_df, 200)
-            prepared_df['ewo'] = calculate_ewo(prepared_df)
-            
-            # Calculate Bollinger Bands
-            upper, middle, lower = calculate_bollinger_bands(prepared_df)
-            prepared_df['bb_upperband'] = upper
-            prepared_df['bb_middleband'] = middle
-            prepared_df['bb_lowerband'] = lower
-            
-            # Calculate MACD
-            macd, macd_signal, macd_hist = calculate_macd(prepared_df)
-            prepared_df['macd'] = macd
-            prepared_df['macd_signal'] = macd_signal
-            prepared_df['macd_hist'] = macd_hist
-            
-            prepared_dataframes[timeframe] = prepared_df
+            prepared_df = self._prepare_one(timeframe, df)
+            if prepared_df is not None:
+                prepared_dataframes[timeframe] = prepared_df
             
         return prepared_dataframes
     
+    @staticmethod
+    def evaluate_expr(df: pd.DataFrame, expr: str, variables: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        Evaluate a signal expression over the columns of a prepared dataframe (see evaluate_expr).
+        
+        :param df: Prepared dataframe
+        :param expr: Expression string, e.g. "(rsi < rsi_buy) & (ema_8 > ema_26)"
+        :param variables: Extra named scalars or arrays for the expression, e.g. {'rsi_buy': 30}
+        :return: Array with the result for each row
+        """
+        return evaluate_expr(df, expr, variables)
+    
+    def _prepare_one(self, timeframe: str, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Prepare a single timeframe dataframe with the required indicators.
+        
+        :param timeframe: Timeframe of the dataframe
+        :param df: OHLCV dataframe
+        :return: Prepared dataframe, or None if the dataframe is empty
+        """
+        if df.empty:
+            logger.warning(f"Empty dataframe for timeframe {timeframe}")
+            return None
+        
+        # Extract the close prices once and run the talib function API on the raw array
+        # (avoids the talib.abstract DataFrame wrapper and a conversion per indicator)
+        close = df['close'].to_numpy(dtype=np.float64)
+        
+        columns = self._update_indicators(timeframe, df, close)
+        if columns is None:
+            columns = self._calculate_indicators(timeframe, df, close)
+        
+        # Pack the indicators into one contiguous array, one row per indicator
+        # (stored as self.dtype to halve their memory traffic;
+        # the cached state stays in float64 so incremental updates keep full precision)
+        ind = np.empty((len(INDICATOR_COLUMNS), len(df)), dtype=self.dtype)
+        for i, name in enumerate(INDICATOR_COLUMNS):
+            ind[i] = columns[name]
+        self.indicator_arrays[timeframe] = ind
+        
+        # Build a new frame instead of modifying the original, adding all indicator columns in one concat
+        indicators = pd.DataFrame(ind.T, index=df.index, columns=list(INDICATOR_COLUMNS), copy=False)
+        existing = df.columns.intersection(indicators.columns)
+        base = df.drop(columns=existing) if len(existing) else df
+        return pd.concat([base, indicators], axis=1)
+    
+    def _calculate_indicators(self, timeframe: str, df: pd.DataFrame, close: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate all indicators over the full history and store the incremental state.
+        
+        :param timeframe: Timeframe of the dataframe
+        :param df: OHLCV dataframe
+        :param close: Close prices as float64 array
+        :return: Dictionary of indicator columns
+        """
+        emas = {period: talib.EMA(close, timeperiod=period) for period in _EMA_PERIODS}
+        wilder = {period: _wilder_state(close, period) for period in _RSI_PERIODS}
+        
+        # Calculate Bollinger Bands and MACD
+        upper, middle, lower = talib.BBANDS(close, timeperiod=20, nbdevup=2.0, nbdevdn=2.0)
+        macd, macd_signal, macd_hist = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+        
+        columns = {
+            'rsi': talib.RSI(close, timeperiod=14),
+            'rsi_fast': talib.RSI(close, timeperiod=4),
+            'ema_8': emas[8],
+            'ema_14': emas[14],
+            'ema_26': emas[26],
+            'ema_50': emas[50],
+            'sma_200': talib.SMA(close, timeperiod=200),
+            # Elliott Wave Oscillator (EMA 5 / EMA 35, same as calculate_ewo)
+            'ewo': (emas[5] - emas[35]) / close * 100,
+            'bb_upperband': upper,
+            'bb_middleband': middle,
+            'bb_lowerband': lower,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_hist': macd_hist,
+        }
+        
+        if len(close) >= 2:
+            def recursive_state(i: int) -> Dict[str, float]:
+                state = {f'ema_{period}': emas[period][i] for period in _EMA_PERIODS}
+                for period in _RSI_PERIODS:
+                    state[f'avg_gain_{period}'] = wilder[period][0][i]
+                    state[f'avg_loss_{period}'] = wilder[period][1][i]
+                # The MACD slow EMA is the plain EMA(26), so its fast EMA is macd + EMA(26)
+                state['macd_fast'] = macd[i] + emas[26][i]
+                state['macd_signal'] = macd_signal[i]
+                return state
+            
+            self._indicator_state[timeframe] = {
+                'last_ts': df.index[-1],
+                'length': len(close),
+                'last_close': close[-1],
+                'prev_close': close[-2],
+                'prev': recursive_state(-2),
+                'cur': recursive_state(-1),
+                'columns': columns,
+            }
+        else:
+            self._indicator_state.pop(timeframe, None)
+        
+        return columns
+    
+    def _update_indicators(self, timeframe: str, df: pd.DataFrame, close: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Advance the cached indicators by one bar.
+        
+        :param timeframe: Timeframe of the dataframe
+        :param df: OHLCV dataframe
+        :param close: Close prices as float64 array
+        :return: Dictionary of indicator columns, or None if a full recompute is needed
+        """
+        state = self._indicator_state.get(timeframe)
+        if state is None:
+            return None
+        
+        n = len(close)
+        if n == state['length'] and df.index[-1] == state['last_ts'] and close[-2] == state['prev_close']:
+            # Last bar updated in place: recompute it from the state of the bar before
+            base = state['prev']
+        elif n == state['length'] + 1 and df.index[-2] == state['last_ts'] and close[-2] == state['last_close']:
+            # One new bar appended
+            base = state['cur']
+        else:
+            return None
+        
+        if any(np.isnan(value) for value in base.values()):
+            return None
+        
+        price = close[-1]
+        delta = price - close[-2]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        
+        cur = {}
+        for period in _EMA_PERIODS:
+            prev_ema = base[f'ema_{period}']
+            cur[f'ema_{period}'] = prev_ema + (price - prev_ema) * 2 / (period + 1)
+        
+        rsi = {}
+        for period in _RSI_PERIODS:
+            avg_gain = (base[f'avg_gain_{period}'] * (period - 1) + gain) / period
+            avg_loss = (base[f'avg_loss_{period}'] * (period - 1) + loss) / period
+            cur[f'avg_gain_{period}'] = avg_gain
+            cur[f'avg_loss_{period}'] = avg_loss
+            total = avg_gain + avg_loss
+            rsi[period] = 100 * avg_gain / total if total else 0.0
+        
+        macd_fast = base['macd_fast'] + (price - base['macd_fast']) * 2 / 13
+        macd = macd_fast - cur['ema_26']
+        macd_signal = base['macd_signal'] + (macd - base['macd_signal']) * 2 / 10
+        cur['macd_fast'] = macd_fast
+        cur['macd_signal'] = macd_signal
+        
+        window = close[-20:]
+        bb_middle = window.mean()
+        bb_std = window.std()
+        
+        last_row = {
+            'rsi': rsi[14],
+            'rsi_fast': rsi[4],
+            'ema_8': cur['ema_8'],
+            'ema_14': cur['ema_14'],
+            'ema_26': cur['ema_26'],
+            'ema_50': cur['ema_50'],
+            'sma_200': close[-200:].mean() if n >= 200 else np.nan,
+            'ewo': (cur['ema_5'] - cur['ema_35']) / price * 100,
+            'bb_upperband': bb_middle + 2.0 * bb_std,
+            'bb_middleband': bb_middle,
+            'bb_lowerband': bb_middle - 2.0 * bb_std,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_hist': macd - macd_signal,
+        }
+        
+        cached = state['columns']
+        columns = {name: np.append(cached[name][:n - 1], value) for name, value in last_row.items()}
+        
+        self._indicator_state[timeframe] = {
+            'last_ts': df.index[-1],
+            'length': n,
+            'last_close': price,
+            'prev_close': close[-2],
+            'prev': base,
+            'cur': cur,
+            'columns': columns,
+        }
+        
+        return columns
+    
 # DEAD CODE:     def evaluate_generic_strategy(self, dataframes: Dict[str, pd.DataFrame], strategy_name: str, params: Dict) -> Dict[str, Dict[str, Union[bool, float]]]:
         """
         Generic strategy evaluation method that delegates to specific strategy implementations.
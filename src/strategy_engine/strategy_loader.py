@@ -9,11 +9,12 @@
 
 import os
 import sys
+import functools
 import importlib
 import inspect
+import pkgutil
 import logging
 from typing import List, Dict, Any, Type, Optional
-import glob
 
 from src.utils.logging_config import setup_logging
 
@@ -21,6 +22,30 @@ from src.utils.logging_config import setup_logging
 logger = logging.getLogger(__name__)
 setup_logging()
 
+# 파라미터로 수집하는 속성 값 타입 (정확히 일치하는 타입만 허용)
+_SCALAR_TYPES = (int, float, str, bool)
+
+
+def _cached_import(module_path: str):
+    """
+    모듈 임포트 (이미 로드가 끝난 모듈은 sys.modules에서 바로 반환하여
+    importlib.import_module의 임포트 락 획득과 finder 탐색을 생략)
+    """
+    module = sys.modules.get(module_path)
+    spec = getattr(module, '__spec__', None)
+    if spec is not None and getattr(spec, '_initializing', False) is False:
+        return module
+    return importlib.import_module(module_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_strategy_class(module_path: str, class_name: str) -> Optional[Type]:
+    """
+    전략 모듈을 임포트하고 class_name 속성 반환 (없으면 None, 결과 캐시 / 임포트 실패는 캐시하지 않음)
+    """
+    return getattr(_cached_import(module_path), class_name, None)
+
+
 class StrategyLoader:
     """
     트레이딩 전략 로더 클래스
@@ -47,52 +72,90 @@ class StrategyLoader:
         if not os.path.exists(self.strategies_dir):
             logger.warning(f"Strategies directory not found: {self.strategies_dir}")
         
-        # 전략 디렉토리를 Python 경로에 추가
-        if self.strategies_dir not in sys.path:
-            sys.path.insert(0, os.path.dirname(self.strategies_dir))
+        # 전략 디렉토리의 상위 디렉토리를 Python 경로에 추가 ('strategies' 패키지로 임포트, 이미 있으면 생략)
+        strategies_parent = os.path.dirname(self.strategies_dir)
+        if strategies_parent not in sys.path:
+            sys.path.insert(0, strategies_parent)
+        
+        # 전략 이름 -> 클래스 캐시 (첫 조회 시 _scan()으로 채움, refresh()로 무효화)
+        self._class_cache: Dict[str, Type] = {}
+        self._scanned = False
+        # 전략 디렉토리의 모듈 이름 목록 (목록 조회와 _scan()이 공유, refresh()로 무효화)
+        self._module_names: Optional[List[str]] = None
+        # 전략 이름 -> 파라미터 캐시 (invalidate_params()로 무효화)
+        self._param_cache: Dict[str, Dict[str, Any]] = {}
     
-    def list_available_strategies(self) -> List[str]:
+    def _scan(self):
         """
-        사용 가능한 전략 목록 조회
-        
-        Returns:
-            List[str]: 사용 가능한 전략 이름 목록
+        전략 디렉토리를 한 번 스캔하여 전략 모듈에 정의된 클래스를 이름별로 캐시
+        (이미 캐시된 클래스는 유지)
         """
-        strategies = []
-        
         try:
-            # 전략 디렉토리에서 Python 파일 찾기
-            strategy_files = glob.glob(os.path.join(self.strategies_dir, "*.py"))
-            
-            for file_path in strategy_files:
-                file_name = os.path.basename(file_path)
-                
-                # __init__.py 파일 제외
-                if file_name == "__init__.py":
-                    continue
-                
-                # 파일 이름에서 .py 확장자 제거
-                module_name = file_name[:-3]
+            for module_name in self._get_module_names():
+                file_name = f"{module_name}.py"
                 
                 try:
                     # 모듈 동적 로드
-                    module = importlib.import_module(f"strategies.{module_name}")
+                    module = _cached_import(f"strategies.{module_name}")
                     
-                    # 모듈에서 전략 클래스 찾기
-                    for name, obj in inspect.getmembers(module):
-                        # 클래스이고, 모듈에 정의된 클래스이며, 'Strategy'로 끝나는 이름인 경우
-                        if (inspect.isclass(obj) and 
-                            obj.__module__ == module.__name__ and 
-                            (name.endswith('Strategy') or name.endswith('_strategy'))):
-                            strategies.append(name)
+                    # 모듈에 정의된 클래스 캐시 (같은 이름은 먼저 발견된 클래스 유지)
+                    for name, obj in vars(module).items():
+                        if isinstance(obj, type) and obj.__module__ == module.__name__:
+                            self._class_cache.setdefault(name, obj)
                 
                 except (ImportError, AttributeError) as e:
                     logger.error(f"Failed to load strategy from {file_name}: {str(e)}")
         
         except Exception as e:
-            logger.error(f"Error while listing available strategies: {str(e)}")
+            logger.error(f"Error while scanning strategies directory: {str(e)}")
         
-        return strategies
+        self._scanned = True
+    
+    def _get_module_names(self) -> List[str]:
+        """
+        전략 디렉토리의 모듈 이름 목록 조회 (임포트 없이 디렉토리를 한 번만 조회하고 캐시)
+        
+        Returns:
+            List[str]: 모듈 이름 목록 (디렉토리가 없으면 빈 목록)
+        """
+        if self._module_names is None:
+            self._module_names = [module.name for module in pkgutil.iter_modules([self.strategies_dir])
+                                  if not module.ispkg and module.name != '__init__']
+        return self._module_names
+    
+    def refresh(self):
+        """
+        캐시된 전략 클래스 목록 무효화 (다음 조회 시 전략 디렉토리를 다시 스캔)
+        """
+        self._class_cache = {}
+        self._scanned = False
+        self._module_names = None
+        self._param_cache = {}
+        _resolve_strategy_class.cache_clear()
+    
+    def invalidate_params(self, strategy_name: Optional[str] = None):
+        """
+        캐시된 전략 파라미터 무효화
+        
+        Args:
+            strategy_name (Optional[str]): 무효화할 전략 이름 (None이면 전체)
+        """
+        if strategy_name is None:
+            self._param_cache.clear()
+        else:
+            self._param_cache.pop(strategy_name, None)
+    
+    def list_available_strategies(self) -> List[str]:
+        """
+        사용 가능한 전략 목록 조회
+        
+        전략 모듈을 임포트(실행)하지 않고 전략 디렉토리의 모듈 이름만 조회합니다.
+        전략 클래스 이름은 모듈 이름과 같다는 규칙을 따르므로 반환된 이름을 그대로 load_strategy()에 사용할 수 있습니다.
+        
+        Returns:
+            List[str]: 사용 가능한 전략 이름 목록
+        """
+        return list(self._get_module_names())
     
     def load_strategy(self, strategy_name: str) -> Type:
         """
@@ -106,37 +169,45 @@ class StrategyLoader:
         
         Raises:
             ImportError: 전략을 찾을 수 없는 경우
-            AttributeError: 전략 클래스를 찾을 수 없는 경우
         """
-        # 전략 디렉토리에서 Python 파일 찾기
-        strategy_files = glob.glob(os.path.join(self.strategies_dir, "*.py"))
+        strategy_class = self._class_cache.get(strategy_name)
+        if strategy_class is not None:
+            return strategy_class
         
-        for file_path in strategy_files:
-            file_name = os.path.basename(file_path)
-            
-            # __init__.py 파일 제외
-            if file_name == "__init__.py":
-                continue
-            
-            # 파일 이름에서 .py 확장자 제거
-            module_name = file_name[:-3]
-            
-            try:
-                # 모듈 동적 로드
-                module = importlib.import_module(f"strategies.{module_name}")
-                
-                # 모듈에서 전략 클래스 찾기
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) and 
-                        obj.__module__ == module.__name__ and 
-                        name == strategy_name):
-                        return obj
+        if not self._scanned:
+            # 전략 이름과 같은 이름의 모듈을 먼저 시도 (일치하면 전체 디렉토리 스캔 생략)
+            strategy_class = self._import_by_module_name(strategy_name)
+            if strategy_class is not None:
+                self._class_cache[strategy_name] = strategy_class
+                return strategy_class
             
-            except ImportError:
-                continue
+            self._scan()
         
-        # 전략을 찾지 못한 경우
-        raise ImportError(f"Strategy '{strategy_name}' not found")
+        try:
+            return self._class_cache[strategy_name]
+        except KeyError:
+            # 전략을 찾지 못한 경우
+            raise ImportError(f"Strategy '{strategy_name}' not found") from None
+    
+    def _import_by_module_name(self, strategy_name: str) -> Optional[Type]:
+        """
+        전략 이름과 같은 이름의 모듈에서 전략 클래스 조회
+        
+        Args:
+            strategy_name (str): 전략 이름
+        
+        Returns:
+            Optional[Type]: 전략 클래스 (모듈이나 클래스가 없으면 None)
+        """
+        module_path = f"strategies.{strategy_name}"
+        try:
+            strategy_class = _resolve_strategy_class(module_path, strategy_name)
+        except ImportError:
+            return None
+        
+        if inspect.isclass(strategy_class) and strategy_class.__module__ == module_path:
+            return strategy_class
+        return None
     
     def get_strategy_parameters(self, strategy_name: str) -> Dict[str, Any]:
         """
@@ -146,31 +217,40 @@ class StrategyLoader:
             strategy_name (str): 전략 이름
         
         Returns:
-            Dict[str, Any]: 전략 파라미터
+            Dict[str, Any]: 전략 파라미터 (캐시의 복사본이므로 수정해도 다른 호출에 영향 없음)
         
         Raises:
             ImportError: 전략을 찾을 수 없는 경우
         """
+        cached = self._param_cache.get(strategy_name)
+        if cached is not None:
+            return dict(cached)
+        
         try:
             # 전략 클래스 로드
             strategy_class = self.load_strategy(strategy_name)
             
-            # 전략 인스턴스 생성
-            strategy_instance = strategy_class({})
-            
-            # 기본 파라미터 가져오기
-            if hasattr(strategy_instance, 'default_params'):
-                return strategy_instance.default_params
+            # 기본 파라미터 가져오기 (생성 비용이 큰 전략이 있으므로 인스턴스를 만들지 않고 클래스에서 직접 조회)
+            default_params = getattr(strategy_class, 'default_params', None)
+            if default_params is not None:
+                params = dict(default_params)
             else:
                 # 기본 파라미터가 없는 경우, 클래스 속성 중 파라미터로 사용될 수 있는 것들 수집
+                # (상속 순서대로 클래스 __dict__를 읽어 하위 클래스 값이 우선, 프로퍼티는 호출하지 않음)
                 params = {}
-                for attr_name in dir(strategy_instance):
-                    if not attr_name.startswith('_') and not callable(getattr(strategy_instance, attr_name)):
-                        attr_value = getattr(strategy_instance, attr_name)
-                        if isinstance(attr_value, (int, float, str, bool)):
+                for klass in reversed(strategy_class.__mro__):
+                    for attr_name, attr_value in vars(klass).items():
+                        if type(attr_value) in _SCALAR_TYPES and not attr_name.startswith('_'):
                             params[attr_name] = attr_value
                 
-                return params
+                # 하이퍼옵트 파라미터 (buy_params/sell_params) 포함
+                for attr_name in ('buy_params', 'sell_params'):
+                    hyperopt_params = getattr(strategy_class, attr_name, None)
+                    if isinstance(hyperopt_params, dict):
+                        params.update(hyperopt_params)
+            
+            self._param_cache[strategy_name] = params
+            return dict(params)
         
         except Exception as e:
             logger.error(f"Failed to get strategy parameters: {str(e)}")
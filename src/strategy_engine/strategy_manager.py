@@ -7,16 +7,54 @@ import importlib
 import inspect
 import os
 import sys
-import json
-from typing import Dict, List, Optional, Any, Type, Union
+from typing import Dict, List, Optional, Any, Type, Union, TYPE_CHECKING
 from pathlib import Path
-import pandas as pd
 
-from src.strategy_engine.strategy_evaluator import StrategyEvaluator
-from src.strategy_engine.nasos_strategy import NASOSStrategy
+import orjson
+
+# Import helpers shared with StrategyLoader (one lru_cache, so StrategyLoader.refresh() and
+# StrategyManager.clear_import_cache() both invalidate the classes resolved by either)
+from src.strategy_engine.strategy_loader import _resolve_strategy_class
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# pandas/talib-backed classes imported on first use (see __getattr__)
+_LAZY_IMPORTS = {
+    'StrategyEvaluator': 'src.strategy_engine.strategy_evaluator',
+    'NASOSStrategy': 'src.strategy_engine.nasos_strategy',
+}
+
+
+def __getattr__(name: str):
+    """
+    Resolve StrategyEvaluator/NASOSStrategy lazily so importing this module does not load
+    pandas and the indicator stack.
+    """
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def _list_modules(directory: Path) -> List[str]:
+    """
+    List the Python module names in a directory (excluding __init__) with a single scandir pass.
+    
+    :param directory: Directory to scan
+    :return: Module names, empty if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [entry.name[:-3] for entry in it
+                    if entry.name.endswith('.py') and entry.name != '__init__.py' and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
 
 class StrategyManager:
     """
@@ -34,6 +72,20 @@ class StrategyManager:
         self.active_strategy = None
         self.evaluator = None
         self.nasos_strategy = None
+        # Default parameters per strategy name, see get_strategy_parameters
+        self._param_cache: Dict[str, Dict] = {}
+        # Strategy module paths that do not exist (see _resolve_class)
+        self._missing: set = set()
+        
+        # Strategy directories, resolved once against the working directory at construction
+        cwd = Path(os.getcwd())
+        self._user_strategy_dir = cwd / 'user_data' / 'strategies'
+        self._builtin_strategy_dir = cwd / 'src' / 'strategies'
+        
+        # Make user_data/strategies importable as the 'strategies' package (once, not per load)
+        user_data_path = str(self._user_strategy_dir.parent)
+        if user_data_path not in sys.path:
+            sys.path.insert(0, user_data_path)
         
         if config_path:
             self.load_config(config_path)
@@ -45,9 +97,12 @@ class StrategyManager:
         :param config_path: Path to the configuration file
         :return: Configuration dictionary
         """
+        from src.strategy_engine.strategy_evaluator import StrategyEvaluator
+        from src.strategy_engine.nasos_strategy import NASOSStrategy
+        
         try:
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            with open(config_path, 'rb') as f:
+                self.config = orjson.loads(f.read())
             
             logger.info(f"Loaded configuration from {config_path}")
             
@@ -74,49 +129,82 @@ class StrategyManager:
         :return: True if successful, False otherwise
         """
         try:
-            # First try to load from user_data/strategies
-            user_strategy_path = Path(os.getcwd()) / 'user_data' / 'strategies'
-            sys.path.insert(0, str(user_strategy_path.parent))
-            
-            try:
-                module = importlib.import_module(f"strategies.{strategy_name}")
-                
-                # Find the strategy class in the module
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isclass(obj) and name == strategy_name:
-                        self.strategies[strategy_name] = obj
-                        self.active_strategy = strategy_name
-                        logger.info(f"Loaded strategy {strategy_name} from user_data/strategies")
-                        return True
-            except ImportError:
-                logger.warning(f"Strategy {strategy_name} not found in user_data/strategies")
-            
-            # If not found, try to load from built-in strategies
-            try:
-                module = importlib.import_module(f"src.strategies.{strategy_name}")
+            last_err = None
+            # Try user_data/strategies first, then the built-in strategies
+            for module_path, source in ((f"strategies.{strategy_name}", "user_data/strategies"),
+                                        (f"src.strategies.{strategy_name}", "built-in strategies")):
+                try:
+                    obj = self._resolve_class(module_path, strategy_name)
+                except ImportError as e:
+                    # A module that exists but fails to import is more relevant than a missing one
+                    if last_err is None or module_path not in self._missing:
+                        last_err = e
+                    continue
                 
-                # Find the strategy class in the module
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isclass(obj) and name == strategy_name:
-                        self.strategies[strategy_name] = obj
-                        self.active_strategy = strategy_name
-                        logger.info(f"Loaded strategy {strategy_name} from built-in strategies")
-                        return True
-            except ImportError:
-                logger.error(f"Strategy {strategy_name} not found in built-in strategies")
+                if inspect.isclass(obj):
+                    self.strategies[strategy_name] = obj
+                    self._param_cache.pop(strategy_name, None)
+                    self.active_strategy = strategy_name
+                    logger.info(f"Loaded strategy {strategy_name} from {source}")
+                    return True
             
-            logger.error(f"Strategy {strategy_name} not found")
+            if last_err is not None:
+                logger.error(f"Strategy {strategy_name} not found: {last_err}")
+            else:
+                logger.error(f"Strategy {strategy_name} not found")
             return False
         except Exception as e:
             logger.error(f"Error loading strategy {strategy_name}: {e}")
             return False
     
+    def _resolve_class(self, module_path: str, class_name: str) -> Optional[Type]:
+        """
+        Resolve a strategy class, remembering modules that do not exist so they are not retried.
+        
+        Only a missing module (or missing parent package) is remembered; an ImportError raised
+        while importing an existing module (e.g. a missing dependency of the strategy) is raised
+        again on every call.
+        
+        :param module_path: Dotted module path
+        :param class_name: Name of the class in the module
+        :return: The attribute named class_name, or None if the module does not define it
+        :raises ImportError: If the module could not be imported (now or on an earlier call)
+        """
+        if module_path in self._missing:
+            raise ModuleNotFoundError(f"No module named {module_path!r} (cached)", name=module_path)
+        
+        try:
+            return _resolve_strategy_class(module_path, class_name)
+        except ModuleNotFoundError as e:
+            # The module or one of its parent packages does not exist
+            if e.name == module_path or module_path.startswith(f"{e.name}."):
+                self._missing.add(module_path)
+            raise
+    
+    def clear_import_cache(self):
+        """
+        Forget resolved and failed strategy imports so the next load_strategy retries them.
+        """
+        _resolve_strategy_class.cache_clear()
+        self._missing.clear()
+    
+    def invalidate_params(self, strategy_name: str = None):
+        """
+        Drop cached default parameters.
+        
+        :param strategy_name: Strategy whose parameters to drop (default: all strategies)
+        """
+        if strategy_name is None:
+            self._param_cache.clear()
+        else:
+            self._param_cache.pop(strategy_name, None)
+    
     def get_strategy_parameters(self, strategy_name: str = None) -> Dict:
         """
         Get parameters for a specific strategy.
         
         :param strategy_name: Name of the strategy (default: active strategy)
-        :return: Dictionary of strategy parameters
+        :return: Dictionary of strategy parameters (cached defaults are returned as a copy)
         """
         if strategy_name is None:
             strategy_name = self.active_strategy
@@ -131,6 +219,10 @@ class StrategyManager:
         
         # Otherwise, use default parameters from strategy class
         if strategy_name in self.strategies:
+            cached = self._param_cache.get(strategy_name)
+            if cached is not None:
+                return dict(cached)
+            
             strategy_class = self.strategies[strategy_name]
             
             # Check if strategy has buy_params and sell_params
@@ -140,11 +232,12 @@ class StrategyManager:
             if hasattr(strategy_class, 'sell_params'):
                 params.update(strategy_class.sell_params)
             
-            return params
+            self._param_cache[strategy_name] = params
+            return dict(params)
         
         return {}
     
-# DEAD CODE:     def evaluate_strategy(self, dataframes: Dict[str, pd.DataFrame], strategy_name: str = None) -> Dict[str, Dict[str, Any]]:
+# DEAD CODE:     def evaluate_strategy(self, dataframes: Dict[str, "pd.DataFrame"], strategy_name: str = None) -> Dict[str, Dict[str, Any]]:
         """
         Evaluate a strategy on the given dataframes.
         
@@ -209,20 +302,14 @@ class StrategyManager:
         
         :return: List of strategy names
         """
-        strategies = []
-        
         # Check user_data/strategies directory
-        user_strategy_path = Path(os.getcwd()) / 'user_data' / 'strategies'
-        if user_strategy_path.exists():
-            for file in user_strategy_path.glob('*.py'):
-                if file.stem != '__init__':
-                    strategies.append(file.stem)
-        
-        # Check built-in strategies
-        builtin_strategy_path = Path(os.getcwd()) / 'src' / 'strategies'
-        if builtin_strategy_path.exists():
-            for file in builtin_strategy_path.glob('*.py'):
-                if file.stem != '__init__' and file.stem not in strategies:
-                    strategies.append(file.stem)
+        strategies = _list_modules(self._user_strategy_dir)
+        seen = set(strategies)
+        
+        # Check built-in strategies (user strategies with the same name take precedence)
+        for name in _list_modules(self._builtin_strategy_dir):
+            if name not in seen:
+                seen.add(name)
+                strategies.append(name)
         
         return strategies
@@ -7,16 +7,30 @@
 """
 
 import os
-import json
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+import orjson
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime
 import seaborn as sns
 
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:  # tsdownsample은 선택 의존성 (없으면 numpy 구간별 최소/최대 다운샘플링 사용)
+    MinMaxLTTBDownsampler = None
+
+try:
+    import plotly.graph_objects as go
+    from plotly_resampler import FigureResampler
+except ImportError:  # plotly-resampler는 선택 의존성 (없으면 대화형 자본금 곡선을 사용할 수 없음)
+    go = None
+    FigureResampler = None
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +38,125 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 차트 작업 프로세스 풀의 기본 프로세스 수 (보고서 차트 5개)
+_CHART_WORKERS = min(5, os.cpu_count() or 1)
+# 작업 프로세스 풀에서 차트를 생성할 최소 거래 수 (선 차트/산점도는 다운샘플링되므로 그보다 적으면 순차 생성이 더 빠름)
+_PARALLEL_MIN_TRADES = 10000
+
+# 결과 JSON 직렬화 옵션 (들여쓰기, 문자열이 아닌 키 및 numpy 값 허용)
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# 차트 PNG 저장 해상도 (PNG 인코딩 시간은 픽셀 수에 비례)
+_SAVE_DPI = 150
+# 선 차트에 그리는 최대 점 수 (figsize 12인치 x dpi 150 기준 픽셀 폭의 약 1.3배)
+_DOWNSAMPLE_POINTS = 2400
+# 승/패 산점도에 그리는 최대 점 수 (각각)
+_MAX_SCATTER_POINTS = 5000
+
+
+def _downsample_xy(dates: np.ndarray, values: np.ndarray, n_out: int = _DOWNSAMPLE_POINTS) -> np.ndarray:
+    """
+    선 차트용 다운샘플링 인덱스 계산 (MinMaxLTTB, 미설치 시 구간별 최소/최대 값 유지)
+    
+    Args:
+        dates: 정렬된 x 값 (datetime64 또는 정수)
+        values: y 값
+        n_out: 최대 출력 점 수
+        
+    Returns:
+        np.ndarray: 유지할 행 인덱스 (오름차순, 데이터가 n_out보다 적으면 전체)
+    """
+    n = len(values)
+    if n <= n_out:
+        return np.arange(n)
+    
+    if MinMaxLTTBDownsampler is not None:
+        x = np.asarray(dates).astype('datetime64[ns]').view(np.int64)
+        return np.asarray(MinMaxLTTBDownsampler().downsample(x, np.asarray(values, dtype=np.float64), n_out=n_out))
+    
+    # 같은 크기의 구간으로 나누어 구간별 최소/최대 점과 양 끝 점 유지
+    n_bins = n_out // 2
+    size = -(-n // n_bins)
+    padded = np.pad(np.asarray(values, dtype=np.float64), (0, size * n_bins - n), mode='edge').reshape(n_bins, size)
+    offsets = np.arange(n_bins) * size
+    idx = np.concatenate(([0, n - 1], offsets + padded.argmin(axis=1), offsets + padded.argmax(axis=1)))
+    return np.unique(np.minimum(idx, n - 1))
+
+
+def _sample_indices(mask: np.ndarray, max_points: int = _MAX_SCATTER_POINTS) -> np.ndarray:
+    """
+    산점도용 인덱스 선택 (mask가 참인 행에서 시간 순서대로 고르게 최대 max_points개)
+    
+    Args:
+        mask: 선택 대상 행 마스크
+        max_points: 최대 점 수
+        
+    Returns:
+        np.ndarray: 선택된 행 인덱스
+    """
+    idx = np.flatnonzero(mask)
+    if len(idx) > max_points:
+        idx = idx[np.linspace(0, len(idx) - 1, max_points).astype(np.int64)]
+    return idx
+
+
+def _set_date_axis(ax: plt.Axes) -> None:
+    """
+    x축에 날짜 눈금 설정 (AutoDateLocator + ConciseDateFormatter)
+    
+    로케이터/포매터는 Axis에 연결되므로 Axes마다 새로 생성합니다.
+    
+    Args:
+        ax: 날짜 x축을 가진 Axes
+    """
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+
+def _cumulative_drawdown(ratios: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    거래별 수익 비율로 누적 수익, 고점, 드로다운 계산
+    
+    누적 곱 대신 로그 수익의 누적 합(log1p -> cumsum -> expm1)으로 계산하여 긴 시계열에서도
+    오차가 누적되지 않으며, NaN 수익은 건너뜁니다 (해당 행의 누적 수익과 드로다운은 NaN).
+    
+    Args:
+        ratios: 시간순 거래별 수익 비율 (0.01 = 1%)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (누적 수익 비율, 누적 수익 고점, 드로다운(%))
+    """
+    log_returns = np.log1p(ratios)
+    missing = np.isnan(log_returns)
+    cumulative_profit = np.expm1(np.cumsum(np.where(missing, 0.0, log_returns)))
+    cumulative_profit[missing] = np.nan
+    peak = np.fmax.accumulate(cumulative_profit)
+    drawdown = (cumulative_profit - peak) * 100  # 퍼센트로 변환
+    return cumulative_profit, peak, drawdown
+
+
+def _trades_to_columns(trades: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    차트에 필요한 거래 필드만 컬럼 배열로 추출 (거래 딕셔너리 전체를 DataFrame으로 변환하지 않음)
+    
+    필드 존재 여부는 첫 번째 거래 기준으로 판단하며, 값이 없는 거래는 NaN/NaT로 채웁니다.
+    
+    Args:
+        trades: 거래 딕셔너리 리스트
+        
+    Returns:
+        Dict[str, Any]: 컬럼 이름 -> 배열 (close_date, profit_percent, profit_ratio 중 존재하는 필드)
+    """
+    first = trades[0]
+    columns = {}
+    if 'close_date' in first:
+        columns['close_date'] = pd.to_datetime([t.get('close_date') for t in trades])
+    for key in ('profit_percent', 'profit_ratio'):
+        if key in first:
+            columns[key] = np.array([t.get(key) for t in trades], dtype=np.float64)
+    return columns
+
 class BacktestVisualizer:
     """백테스트 결과 시각화 클래스"""
     
@@ -40,90 +173,218 @@ class BacktestVisualizer:
         # 시각화 스타일 설정
         plt.style.use('seaborn-v0_8-darkgrid')
         sns.set_context("talk")
+        # 긴 선 경로를 나누어 렌더링 (Agg 경로 크기 제한 방지 및 렌더링 속도 향상)
+        plt.rcParams['path.simplify'] = True
+        plt.rcParams['agg.path.chunksize'] = 10000
         
-    def plot_equity_curve(self, backtest_results: Dict[str, Any], title: str = "Equity Curve", 
-                         save_path: Optional[str] = None) -> None:
+        # 마지막으로 변환한 거래 DataFrame 캐시 (backtest_results 객체, DataFrame)
+        self._trades_df_cache: Optional[Tuple[Dict[str, Any], pd.DataFrame]] = None
+    
+    def _prepare_trades_df(self, backtest_results: Dict[str, Any]) -> Optional[pd.DataFrame]:
         """
-        자본금 곡선 시각화
+        차트 공통 거래 DataFrame 생성 (같은 결과 객체에 대해서는 캐시된 DataFrame 반환)
+        
+        close_date가 있으면 시간대 없는 datetime으로 변환 후 정렬하며,
+        수익 데이터가 있으면 profit_percent, cumulative_profit, peak, drawdown(%) 컬럼을 추가합니다.
+        반환된 DataFrame은 여러 차트가 공유하므로 수정하면 안 됩니다.
         
         Args:
             backtest_results: 백테스트 결과 딕셔너리
-            title: 차트 제목
-            save_path: 저장 경로 (None이면 저장하지 않음)
+            
+        Returns:
+            Optional[pd.DataFrame]: 거래 DataFrame (거래 데이터가 없으면 None)
         """
-        if 'trades' not in backtest_results or not backtest_results['trades']:
-            logger.warning("거래 데이터가 없어 자본금 곡선을 그릴 수 없습니다.")
-            return
+        cached = self._trades_df_cache
+        if cached is not None and cached[0] is backtest_results:
+            return cached[1]
         
-        trades = backtest_results['trades']
+        trades = backtest_results.get('trades')
+        if not trades:
+            return None
         
-        # 거래 데이터를 DataFrame으로 변환
-        df = pd.DataFrame(trades)
+        # 차트에 쓰는 필드만 컬럼 단위로 DataFrame 생성
+        df = pd.DataFrame(_trades_to_columns(trades))
         
         # 날짜 형식 변환
         if 'close_date' in df.columns:
-            df['close_date'] = pd.to_datetime(df['close_date'])
+            close_dates = pd.to_datetime(df['close_date'])
+            if close_dates.dt.tz is not None:
+                # 시간대 정보는 해당 시간대의 현지 시각으로 제거 (tz-aware 날짜는 변환 및 눈금 포맷이 느림)
+                close_dates = close_dates.dt.tz_localize(None)
+            df['close_date'] = close_dates
             df = df.sort_values('close_date')
         
-        # 누적 수익 계산
+        # 누적 수익 및 드로다운 계산
         if 'profit_percent' in df.columns:
-            df['cumulative_profit'] = (1 + df['profit_percent'] / 100).cumprod() - 1
+            ratios = df['profit_percent'].to_numpy(dtype=np.float64) / 100
         elif 'profit_ratio' in df.columns:
-            df['cumulative_profit'] = (1 + df['profit_ratio']).cumprod() - 1
+            # profit_ratio를 퍼센트로 변환
+            ratios = df['profit_ratio'].to_numpy(dtype=np.float64)
+            df['profit_percent'] = ratios * 100
         else:
+            ratios = None
+        
+        if ratios is not None:
+            cumulative_profit, peak, drawdown = _cumulative_drawdown(ratios)
+            df['cumulative_profit'] = cumulative_profit
+            df['peak'] = peak
+            df['drawdown'] = drawdown
+        
+        self._trades_df_cache = (backtest_results, df)
+        return df
+        
+    def _get_axes(self, ax: Optional[plt.Axes], figsize: Tuple[float, float]) -> Tuple[plt.Figure, plt.Axes, bool]:
+        """
+        차트를 그릴 Figure/Axes 준비
+        
+        Args:
+            ax: 재사용할 Axes (None이면 새 Figure 생성)
+            figsize: Figure 크기 (인치)
+            
+        Returns:
+            Tuple[plt.Figure, plt.Axes, bool]: (Figure, Axes, 이 함수에서 Figure를 생성했는지 여부)
+        """
+        if ax is None:
+            fig, ax = plt.subplots(figsize=figsize)
+            return fig, ax, True
+        
+        fig = ax.figure
+        if tuple(fig.get_size_inches()) != figsize:
+            fig.set_size_inches(figsize)
+        return fig, ax, False
+    
+    def _finish_figure(self, fig: plt.Figure, save_path: Optional[str], owns_figure: bool, saved_message: str) -> None:
+        """
+        차트 레이아웃 정리 후 저장 또는 표시
+        
+        Args:
+            fig: 차트 Figure
+            save_path: 저장 경로 (None이면 저장하지 않음)
+            owns_figure: 차트 함수에서 생성한 Figure인지 여부 (True이면 표시 후 닫음)
+            saved_message: 저장 완료 로그 메시지
+        """
+        fig.tight_layout()
+        
+        # 저장 또는 표시
+        if save_path:
+            fig.savefig(save_path, dpi=_SAVE_DPI, bbox_inches='tight')
+            logger.info(f"{saved_message}: {save_path}")
+        elif owns_figure:
+            plt.show()
+        
+        if owns_figure:
+            plt.close(fig)
+    
+    def plot_equity_curve(self, backtest_results: Dict[str, Any], title: str = "Equity Curve", 
+                         save_path: Optional[str] = None, trades_df: Optional[pd.DataFrame] = None,
+                         ax: Optional[plt.Axes] = None) -> None:
+        """
+        자본금 곡선 시각화
+        
+        Args:
+            backtest_results: 백테스트 결과 딕셔너리
+            title: 차트 제목
+            save_path: 저장 경로 (None이면 저장하지 않음)
+            trades_df: _prepare_trades_df()로 미리 변환한 거래 DataFrame (None이면 여기서 변환)
+            ax: 그릴 Axes (None이면 새 Figure 생성)
+        """
+        df = trades_df if trades_df is not None else self._prepare_trades_df(backtest_results)
+        if df is None:
+            logger.warning("거래 데이터가 없어 자본금 곡선을 그릴 수 없습니다.")
+            return
+        
+        # 누적 수익 확인
+        if 'cumulative_profit' not in df.columns:
             logger.warning("수익 데이터가 없어 자본금 곡선을 그릴 수 없습니다.")
             return
         
+        dates = df['close_date'].to_numpy()
+        cumulative_profit = df['cumulative_profit'].to_numpy() * 100
+        
         # 그래프 그리기
-        plt.figure(figsize=(12, 6))
+        fig, ax, owns_figure = self._get_axes(ax, (12, 6))
         
-        # 누적 수익 곡선
-        plt.plot(df['close_date'], df['cumulative_profit'] * 100, 'b-', linewidth=2)
+        # 누적 수익 곡선 (거래가 많으면 다운샘플링)
+        line_idx = _downsample_xy(dates, cumulative_profit)
+        ax.plot(dates[line_idx], cumulative_profit[line_idx], 'b-', linewidth=2)
         
-        # 수익/손실 거래 표시
-        if 'profit_percent' in df.columns:
-            profit_mask = df['profit_percent'] > 0
-        else:
-            profit_mask = df['profit_ratio'] > 0
-            
-        plt.scatter(df.loc[profit_mask, 'close_date'], 
-                   df.loc[profit_mask, 'cumulative_profit'] * 100, 
-                   color='green', alpha=0.6, label='Win')
-        plt.scatter(df.loc[~profit_mask, 'close_date'], 
-                   df.loc[~profit_mask, 'cumulative_profit'] * 100, 
-                   color='red', alpha=0.6, label='Loss')
+        # 수익/손실 거래 표시 (각각 최대 _MAX_SCATTER_POINTS개)
+        profit_mask = df['profit_percent'].to_numpy() > 0
+        win_idx = _sample_indices(profit_mask)
+        loss_idx = _sample_indices(~profit_mask)
+        
+        # 마커가 많으므로 PDF/SVG로 저장할 때도 비트맵으로 그림
+        ax.scatter(dates[win_idx], cumulative_profit[win_idx], 
+                   color='green', alpha=0.6, label='Win', rasterized=True)
+        ax.scatter(dates[loss_idx], cumulative_profit[loss_idx], 
+                   color='red', alpha=0.6, label='Loss', rasterized=True)
         
         # 그래프 스타일 설정
-        plt.title(title, fontsize=16)
-        plt.xlabel('Date', fontsize=12)
-        plt.ylabel('Cumulative Profit (%)', fontsize=12)
-        plt.grid(True, alpha=0.3)
-        plt.legend()
+        ax.set_title(title, fontsize=16)
+        ax.set_xlabel('Date', fontsize=12)
+        ax.set_ylabel('Cumulative Profit (%)', fontsize=12)
+        ax.grid(True, alpha=0.3)
+        ax.legend()
         
-        # x축 날짜 포맷 설정
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        plt.gcf().autofmt_xdate()
+        # x축 날짜 포맷 설정 (눈금 간격에 맞춘 짧은 레이블이라 회전 불필요)
+        _set_date_axis(ax)
         
         # 최종 수익률 표시
         final_profit = df['cumulative_profit'].iloc[-1] * 100
-        plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-        plt.text(df['close_date'].iloc[-1], final_profit, 
+        ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax.text(df['close_date'].iloc[-1], final_profit, 
                 f' {final_profit:.2f}%', 
                 verticalalignment='center')
         
-        plt.tight_layout()
+        self._finish_figure(fig, save_path, owns_figure, "자본금 곡선이 저장되었습니다")
+    
+    def plot_equity_curve_interactive(self, backtest_results: Dict[str, Any], title: str = "Equity Curve",
+                                      save_path: Optional[str] = None,
+                                      trades_df: Optional[pd.DataFrame] = None) -> Optional[Any]:
+        """
+        대화형 자본금 곡선 시각화 (plotly-resampler, 노트북/HTML용)
         
-        # 저장 또는 표시
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"자본금 곡선이 저장되었습니다: {save_path}")
-        else:
-            plt.show()
+        전체 데이터는 서버 측에 두고 현재 화면 구간의 점만 브라우저에 전달하므로
+        거래 수와 관계없이 화면 픽셀 수 수준의 점만 그립니다. PNG 보고서는 plot_equity_curve()를 사용합니다.
+        
+        Args:
+            backtest_results: 백테스트 결과 딕셔너리
+            title: 차트 제목
+            save_path: HTML 저장 경로 (None이면 저장하지 않음)
+            trades_df: _prepare_trades_df()로 미리 변환한 거래 DataFrame (None이면 여기서 변환)
             
-        plt.close()
+        Returns:
+            Optional[FigureResampler]: 대화형 Figure (노트북에서는 show_dash()로 표시, 그릴 수 없으면 None)
+        """
+        if FigureResampler is None:
+            logger.warning("plotly-resampler가 설치되어 있지 않아 대화형 자본금 곡선을 그릴 수 없습니다.")
+            return None
+        
+        df = trades_df if trades_df is not None else self._prepare_trades_df(backtest_results)
+        if df is None:
+            logger.warning("거래 데이터가 없어 자본금 곡선을 그릴 수 없습니다.")
+            return None
+        
+        # 누적 수익 확인
+        if 'cumulative_profit' not in df.columns:
+            logger.warning("수익 데이터가 없어 자본금 곡선을 그릴 수 없습니다.")
+            return None
+        
+        fig = FigureResampler(go.Figure(), default_n_shown_samples=_DOWNSAMPLE_POINTS)
+        fig.add_trace(go.Scattergl(name='Equity', mode='lines', line={'color': 'blue', 'width': 2}),
+                      hf_x=df['close_date'].to_numpy(), hf_y=df['cumulative_profit'].to_numpy() * 100)
+        fig.add_hline(y=0, line_color='black', opacity=0.3)
+        fig.update_layout(title=title, xaxis_title='Date', yaxis_title='Cumulative Profit (%)')
+        
+        if save_path:
+            fig.write_html(save_path)
+            logger.info(f"대화형 자본금 곡선이 저장되었습니다: {save_path}")
+        
+        return fig
     
     def plot_monthly_returns(self, backtest_results: Dict[str, Any], title: str = "Monthly Returns", 
-                           save_path: Optional[str] = None) -> None:
+                           save_path: Optional[str] = None, trades_df: Optional[pd.DataFrame] = None,
+                           ax: Optional[plt.Axes] = None) -> None:
         """
         월별 수익률 시각화
         
@@ -131,73 +392,59 @@ class BacktestVisualizer:
             backtest_results: 백테스트 결과 딕셔너리
             title: 차트 제목
             save_path: 저장 경로 (None이면 저장하지 않음)
+            trades_df: _prepare_trades_df()로 미리 변환한 거래 DataFrame (None이면 여기서 변환)
+            ax: 그릴 Axes (None이면 새 Figure 생성)
         """
-        if 'trades' not in backtest_results or not backtest_results['trades']:
+        df = trades_df if trades_df is not None else self._prepare_trades_df(backtest_results)
+        if df is None:
             logger.warning("거래 데이터가 없어 월별 수익률을 그릴 수 없습니다.")
             return
         
-        trades = backtest_results['trades']
-        
-        # 거래 데이터를 DataFrame으로 변환
-        df = pd.DataFrame(trades)
-        
-        # 날짜 형식 변환
-        if 'close_date' in df.columns:
-            df['close_date'] = pd.to_datetime(df['close_date'])
-            df['year_month'] = df['close_date'].dt.strftime('%Y-%m')
-        else:
+        # 날짜 데이터 확인
+        if 'close_date' not in df.columns:
             logger.warning("날짜 데이터가 없어 월별 수익률을 그릴 수 없습니다.")
             return
         
         # 수익 데이터 확인
-        if 'profit_percent' in df.columns:
-            profit_col = 'profit_percent'
-        elif 'profit_ratio' in df.columns:
-            # profit_ratio를 퍼센트로 변환
-            df['profit_percent'] = df['profit_ratio'] * 100
-            profit_col = 'profit_percent'
-        else:
+        if 'profit_percent' not in df.columns:
             logger.warning("수익 데이터가 없어 월별 수익률을 그릴 수 없습니다.")
             return
         
-        # 월별 수익 계산
-        monthly_returns = df.groupby('year_month')[profit_col].sum().reset_index()
-        monthly_returns = monthly_returns.sort_values('year_month')
+        # 월별 수익 계산 (월 단위 datetime64 코드별 합계, 문자열 groupby 대신 bincount 사용)
+        months = df['close_date'].to_numpy().astype('datetime64[M]')
+        valid = ~np.isnat(months)
+        month_values, codes = np.unique(months[valid], return_inverse=True)
+        # groupby.sum()과 같이 NaN 수익은 0으로 취급
+        profits = np.nan_to_num(df['profit_percent'].to_numpy()[valid])
+        monthly_profit = np.bincount(codes, weights=profits, minlength=len(month_values))
+        month_labels = month_values.astype(str)
         
         # 그래프 그리기
-        plt.figure(figsize=(12, 6))
+        fig, ax, owns_figure = self._get_axes(ax, (12, 6))
         
         # 막대 색상 설정 (양수: 녹색, 음수: 빨간색)
-        colors = ['green' if x > 0 else 'red' for x in monthly_returns[profit_col]]
+        colors = np.where(monthly_profit > 0, 'green', 'red')
         
         # 월별 수익 막대 그래프
-        plt.bar(monthly_returns['year_month'], monthly_returns[profit_col], color=colors, alpha=0.7)
+        ax.bar(month_labels, monthly_profit, color=colors, alpha=0.7)
         
         # 그래프 스타일 설정
-        plt.title(title, fontsize=16)
-        plt.xlabel('Month', fontsize=12)
-        plt.ylabel('Monthly Return (%)', fontsize=12)
-        plt.grid(True, alpha=0.3, axis='y')
+        ax.set_title(title, fontsize=16)
+        ax.set_xlabel('Month', fontsize=12)
+        ax.set_ylabel('Monthly Return (%)', fontsize=12)
+        ax.grid(True, alpha=0.3, axis='y')
         
         # x축 레이블 회전
-        plt.xticks(rotation=45)
+        ax.tick_params(axis='x', labelrotation=45)
         
         # 0선 표시
-        plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
         
-        plt.tight_layout()
-        
-        # 저장 또는 표시
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"월별 수익률 차트가 저장되었습니다: {save_path}")
-        else:
-            plt.show()
-            
-        plt.close()
+        self._finish_figure(fig, save_path, owns_figure, "월별 수익률 차트가 저장되었습니다")
     
     def plot_drawdown(self, backtest_results: Dict[str, Any], title: str = "Drawdown Analysis", 
-                     save_path: Optional[str] = None) -> None:
+                     save_path: Optional[str] = None, trades_df: Optional[pd.DataFrame] = None,
+                     ax: Optional[plt.Axes] = None) -> None:
         """
         드로다운 분석 시각화
         
@@ -205,74 +452,61 @@ class BacktestVisualizer:
             backtest_results: 백테스트 결과 딕셔너리
             title: 차트 제목
             save_path: 저장 경로 (None이면 저장하지 않음)
+            trades_df: _prepare_trades_df()로 미리 변환한 거래 DataFrame (None이면 여기서 변환)
+            ax: 그릴 Axes (None이면 새 Figure 생성)
         """
-        if 'trades' not in backtest_results or not backtest_results['trades']:
+        df = trades_df if trades_df is not None else self._prepare_trades_df(backtest_results)
+        if df is None:
             logger.warning("거래 데이터가 없어 드로다운을 그릴 수 없습니다.")
             return
         
-        trades = backtest_results['trades']
-        
-        # 거래 데이터를 DataFrame으로 변환
-        df = pd.DataFrame(trades)
-        
-        # 날짜 형식 변환
-        if 'close_date' in df.columns:
-            df['close_date'] = pd.to_datetime(df['close_date'])
-            df = df.sort_values('close_date')
-        else:
+        # 날짜 데이터 확인
+        if 'close_date' not in df.columns:
             logger.warning("날짜 데이터가 없어 드로다운을 그릴 수 없습니다.")
             return
         
-        # 누적 수익 계산
-        if 'profit_percent' in df.columns:
-            df['cumulative_profit'] = (1 + df['profit_percent'] / 100).cumprod() - 1
-        elif 'profit_ratio' in df.columns:
-            df['cumulative_profit'] = (1 + df['profit_ratio']).cumprod() - 1
-        else:
+        # 드로다운 데이터 확인 (누적 수익에서 계산됨)
+        if 'drawdown' not in df.columns:
             logger.warning("수익 데이터가 없어 드로다운을 그릴 수 없습니다.")
             return
         
-        # 드로다운 계산
-        df['peak'] = df['cumulative_profit'].cummax()
-        df['drawdown'] = (df['cumulative_profit'] - df['peak']) * 100  # 퍼센트로 변환
+        dates = df['close_date'].to_numpy()
+        drawdown = df['drawdown'].to_numpy()
+        # 수익이 없는 거래의 드로다운은 NaN이므로 최대 드로다운 위치에서 제외
+        if np.isnan(drawdown).all():
+            logger.warning("수익 데이터가 없어 드로다운을 그릴 수 없습니다.")
+            return
+        max_dd_pos = int(np.nanargmin(drawdown))
         
         # 그래프 그리기
-        plt.figure(figsize=(12, 6))
+        fig, ax, owns_figure = self._get_axes(ax, (12, 6))
         
-        # 드로다운 곡선
-        plt.fill_between(df['close_date'], df['drawdown'], 0, color='red', alpha=0.3)
-        plt.plot(df['close_date'], df['drawdown'], 'r-', linewidth=1)
+        # 드로다운 곡선 (거래가 많으면 다운샘플링, 최대 드로다운 지점은 항상 포함)
+        line_idx = np.union1d(_downsample_xy(dates, drawdown), [max_dd_pos])
+        ax.fill_between(dates[line_idx], drawdown[line_idx], 0, color='red', alpha=0.3, rasterized=True)
+        ax.plot(dates[line_idx], drawdown[line_idx], 'r-', linewidth=1)
         
         # 그래프 스타일 설정
-        plt.title(title, fontsize=16)
-        plt.xlabel('Date', fontsize=12)
-        plt.ylabel('Drawdown (%)', fontsize=12)
-        plt.grid(True, alpha=0.3)
+        ax.set_title(title, fontsize=16)
+        ax.set_xlabel('Date', fontsize=12)
+        ax.set_ylabel('Drawdown (%)', fontsize=12)
+        ax.grid(True, alpha=0.3)
         
-        # x축 날짜 포맷 설정
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        plt.gcf().autofmt_xdate()
+        # x축 날짜 포맷 설정 (눈금 간격에 맞춘 짧은 레이블이라 회전 불필요)
+        _set_date_axis(ax)
         
         # 최대 드로다운 표시
-        max_drawdown = df['drawdown'].min()
-        max_dd_date = df.loc[df['drawdown'].idxmin(), 'close_date']
-        plt.scatter(max_dd_date, max_drawdown, color='darkred', s=80, zorder=5)
-        plt.text(max_dd_date, max_drawdown, f' Max DD: {max_drawdown:.2f}%', 
+        max_drawdown = drawdown[max_dd_pos]
+        max_dd_date = dates[max_dd_pos]
+        ax.scatter(max_dd_date, max_drawdown, color='darkred', s=80, zorder=5)
+        ax.text(max_dd_date, max_drawdown, f' Max DD: {max_drawdown:.2f}%', 
                 verticalalignment='center')
         
-        plt.tight_layout()
-        
-        # 저장 또는 표시
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"드로다운 차트가 저장되었습니다: {save_path}")
-        else:
-            plt.show()
-            
-        plt.close()
+        self._finish_figure(fig, save_path, owns_figure, "드로다운 차트가 저장되었습니다")
     
     def plot_pair_performance(self, backtest_results: Dict[str, Any], title: str = "Pair Performance", 
-                             save_path: Optional[str] = None, top_n: int = 10) -> None:
+                             save_path: Optional[str] = None, top_n: int = 10,
+                             ax: Optional[plt.Axes] = None) -> None:
         """
         거래쌍별 성능 시각화
         
@@ -281,6 +515,7 @@ class BacktestVisualizer:
             title: 차트 제목
             save_path: 저장 경로 (None이면 저장하지 않음)
             top_n: 표시할 상위 거래쌍 수
+            ax: 그릴 Axes (None이면 새 Figure 생성)
         """
         if 'pairs' not in backtest_results or not backtest_results['pairs']:
             logger.warning("거래쌍 데이터가 없어 거래쌍별 성능을 그릴 수 없습니다.")
@@ -301,42 +536,33 @@ class BacktestVisualizer:
         top_pairs = pairs_df.head(top_n)
         
         # 그래프 그리기
-        plt.figure(figsize=(12, 8))
+        fig, ax, owns_figure = self._get_axes(ax, (12, 8))
         
         # 막대 색상 설정 (양수: 녹색, 음수: 빨간색)
-        colors = ['green' if x > 0 else 'red' for x in top_pairs['profit']]
+        colors = np.where(top_pairs['profit'].to_numpy() > 0, 'green', 'red')
         
         # 거래쌍별 수익 막대 그래프
-        bars = plt.barh(top_pairs.index, top_pairs['profit'], color=colors, alpha=0.7)
+        bars = ax.barh(top_pairs.index, top_pairs['profit'], color=colors, alpha=0.7)
         
-        # 거래 횟수 표시
-        for i, bar in enumerate(bars):
-            plt.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2, 
-                    f"{top_pairs.iloc[i]['count']} trades", 
-                    va='center')
+        # 거래 횟수 표시 (막대 끝 바깥쪽)
+        ax.bar_label(bars, labels=[f"{count} trades" for count in top_pairs['count'].to_numpy()], padding=3)
+        # 레이블이 축 밖으로 나가지 않도록 x축 여백 확보
+        ax.margins(x=0.15)
         
         # 그래프 스타일 설정
-        plt.title(title, fontsize=16)
-        plt.xlabel('Profit (%)', fontsize=12)
-        plt.ylabel('Trading Pair', fontsize=12)
-        plt.grid(True, alpha=0.3, axis='x')
+        ax.set_title(title, fontsize=16)
+        ax.set_xlabel('Profit (%)', fontsize=12)
+        ax.set_ylabel('Trading Pair', fontsize=12)
+        ax.grid(True, alpha=0.3, axis='x')
         
         # 0선 표시
-        plt.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+        ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
         
-        plt.tight_layout()
-        
-        # 저장 또는 표시
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"거래쌍별 성능 차트가 저장되었습니다: {save_path}")
-        else:
-            plt.show()
-            
-        plt.close()
+        self._finish_figure(fig, save_path, owns_figure, "거래쌍별 성능 차트가 저장되었습니다")
     
     def plot_win_loss_distribution(self, backtest_results: Dict[str, Any], title: str = "Win/Loss Distribution", 
-                                 save_path: Optional[str] = None) -> None:
+                                 save_path: Optional[str] = None, trades_df: Optional[pd.DataFrame] = None,
+                                 ax: Optional[plt.Axes] = None) -> None:
         """
         승/패 분포 시각화
         
@@ -344,74 +570,83 @@ class BacktestVisualizer:
             backtest_results: 백테스트 결과 딕셔너리
             title: 차트 제목
             save_path: 저장 경로 (None이면 저장하지 않음)
+            trades_df: _prepare_trades_df()로 미리 변환한 거래 DataFrame (None이면 여기서 변환)
+            ax: 그릴 Axes (None이면 새 Figure 생성)
         """
-        if 'trades' not in backtest_results or not backtest_results['trades']:
+        df = trades_df if trades_df is not None else self._prepare_trades_df(backtest_results)
+        if df is None:
             logger.warning("거래 데이터가 없어 승/패 분포를 그릴 수 없습니다.")
             return
         
-        trades = backtest_results['trades']
-        
-        # 거래 데이터를 DataFrame으로 변환
-        df = pd.DataFrame(trades)
-        
         # 수익 데이터 확인
-        if 'profit_percent' in df.columns:
-            profit_col = 'profit_percent'
-        elif 'profit_ratio' in df.columns:
-            # profit_ratio를 퍼센트로 변환
-            df['profit_percent'] = df['profit_ratio'] * 100
-            profit_col = 'profit_percent'
-        else:
+        if 'profit_percent' not in df.columns:
             logger.warning("수익 데이터가 없어 승/패 분포를 그릴 수 없습니다.")
             return
+        profit_col = 'profit_percent'
         
-        # 그래프 그리기
-        plt.figure(figsize=(12, 6))
+        # 승/패 구분 (NaN 수익은 비교 결과가 모두 거짓이므로 어느 쪽에도 포함되지 않음)
+        profits = df[profit_col].to_numpy()
+        win_trades = profits[profits > 0]
+        loss_trades = profits[profits <= 0]
+        if len(win_trades) + len(loss_trades) == 0:
+            logger.warning("수익 데이터가 없어 승/패 분포를 그릴 수 없습니다.")
+            return
         
-        # 승/패 구분
-        win_trades = df[df[profit_col] > 0][profit_col]
-        loss_trades = df[df[profit_col] <= 0][profit_col]
+        # 그래프 그리기
+        fig, ax, owns_figure = self._get_axes(ax, (12, 6))
         
-        # 히스토그램 빈 설정
-        bins = np.linspace(df[profit_col].min(), df[profit_col].max(), 30)
+        # 히스토그램 빈 설정 (NaN 수익 제외)
+        bins = np.linspace(np.nanmin(profits), np.nanmax(profits), 30)
         
-        # 승/패 히스토그램
-        plt.hist(win_trades, bins=bins, alpha=0.7, color='green', label=f'Win ({len(win_trades)})')
-        plt.hist(loss_trades, bins=bins, alpha=0.7, color='red', label=f'Loss ({len(loss_trades)})')
+        # 승/패 히스토그램 (구간별 개수를 numpy로 계산하고 막대 패치 대신 계단 영역 하나로 그림)
+        win_counts, _ = np.histogram(win_trades, bins=bins)
+        loss_counts, _ = np.histogram(loss_trades, bins=bins)
+        ax.stairs(win_counts, bins, fill=True, alpha=0.7, color='green', label=f'Win ({len(win_trades)})')
+        ax.stairs(loss_counts, bins, fill=True, alpha=0.7, color='red', label=f'Loss ({len(loss_trades)})')
         
         # 그래프 스타일 설정
-        plt.title(title, fontsize=16)
-        plt.xlabel('Profit (%)', fontsize=12)
-        plt.ylabel('Number of Trades', fontsize=12)
-        plt.grid(True, alpha=0.3)
-        plt.legend()
+        ax.set_title(title, fontsize=16)
+        ax.set_xlabel('Profit (%)', fontsize=12)
+        ax.set_ylabel('Number of Trades', fontsize=12)
+        ax.grid(True, alpha=0.3)
+        ax.legend()
         
         # 0선 표시
-        plt.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+        ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
         
         # 평균 수익/손실 표시
         avg_win = win_trades.mean() if len(win_trades) > 0 else 0
         avg_loss = loss_trades.mean() if len(loss_trades) > 0 else 0
         
-        plt.axvline(x=avg_win, color='green', linestyle='--', alpha=0.7,
+        ax.axvline(x=avg_win, color='green', linestyle='--', alpha=0.7,
                    label=f'Avg Win: {avg_win:.2f}%')
-        plt.axvline(x=avg_loss, color='red', linestyle='--', alpha=0.7,
+        ax.axvline(x=avg_loss, color='red', linestyle='--', alpha=0.7,
                    label=f'Avg Loss: {avg_loss:.2f}%')
         
-        plt.legend()
-        plt.tight_layout()
+        ax.legend()
+        self._finish_figure(fig, save_path, owns_figure, "승/패 분포 차트가 저장되었습니다")
+    
+    def _plot_chart(self, method_name: str, chart_results: Dict[str, Any], title: str,
+                    save_path: str, trades_df: Optional[pd.DataFrame], ax: Optional[plt.Axes] = None) -> None:
+        """
+        이름으로 지정한 차트 메서드를 호출하여 차트 하나를 저장
         
-        # 저장 또는 표시
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"승/패 분포 차트가 저장되었습니다: {save_path}")
-        else:
-            plt.show()
-            
-        plt.close()
+        Args:
+            method_name: 호출할 차트 메서드 이름
+            chart_results: 차트에 필요한 결과 항목만 담은 딕셔너리
+            title: 차트 제목
+            save_path: 저장 경로
+            trades_df: _prepare_trades_df()로 변환한 거래 DataFrame (거래 데이터를 쓰지 않는 차트는 None)
+            ax: 그릴 Axes (None이면 새 Figure 생성)
+        """
+        kwargs = {'title': title, 'save_path': save_path, 'ax': ax}
+        if trades_df is not None:
+            kwargs['trades_df'] = trades_df
+        getattr(self, method_name)(chart_results, **kwargs)
     
     def create_performance_report(self, backtest_results: Dict[str, Any], strategy_name: str, 
-                                output_dir: Optional[str] = None) -> str:
+                                output_dir: Optional[str] = None,
+                                executor: Optional[ProcessPoolExecutor] = None) -> str:
         """
         종합 성능 보고서 생성
         
@@ -419,6 +654,7 @@ class BacktestVisualizer:
             backtest_results: 백테스트 결과 딕셔너리
             strategy_name: 전략 이름
             output_dir: 출력 디렉토리 (None이면 results_dir 사용)
+            executor: 차트 작업 프로세스 풀 (create_chart_executor(), None이거나 거래가 적으면 현재 프로세스에서 순차 생성)
             
         Returns:
             str: 보고서 저장 경로
@@ -433,30 +669,42 @@ class BacktestVisualizer:
         report_dir = os.path.join(output_dir, f"{strategy_name}_{timestamp}")
         os.makedirs(report_dir, exist_ok=True)
         
-        # 각 차트 생성 및 저장
-        self.plot_equity_curve(backtest_results, 
-                             title=f"{strategy_name} - Equity Curve",
-                             save_path=os.path.join(report_dir, "equity_curve.png"))
-        
-        self.plot_monthly_returns(backtest_results, 
-                                title=f"{strategy_name} - Monthly Returns",
-                                save_path=os.path.join(report_dir, "monthly_returns.png"))
-        
-        self.plot_drawdown(backtest_results, 
-                         title=f"{strategy_name} - Drawdown Analysis",
-                         save_path=os.path.join(report_dir, "drawdown.png"))
-        
-        self.plot_pair_performance(backtest_results, 
-                                 title=f"{strategy_name} - Pair Performance",
-                                 save_path=os.path.join(report_dir, "pair_performance.png"))
-        
-        self.plot_win_loss_distribution(backtest_results, 
-                                      title=f"{strategy_name} - Win/Loss Distribution",
-                                      save_path=os.path.join(report_dir, "win_loss_distribution.png"))
+        # 거래 DataFrame은 한 번만 변환하여 모든 차트에서 공유
+        trades_df = self._prepare_trades_df(backtest_results)
+        
+        # 거래가 많고 호출자가 프로세스 풀을 넘겼으면 각 차트를 별도 프로세스에서 생성 및 저장
+        # (pyplot은 스레드에 안전하지 않지만 프로세스별로는 독립)
+        # 작업에는 전체 결과 대신 차트에 필요한 데이터만 전달하여 피클링 비용 최소화
+        chart_jobs = [
+            ('plot_equity_curve', "Equity Curve", "equity_curve.png", {}, trades_df),
+            ('plot_monthly_returns', "Monthly Returns", "monthly_returns.png", {}, trades_df),
+            ('plot_drawdown', "Drawdown Analysis", "drawdown.png", {}, trades_df),
+            ('plot_pair_performance', "Pair Performance", "pair_performance.png",
+             {'pairs': backtest_results.get('pairs')}, None),
+            ('plot_win_loss_distribution', "Win/Loss Distribution", "win_loss_distribution.png", {}, trades_df),
+        ]
+        if executor is not None and trades_df is not None and len(trades_df) >= _PARALLEL_MIN_TRADES:
+            futures = [
+                executor.submit(_render_chart, self.results_dir, method_name, chart_results,
+                                f"{strategy_name} - {chart_title}", os.path.join(report_dir, file_name), chart_df)
+                for method_name, chart_title, file_name, chart_results, chart_df in chart_jobs
+            ]
+            for future in futures:
+                future.result()
+        else:
+            # 순차 생성 시에는 하나의 Figure를 지워 가며 재사용
+            # (Axes.clear()는 눈금 레이블 회전 등 tick_params 설정을 초기화하지 않으므로 Axes는 새로 생성)
+            fig = plt.figure(figsize=(12, 6))
+            for method_name, chart_title, file_name, chart_results, chart_df in chart_jobs:
+                fig.clear()
+                ax = fig.add_subplot()
+                self._plot_chart(method_name, chart_results, f"{strategy_name} - {chart_title}",
+                                 os.path.join(report_dir, file_name), chart_df, ax=ax)
+            plt.close(fig)
         
         # 결과 JSON 저장
-        with open(os.path.join(report_dir, "backtest_results.json"), 'w') as f:
-            json.dump(backtest_results, f, indent=4)
+        with open(os.path.join(report_dir, "backtest_results.json"), 'wb') as f:
+            f.write(orjson.dumps(backtest_results, option=_JSON_OPTIONS))
         
         # 요약 보고서 생성
         self._create_summary_report(backtest_results, strategy_name, report_dir)
@@ -475,55 +723,104 @@ class BacktestVisualizer:
         """
         summary_path = os.path.join(report_dir, "summary.txt")
         
-        with open(summary_path, 'w') as f:
-            f.write(f"=== {strategy_name} 백테스트 요약 보고서 ===\n")
-            f.write(f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        # 보고서 내용을 모아서 한 번에 기록
+        parts = [
+            f"=== {strategy_name} 백테스트 요약 보고서 ===\n",
+            f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        ]
+        
+        # 주요 지표 추출
+        total_trades = backtest_results.get('total_trades', 0)
+        win_trades = backtest_results.get('win_trades', 0)
+        loss_trades = backtest_results.get('loss_trades', 0)
+        win_pct = backtest_results.get('win_pct', 0)
+        total_profit = backtest_results.get('total_profit', 0)
+        profit_factor = backtest_results.get('profit_factor', 0)
+        max_drawdown = backtest_results.get('max_drawdown', 0)
+        
+        # 요약 정보 작성
+        parts.append(
+            f"총 거래 수: {total_trades}\n"
+            f"승리 거래: {win_trades}\n"
+            f"손실 거래: {loss_trades}\n"
+            f"승률: {win_pct:.2f}%\n"
+            f"총 수익: {total_profit:.2f}%\n"
+            f"수익 요소: {profit_factor:.2f}\n"
+            f"최대 드로다운: {max_drawdown:.2f}%\n\n"
+        )
+        
+        # 거래쌍별 성능
+        if 'pairs' in backtest_results and backtest_results['pairs']:
+            parts.append("=== 거래쌍별 성능 ===\n")
             
-            # 주요 지표 추출
-            total_trades = backtest_results.get('total_trades', 0)
-            win_trades = backtest_results.get('win_trades', 0)
-            loss_trades = backtest_results.get('loss_trades', 0)
-            win_pct = backtest_results.get('win_pct', 0)
-            total_profit = backtest_results.get('total_profit', 0)
-            profit_factor = backtest_results.get('profit_factor', 0)
-            max_drawdown = backtest_results.get('max_drawdown', 0)
+            pairs_data = backtest_results['pairs']
+            pairs_df = pd.DataFrame.from_dict(pairs_data, orient='index')
+            pairs_df = pairs_df.sort_values('profit', ascending=False)
             
-            # 요약 정보 작성
-            f.write(f"총 거래 수: {total_trades}\n")
-            f.write(f"승리 거래: {win_trades}\n")
-            f.write(f"손실 거래: {loss_trades}\n")
-            f.write(f"승률: {win_pct:.2f}%\n")
-            f.write(f"총 수익: {total_profit:.2f}%\n")
-            f.write(f"수익 요소: {profit_factor:.2f}\n")
-            f.write(f"최대 드로다운: {max_drawdown:.2f}%\n\n")
+            # iterrows() 대신 컬럼 배열을 직접 순회 (행마다 Series 생성 방지)
+            parts.extend(
+                f"{pair}: {count}회 거래, 수익 {profit:.2f}%, 승률 {winrate:.2f}%\n"
+                for pair, count, profit, winrate in zip(pairs_df.index, pairs_df['count'].to_numpy(),
+                                                        pairs_df['profit'].to_numpy(), pairs_df['winrate'].to_numpy())
+            )
             
-            # 거래쌍별 성능
-            if 'pairs' in backtest_results and backtest_results['pairs']:
-                f.write("=== 거래쌍별 성능 ===\n")
-                
-                pairs_data = backtest_results['pairs']
-                pairs_df = pd.DataFrame.from_dict(pairs_data, orient='index')
-                pairs_df = pairs_df.sort_values('profit', ascending=False)
-                
-                for pair, row in pairs_df.iterrows():
-                    f.write(f"{pair}: {row['count']}회 거래, 수익 {row['profit']:.2f}%, 승률 {row['winrate']:.2f}%\n")
-                
-                f.write("\n")
+            parts.append("\n")
+        
+        # 거래 지속 시간별 분포
+        if 'duration' in backtest_results and backtest_results['duration']:
+            parts.append("=== 거래 지속 시간별 분포 ===\n")
             
-            # 거래 지속 시간별 분포
-            if 'duration' in backtest_results and backtest_results['duration']:
-                f.write("=== 거래 지속 시간별 분포 ===\n")
-                
-                duration_data = backtest_results['duration']
-                for duration, data in duration_data.items():
-                    f.write(f"{duration}: {data['count']}회 거래, 승리 {data['wins']}회, 패배 {data['losses']}회\n")
-                
-                f.write("\n")
+            duration_data = backtest_results['duration']
+            parts.extend(
+                f"{duration}: {data['count']}회 거래, 승리 {data['wins']}회, 패배 {data['losses']}회\n"
+                for duration, data in duration_data.items()
+            )
             
-            f.write("=== 보고서 파일 목록 ===\n")
-            f.write("equity_curve.png - 자본금 곡선\n")
-            f.write("monthly_returns.png - 월별 수익률\n")
-            f.write("drawdown.png - 드로다운 분석\n")
-            f.write("pair_performance.png - 거래쌍별 성능\n")
-            f.write("win_loss_distribution.png - 승/패 분포\n")
-            f.write("backtest_results.json - 백테스트 결과 JSON\n")
+            parts.append("\n")
+        
+        parts.append(
+            "=== 보고서 파일 목록 ===\n"
+            "equity_curve.png - 자본금 곡선\n"
+            "monthly_returns.png - 월별 수익률\n"
+            "drawdown.png - 드로다운 분석\n"
+            "pair_performance.png - 거래쌍별 성능\n"
+            "win_loss_distribution.png - 승/패 분포\n"
+            "backtest_results.json - 백테스트 결과 JSON\n"
+        )
+        
+        with open(summary_path, 'w') as f:
+            f.write("".join(parts))
+
+
+def _render_chart(results_dir: str, method_name: str, chart_results: Dict[str, Any], title: str,
+                  save_path: str, trades_df: Optional[pd.DataFrame]) -> None:
+    """
+    차트 작업 프로세스에서 차트 하나를 생성하여 저장
+    
+    Args:
+        results_dir: 시각화 객체의 결과 저장 디렉토리
+        method_name: 호출할 BacktestVisualizer 차트 메서드 이름
+        chart_results: 차트에 필요한 결과 항목만 담은 딕셔너리
+        title: 차트 제목
+        save_path: 저장 경로
+        trades_df: _prepare_trades_df()로 변환한 거래 DataFrame (거래 데이터를 쓰지 않는 차트는 None)
+    """
+    BacktestVisualizer(results_dir)._plot_chart(method_name, chart_results, title, save_path, trades_df)
+
+
+def create_chart_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    보고서 차트 생성용 프로세스 풀 생성 (create_performance_report()의 executor 인자로 전달)
+    
+    여러 보고서를 연속으로 생성할 때 하나의 풀을 재사용하며, 호출자가 사용 후 shutdown() 해야 합니다.
+    작업 프로세스는 첫 작업 제출 시 시작되므로 병렬 생성 기준보다 거래가 적은 보고서만 만들면 시작되지 않습니다.
+    
+    Args:
+        max_workers: 최대 프로세스 수 (None이면 min(5, CPU 코어 수))
+        
+    Returns:
+        ProcessPoolExecutor: 차트 작업 프로세스 풀 (스레드에서 호출되어도 안전한 forkserver, 없으면 spawn)
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=max_workers or _CHART_WORKERS,
+                               mp_context=multiprocessing.get_context(method))
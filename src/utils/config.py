@@ -4,13 +4,20 @@
 이 모듈은 YAML 설정 파일을 로드하고 환경 변수를 통합하는 기능을 제공합니다.
 """
 
+import copy
+import functools
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml이 없는 PyYAML 빌드에서는 순수 파이썬 로더 사용
+    from yaml import SafeLoader as _YamlLoader
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
@@ -37,8 +44,8 @@ def load_config(config_path: str) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    # 파일이 바뀌지 않았으면 캐시된 파싱 결과 사용 (환경 변수 보강이 캐시를 수정하지 않도록 복사)
+    config = copy.deepcopy(_parse_yaml(str(config_path.resolve()), config_path.stat().st_mtime_ns))
 
     # 환경 변수로 설정 보강
     config = _enrich_config_with_env_vars(config)
@@ -46,6 +53,22 @@ def load_config(config_path: str) -> Dict[str, Any]:
     return config
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int) -> Any:
+    """
+    YAML 파일을 파싱합니다. (경로와 수정 시각별로 캐시)
+
+    Args:
+        path (str): 설정 파일 절대 경로
+        mtime_ns (int): 파일 수정 시각 (캐시 키, 파일이 바뀌면 다시 파싱)
+
+    Returns:
+        Any: 파싱된 설정 (캐시된 객체이므로 수정하면 안 됨)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def _enrich_config_with_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     환경 변수를 사용하여 설정을 보강합니다.
@@ -58,60 +81,65 @@ def _enrich_config_with_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: 환경 변수로 보강된 설정
     """
-    # 중첩된 설정을 평면화하여 환경 변수 이름 생성
-    flat_config = _flatten_dict(config)
+    # 환경 변수 조회는 모듈 속성 대신 로컬 참조로 수행
+    environ = os.environ
     
-    # 각 평면화된 키에 대해 환경 변수 확인
-    for flat_key, value in flat_config.items():
-        env_key = flat_key.upper().replace(".", "_")
-        env_value = os.environ.get(env_key)
+    # 중첩된 설정의 각 리프 값에 대해 환경 변수 확인 (중간 평면화 딕셔너리 없이 순회)
+    for path, parent, key in _walk_leaves(config):
+        env_value = environ.get("_".join(path).upper())
         
         if env_value is not None:
             # 원래 설정에 환경 변수 값 적용
-            _set_nested_value(config, flat_key.split("."), env_value)
+            parent[key] = _convert_value_type(parent[key], env_value)
     
     return config
 
 
-def _flatten_dict(d: Dict[str, Any], parent_key: str = "", sep: str = ".") -> Dict[str, Any]:
+def _walk_leaves(d: Dict[str, Any]) -> Iterator[Tuple[Tuple[str, ...], Dict[str, Any], Any]]:
     """
-    중첩된 딕셔너리를 평면화합니다.
+    중첩된 딕셔너리의 리프 값을 재귀 없이 명시적 스택으로 순회합니다.
 
     Args:
-        d (Dict[str, Any]): 평면화할 딕셔너리
-        parent_key (str, optional): 부모 키. 기본값은 빈 문자열입니다.
-        sep (str, optional): 키 구분자. 기본값은 "."입니다.
+        d (Dict[str, Any]): 순회할 딕셔너리
 
-    Returns:
-        Dict[str, Any]: 평면화된 딕셔너리
+    Yields:
+        Tuple[Tuple[str, ...], Dict[str, Any], Any]: (키 경로, 리프 값을 담은 부모 딕셔너리, 부모 딕셔너리의 키)
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(_flatten_dict(v, new_key, sep=sep).items())
+    stack = [(d, iter(d.items()), ())]
+    while stack:
+        parent, items, path = stack[-1]
+        for k, v in items:
+            key_path = path + (str(k),)
+            if isinstance(v, dict):
+                # 하위 딕셔너리를 먼저 순회하고 남은 항목은 스택에서 이어서 처리
+                stack.append((v, iter(v.items()), key_path))
+                break
+            yield key_path, parent, k
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
 
 
-def _set_nested_value(d: Dict[str, Any], keys: list, value: Any) -> None:
-    """
-    중첩된 딕셔너리에 값을 설정합니다.
+# 참으로 해석되는 환경 변수 문자열 (소문자)
+_TRUTHY = frozenset(("true", "yes", "1", "y"))
 
-    Args:
-        d (Dict[str, Any]): 대상 딕셔너리
-        keys (list): 키 경로
-        value (Any): 설정할 값
-    """
-    if len(keys) == 1:
-        d[keys[0]] = _convert_value_type(d.get(keys[0]), value)
-        return
-    
-    if keys[0] not in d:
-        d[keys[0]] = {}
-    
-    _set_nested_value(d[keys[0]], keys[1:], value)
+
+def _to_bool(value: str) -> bool:
+    """환경 변수 문자열을 불리언으로 변환"""
+    return value.lower() in _TRUTHY
+
+
+def _to_list(value: str) -> list:
+    """쉼표로 구분된 환경 변수 문자열을 리스트로 변환"""
+    return value.split(",")
+
+
+# 원래 값의 타입별 변환 함수 (bool은 int의 하위 클래스이므로 정확한 타입으로 조회)
+_CONVERTERS = {
+    bool: _to_bool,
+    int: int,
+    float: float,
+    list: _to_list,
+}
 
 
 def _convert_value_type(original_value: Any, new_value: str) -> Any:
@@ -125,21 +153,8 @@ def _convert_value_type(original_value: Any, new_value: str) -> Any:
     Returns:
         Any: 변환된 값
     """
-    if original_value is None:
-        return new_value
-    
-    original_type = type(original_value)
-    
-    if original_type == bool:
-        return new_value.lower() in ("true", "yes", "1", "y")
-    elif original_type == int:
-        return int(new_value)
-    elif original_type == float:
-        return float(new_value)
-    elif original_type == list:
-        return new_value.split(",")
-    
-    return new_value
+    converter = _CONVERTERS.get(type(original_value))
+    return converter(new_value) if converter is not None else new_value
 
 
 # DEAD CODE: def get_config_value(config: Dict[str, Any], key_path: str, default: Optional[Any] = None) -> Any:
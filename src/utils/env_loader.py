@@ -36,6 +36,9 @@ class EnvLoader:
         # 환경 변수 로드
         self._load_env_file()
         
+        # 접두사 검색용 환경 변수 스냅샷 (os.environ 전체 순회는 키마다 디코딩 비용이 있으므로 한 번만 복사)
+        self._env_snapshot = dict(os.environ)
+        
         # Vault 사용 여부
         self.use_vault = use_vault
         
@@ -55,6 +58,11 @@ class EnvLoader:
         else:
             logger.warning(f"환경 변수 파일을 찾을 수 없습니다: {self.env_file}")
     
+    def reload(self) -> None:
+        """환경 변수 파일을 다시 로드하고 환경 변수 스냅샷 갱신"""
+        self._load_env_file()
+        self._env_snapshot = dict(os.environ)
+    
     def _init_vault(self) -> None:
         """Vault 초기화"""
         try:
@@ -196,8 +204,8 @@ class EnvLoader:
         
         result = {}
         
-        # 환경 변수에서 검색
-        for key, value in os.environ.items():
+        # 환경 변수에서 검색 (초기화 또는 reload() 시점의 스냅샷 사용)
+        for key, value in self._env_snapshot.items():
             if key.startswith(prefix):
                 result[key[len(prefix):].lower()] = value
         
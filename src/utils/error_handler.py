@@ -7,10 +7,10 @@ including circuit breakers, exponential backoff, and fallback mechanisms.
 
 import os
 import time
-import json
 import random
 import logging
 import functools
+import orjson
 from typing import Any, Callable, Dict, Optional, TypeVar, cast
 from datetime import datetime, timedelta
 
@@ -200,24 +200,53 @@ def load_error_handling_config() -> Dict[str, Any]:
     """
     Load error handling configuration from test_mode.json.
     
+    The file is read once per path and the parsed result is cached, so applying the
+    error handling decorators to many functions does not re-read it each time.
+    
     Returns:
-        Dict[str, Any]: Error handling configuration
+        Dict[str, Any]: Error handling configuration (shared, do not modify)
     """
     # 프로젝트 루트 경로 가져오기
     project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     config_path = os.environ.get('TEST_CONFIG_PATH', os.path.join(project_root, 'config', 'test_mode.json'))
     
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        
-        # Return error handling config or default empty dict
-        return config.get('error_handling', {})
+        return _read_error_handling_config(config_path)
     except Exception as e:
+        # Failures are not cached, so a missing or broken file is retried on the next call
         logger.warning(f"Failed to load error handling config: {e}")
         return {}
 
 
+def reload_error_handling_config() -> None:
+    """
+    Drop the cached error handling configuration so the next load re-reads the file
+    (e.g. after tests rewrite test_mode.json).
+    """
+    _read_error_handling_config.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _read_error_handling_config(config_path: str) -> Dict[str, Any]:
+    """
+    Read the error handling section of a test mode config file (cached per path).
+    
+    Args:
+        config_path: Path to the test mode JSON file
+        
+    Returns:
+        Dict[str, Any]: Error handling configuration (empty dict if the file has no such section)
+        
+    Raises:
+        OSError, orjson.JSONDecodeError: If the file cannot be read or parsed (nothing is cached)
+    """
+    with open(config_path, 'rb') as f:
+        config = orjson.loads(f.read())
+    
+    # Return error handling config or default empty dict
+    return config.get('error_handling', {})
+
+
 def with_circuit_breaker(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator to apply circuit breaker pattern to a function.
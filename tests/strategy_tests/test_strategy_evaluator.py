@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+StrategyEvaluator 증분 지표 계산 단위 테스트
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.strategy_engine import strategy_evaluator as se_module
+from src.strategy_engine.strategy_evaluator import StrategyEvaluator, INDICATOR_COLUMNS, evaluate_expr
+
+
+class TestIncrementalIndicators(unittest.TestCase):
+    """증분 지표 갱신 결과가 전체 재계산 결과와 일치하는지 검증"""
+
+    WARMUP = 250  # 처음 전체 계산에 사용하는 캔들 수 (SMA 200 포함)
+    STEPS = 100   # 한 개씩 추가하는 캔들 수
+
+    def setUp(self):
+        """테스트 데이터 및 평가기 생성"""
+        self.data = self.create_test_dataframe(self.WARMUP + self.STEPS)
+        self.evaluator = self.create_evaluator()
+
+    @staticmethod
+    def create_evaluator():
+        """비교 오차를 줄이기 위해 float64로 지표를 저장하는 평가기 생성"""
+        evaluator = StrategyEvaluator({})
+        evaluator.dtype = np.float64
+        return evaluator
+
+    @staticmethod
+    def create_test_dataframe(n):
+        """테스트용 5분봉 OHLCV 데이터프레임 생성"""
+        np.random.seed(42)  # 재현 가능한 결과를 위한 시드 설정
+
+        closes = 20000 + np.random.normal(0, 1, n).cumsum() * 100
+        highs = closes * (1 + np.random.random(n) * 0.01)
+        lows = closes * (1 - np.random.random(n) * 0.01)
+        opens = np.concatenate(([closes[0]], closes[:-1]))
+        volumes = np.random.random(n) * 10 + 1
+
+        index = pd.date_range('2023-01-01', periods=n, freq='5min')
+        return pd.DataFrame({
+            'open': opens,
+            'high': highs,
+            'low': lows,
+            'close': closes,
+            'volume': volumes
+        }, index=index)
+
+    def full_recompute(self, df):
+        """새 평가기로 전체 기간 지표 계산"""
+        return self.create_evaluator().prepare_dataframes({'5m': df})['5m']
+
+    def assert_indicators_match(self, actual, expected, msg=None):
+        """모든 지표 컬럼이 전체 재계산 결과와 일치하는지 확인 (NaN 위치 포함)"""
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_allclose(
+                actual[name].to_numpy(), expected[name].to_numpy(),
+                rtol=1e-9, atol=1e-9, equal_nan=True,
+                err_msg=f"{name} 지표가 전체 재계산과 다릅니다 ({msg})"
+            )
+
+    def test_append_bars_one_by_one(self):
+        """캔들을 하나씩 추가해도 전체 재계산과 같은 값"""
+        evaluator = self.evaluator
+        evaluator.prepare_dataframes({'5m': self.data.iloc[:self.WARMUP]})
+
+        with patch.object(evaluator, '_calculate_indicators', wraps=evaluator._calculate_indicators) as full:
+            for end in range(self.WARMUP + 1, len(self.data) + 1):
+                df = self.data.iloc[:end]
+                prepared = evaluator.prepare_dataframes({'5m': df})['5m']
+                self.assert_indicators_match(prepared, self.full_recompute(df), f"캔들 {end}개")
+
+            # 모든 갱신이 증분 경로로 처리되어야 함
+            self.assertEqual(full.call_count, 0, "증분 갱신 대신 전체 재계산이 실행되었습니다")
+
+    def test_update_last_bar_in_place(self):
+        """마지막 캔들이 갱신된 경우에도 전체 재계산과 같은 값"""
+        evaluator = self.evaluator
+        df = self.data.iloc[:self.WARMUP + 1].copy()
+        evaluator.prepare_dataframes({'5m': df})
+
+        with patch.object(evaluator, '_calculate_indicators', wraps=evaluator._calculate_indicators) as full:
+            for change in (1.002, 0.995, 1.01):
+                df.iloc[-1, df.columns.get_loc('close')] = self.data['close'].iloc[self.WARMUP] * change
+                prepared = evaluator.prepare_dataframes({'5m': df})['5m']
+                self.assert_indicators_match(prepared, self.full_recompute(df), f"종가 x{change}")
+
+            self.assertEqual(full.call_count, 0, "증분 갱신 대신 전체 재계산이 실행되었습니다")
+
+    def test_gap_falls_back_to_full_recompute(self):
+        """여러 캔들이 한 번에 추가되면 전체 재계산"""
+        evaluator = self.evaluator
+        evaluator.prepare_dataframes({'5m': self.data.iloc[:self.WARMUP]})
+
+        df = self.data.iloc[:self.WARMUP + 5]
+        with patch.object(evaluator, '_calculate_indicators', wraps=evaluator._calculate_indicators) as full:
+            prepared = evaluator.prepare_dataframes({'5m': df})['5m']
+            self.assertEqual(full.call_count, 1)
+
+        self.assert_indicators_match(prepared, self.full_recompute(df), "캔들 5개 추가")
+
+    def test_indicator_arrays_match_columns(self):
+        """indicator_arrays의 각 행이 준비된 데이터프레임 컬럼과 같음"""
+        prepared = self.evaluator.prepare_dataframes({'5m': self.data})['5m']
+        ind = self.evaluator.indicator_arrays['5m']
+
+        self.assertEqual(ind.shape, (len(INDICATOR_COLUMNS), len(self.data)))
+        for i, name in enumerate(INDICATOR_COLUMNS):
+            np.testing.assert_array_equal(ind[i], prepared[name].to_numpy())
+
+
+class TestEvaluateExprFallback(unittest.TestCase):
+    """numexpr 없이 numpy로 평가하는 신호 표현식 테스트"""
+
+    def setUp(self):
+        """numexpr 비활성화 및 테스트 데이터 생성"""
+        patcher = patch.object(se_module, 'numexpr', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'close': rng.random(100) * 100,
+            'rsi': rng.random(100) * 100,
+            'volume': rng.random(100) - 0.1,
+        })
+
+    def test_matches_numpy_operators(self):
+        """비교/논리/산술 연산 결과가 numpy 연산과 같음"""
+        df = self.df
+        base_ma = np.full(len(df), 50.0)
+        result = evaluate_expr(
+            df,
+            "((close < base_ma * low_offset) & (rsi < rsi_buy) | ~(volume > 0)) & (close - -1 >= 2 / rsi)",
+            {'base_ma': base_ma, 'low_offset': 1.2, 'rsi_buy': 40},
+        )
+
+        expected = (((df['close'].values < base_ma * 1.2) & (df['rsi'].values < 40) | ~(df['volume'].values > 0))
+                    & (df['close'].values + 1 >= 2 / df['rsi'].values))
+        np.testing.assert_array_equal(result, expected)
+
+    def test_variables_take_precedence_over_columns(self):
+        """같은 이름의 변수가 컬럼보다 우선"""
+        result = evaluate_expr(self.df, "rsi > 50", {'rsi': np.zeros(len(self.df))})
+        self.assertFalse(result.any())
+
+    def test_rejects_unsupported_expressions(self):
+        """함수 호출, 속성/인덱스 접근, 문자열 상수 등은 평가하지 않고 거부"""
+        for expr in ("__import__('os').system('true')", "close.__class__", "abs(close) > 1",
+                     "close[0] > 1", "close > 'a'", "0 < close < 1", "(lambda: 1)()"):
+            with self.assertRaises(ValueError, msg=expr):
+                evaluate_expr(self.df, expr)
+
+    def test_unknown_name(self):
+        """정의되지 않은 이름은 KeyError"""
+        with self.assertRaises(KeyError):
+            evaluate_expr(self.df, "missing > 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
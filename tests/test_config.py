@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+설정 관리 모듈 단위 테스트
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.utils.config import _walk_leaves, _enrich_config_with_env_vars, _convert_value_type
+
+
+class TestWalkLeaves(unittest.TestCase):
+    """중첩 설정 리프 순회 테스트"""
+
+    def test_yields_every_leaf_with_parent_and_key(self):
+        """모든 리프 값을 (키 경로, 부모 딕셔너리, 키)로 순회"""
+        config = {
+            'database': {'host': 'localhost', 'port': 5432, 'options': {'ssl': True}},
+            'debug': False,
+            'pairs': ['BTC/USDT', 'ETH/USDT'],
+        }
+
+        leaves = {path: (parent, key) for path, parent, key in _walk_leaves(config)}
+
+        self.assertEqual(set(leaves), {
+            ('database', 'host'),
+            ('database', 'port'),
+            ('database', 'options', 'ssl'),
+            ('debug',),
+            ('pairs',),
+        })
+        parent, key = leaves[('database', 'options', 'ssl')]
+        self.assertIs(parent, config['database']['options'])
+        self.assertEqual(key, 'ssl')
+        # 리스트는 리프 값으로 취급
+        parent, key = leaves[('pairs',)]
+        self.assertIs(parent[key], config['pairs'])
+
+    def test_preserves_order_across_nested_dicts(self):
+        """하위 딕셔너리 순회 후 같은 단계의 남은 항목을 이어서 순회 (삽입 순서 유지)"""
+        config = {'a': 1, 'b': {'c': 2, 'd': {'e': 3}, 'f': 4}, 'g': 5}
+
+        paths = [path for path, _, _ in _walk_leaves(config)]
+
+        self.assertEqual(paths, [('a',), ('b', 'c'), ('b', 'd', 'e'), ('b', 'f'), ('g',)])
+
+    def test_empty_dicts_and_non_string_keys(self):
+        """빈 딕셔너리는 리프가 없고, 문자열이 아닌 키는 경로에서 문자열로 변환"""
+        config = {'empty': {}, 'codes': {404: 'not found'}}
+
+        leaves = list(_walk_leaves(config))
+
+        self.assertEqual(len(leaves), 1)
+        path, parent, key = leaves[0]
+        self.assertEqual(path, ('codes', '404'))
+        # 부모 딕셔너리 접근에는 원래 키 사용
+        self.assertEqual(key, 404)
+        self.assertEqual(parent[key], 'not found')
+
+    def test_deep_nesting_without_recursion_limit(self):
+        """재귀 한도보다 깊은 설정도 순회"""
+        depth = sys.getrecursionlimit() + 100
+        config = node = {}
+        for _ in range(depth - 1):
+            node['n'] = {}
+            node = node['n']
+        node['leaf'] = 1
+
+        leaves = list(_walk_leaves(config))
+
+        self.assertEqual(len(leaves), 1)
+        self.assertEqual(len(leaves[0][0]), depth)
+
+    def test_env_override_applied_in_place(self):
+        """키 경로의 대문자/밑줄 환경 변수로 리프 값 재정의"""
+        config = {'database': {'postgresql': {'password': 'default', 'host': 'localhost'}}}
+        env = {'DATABASE_POSTGRESQL_PASSWORD': 'secret'}
+
+        with patch.dict('os.environ', env):
+            result = _enrich_config_with_env_vars(config)
+
+        self.assertIs(result, config)
+        self.assertEqual(config['database']['postgresql'], {'password': 'secret', 'host': 'localhost'})
+
+
+class TestConvertValueType(unittest.TestCase):
+    """환경 변수 문자열의 타입 변환 테스트"""
+
+    def test_bool_truthy_and_falsy_strings(self):
+        """참 문자열(대소문자 무관)만 True, 나머지는 False"""
+        for value in ('true', 'TRUE', 'Yes', '1', 'y', 'Y'):
+            self.assertIs(_convert_value_type(False, value), True, value)
+        for value in ('false', 'no', '0', 'n', '', 'on'):
+            self.assertIs(_convert_value_type(True, value), False, value)
+
+    def test_bool_is_not_converted_as_int(self):
+        """bool은 int의 하위 클래스지만 불리언으로 변환"""
+        self.assertIs(_convert_value_type(True, '0'), False)
+        self.assertEqual(_convert_value_type(0, '1'), 1)
+        self.assertIs(type(_convert_value_type(0, '1')), int)
+
+    def test_int_and_float(self):
+        """정수/실수 원래 값은 같은 타입으로 변환"""
+        self.assertEqual(_convert_value_type(5432, '6543'), 6543)
+        self.assertEqual(_convert_value_type(0.5, '0.25'), 0.25)
+        self.assertIs(type(_convert_value_type(0.5, '1')), float)
+        with self.assertRaises(ValueError):
+            _convert_value_type(1, 'abc')
+
+    def test_list_split_on_comma(self):
+        """리스트 원래 값은 쉼표로 분리"""
+        self.assertEqual(_convert_value_type(['BTC/USDT'], 'BTC/USDT,ETH/USDT'), ['BTC/USDT', 'ETH/USDT'])
+        self.assertEqual(_convert_value_type([], 'single'), ['single'])
+
+    def test_other_types_return_string(self):
+        """알 수 없는 타입은 문자열 그대로 반환"""
+        self.assertEqual(_convert_value_type('localhost', 'db'), 'db')
+        self.assertEqual(_convert_value_type(None, '42'), '42')
+        self.assertEqual(_convert_value_type({'a': 1}, 'x'), 'x')
+
+    def test_env_override_converted_to_original_type(self):
+        """환경 변수 재정의 시 원래 값의 타입으로 변환"""
+        config = {'trading': {'dry_run': True, 'max_open_trades': 3, 'stake': 0.1, 'pairs': ['BTC/USDT']}}
+        env = {
+            'TRADING_DRY_RUN': 'false',
+            'TRADING_MAX_OPEN_TRADES': '5',
+            'TRADING_STAKE': '0.2',
+            'TRADING_PAIRS': 'BTC/USDT,ETH/USDT',
+        }
+
+        with patch.dict('os.environ', env):
+            _enrich_config_with_env_vars(config)
+
+        self.assertEqual(config['trading'], {
+            'dry_run': False,
+            'max_open_trades': 5,
+            'stake': 0.2,
+            'pairs': ['BTC/USDT', 'ETH/USDT'],
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+리스크 이벤트 구독자 단위 테스트
+"""
+
+import asyncio
+import collections
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+import orjson
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.risk_manager import event_subscriber as es_module
+from src.risk_manager.event_subscriber import EventSubscriber
+
+
+class FakePubSub:
+    """발행된 메시지를 순서대로 돌려주는 Redis PubSub 대체 객체"""
+
+    def __init__(self):
+        self.messages = collections.deque()
+        self.channels = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def unsubscribe(self):
+        self.channels = []
+
+    async def get_message(self, ignore_subscribe_messages=True):
+        return self.messages.popleft() if self.messages else None
+
+    def publish(self, channel, data):
+        """테스트에서 메시지 발행 (channel은 str 또는 bytes)"""
+        self.messages.append({'channel': channel, 'data': orjson.dumps(data)})
+
+
+class FakeRedis:
+    """pubsub()만 제공하는 Redis 클라이언트 대체 객체"""
+
+    def __init__(self):
+        self.pubsub_instance = FakePubSub()
+
+    def pubsub(self):
+        return self.pubsub_instance
+
+
+async def wait_for(condition, timeout=3.0):
+    """조건이 참이 될 때까지 대기 (시간 초과 시 AssertionError)"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError("조건 대기 시간 초과")
+        await asyncio.sleep(0.01)
+
+
+class TestEventSubscriberFanOut(unittest.TestCase):
+    """구독자별 큐를 통한 이벤트 분배 테스트"""
+
+    def run_with_subscriber(self, scenario):
+        """텔레그램 전달을 끈 구독자를 연결하고 시나리오 실행 후 종료"""
+        async def main():
+            subscriber = EventSubscriber()
+            subscriber._telegram_bot_getter = lambda: None
+            redis_client = FakeRedis()
+            try:
+                await scenario(subscriber, redis_client)
+            finally:
+                await subscriber.close()
+
+        asyncio.run(main())
+
+    def test_events_delivered_in_order_for_str_and_bytes_channels(self):
+        """str/bytes 채널 이름 모두 같은 구독자에게 순서대로 전달"""
+        received = []
+
+        async def callback(data):
+            received.append(data['n'])
+
+        async def scenario(subscriber, redis_client):
+            subscriber.subscribe('risk_events', callback)
+            await subscriber.connect(redis_client)
+
+            pubsub = redis_client.pubsub_instance
+            for n in range(4):
+                pubsub.publish('risk_events' if n % 2 else b'risk_events', {'n': n})
+            # 구독하지 않은 채널 이벤트는 전달되지 않음
+            pubsub.publish('alerts', {'n': 99})
+
+            await wait_for(lambda: len(received) == 4 and not pubsub.messages)
+
+        self.run_with_subscriber(scenario)
+        self.assertEqual(received, [0, 1, 2, 3])
+
+    def test_slow_subscriber_does_not_block_others(self):
+        """느린 구독자가 있어도 다른 구독자는 바로 이벤트를 받음"""
+        fast_received = []
+        slow_started = []
+        release = None
+
+        async def fast(data):
+            fast_received.append(data['n'])
+
+        async def slow(data):
+            slow_started.append(data['n'])
+            await release.wait()
+
+        async def scenario(subscriber, redis_client):
+            nonlocal release
+            release = asyncio.Event()
+            subscriber.subscribe('risk_events', slow)
+            subscriber.subscribe('risk_events', fast)
+            await subscriber.connect(redis_client)
+
+            for n in range(3):
+                redis_client.pubsub_instance.publish('risk_events', {'n': n})
+
+            await wait_for(lambda: len(fast_received) == 3)
+            # 느린 구독자는 첫 이벤트 처리 중이며 나머지는 큐에서 대기
+            self.assertEqual(slow_started, [0])
+            release.set()
+            await wait_for(lambda: slow_started == [0, 1, 2])
+
+        self.run_with_subscriber(scenario)
+        self.assertEqual(fast_received, [0, 1, 2])
+
+    def test_subscribers_registered_after_connect(self):
+        """연결 이후 등록한 구독자도 이벤트를 받음"""
+        received = []
+
+        async def callback(data):
+            received.append(data['n'])
+
+        async def scenario(subscriber, redis_client):
+            await subscriber.connect(redis_client)
+            subscriber.subscribe('alerts', callback)
+            redis_client.pubsub_instance.publish(b'alerts', {'n': 1})
+            await wait_for(lambda: received == [1])
+
+        self.run_with_subscriber(scenario)
+
+    def test_duplicate_subscribe_and_unsubscribe(self):
+        """같은 콜백 중복 등록은 무시하고, 구독 취소 후에는 전달하지 않음"""
+        received = []
+
+        async def callback(data):
+            received.append(data['n'])
+
+        async def scenario(subscriber, redis_client):
+            subscriber.subscribe('risk_events', callback)
+            subscriber.subscribe('risk_events', callback)
+            await subscriber.connect(redis_client)
+            self.assertEqual(len(subscriber.subscribers['risk_events']), 1)
+
+            pubsub = redis_client.pubsub_instance
+            pubsub.publish('risk_events', {'n': 1})
+            await wait_for(lambda: received == [1])
+
+            subscriber.unsubscribe('risk_events', callback)
+            self.assertEqual(subscriber._channel_queues['risk_events'], [])
+            self.assertIs(subscriber._channel_queues['risk_events'], subscriber._channel_queues[b'risk_events'])
+            pubsub.publish('risk_events', {'n': 2})
+            await wait_for(lambda: not pubsub.messages)
+            await asyncio.sleep(0.05)
+
+        self.run_with_subscriber(scenario)
+        self.assertEqual(received, [1])
+
+    def test_full_queue_drops_new_events(self):
+        """구독자 큐가 가득 차면 새 이벤트를 버리고 다른 구독자에는 영향 없음"""
+        blocked_received = []
+        other_received = []
+        release = None
+
+        async def blocked(data):
+            blocked_received.append(data['n'])
+            await release.wait()
+
+        async def other(data):
+            other_received.append(data['n'])
+
+        async def scenario(subscriber, redis_client):
+            nonlocal release
+            release = asyncio.Event()
+            with patch.object(es_module, '_SUBSCRIBER_QUEUE_SIZE', 2):
+                subscriber.subscribe('risk_events', blocked)
+                subscriber.subscribe('risk_events', other)
+            await subscriber.connect(redis_client)
+
+            for n in range(5):
+                redis_client.pubsub_instance.publish('risk_events', {'n': n})
+            await wait_for(lambda: len(other_received) == 5)
+
+            release.set()
+            await wait_for(lambda: len(blocked_received) == 3)
+            await asyncio.sleep(0.05)
+
+        self.run_with_subscriber(scenario)
+        # 첫 이벤트는 처리 중, 다음 두 개는 큐에 보관, 나머지는 버려짐
+        self.assertEqual(blocked_received, [0, 1, 2])
+        self.assertEqual(other_received, [0, 1, 2, 3, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
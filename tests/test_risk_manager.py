@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+리스크 관리자 싱글톤 접근 함수 단위 테스트
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.risk_manager import risk_manager as rm_module
+from src.risk_manager.risk_manager import get_risk_manager, set_risk_manager, reset_risk_manager
+
+
+class TestRiskManagerOverride(unittest.TestCase):
+    """set_risk_manager()/reset_risk_manager() 컨텍스트별 재정의 테스트"""
+
+    def setUp(self):
+        """전역 싱글톤을 테스트용 객체로 교체"""
+        self.global_rm = object()
+        patcher = patch.object(rm_module, '_risk_manager', self.global_rm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_override_and_reset(self):
+        """재정의한 인스턴스를 반환하고 reset 후 전역 인스턴스로 복원"""
+        override = object()
+        token = set_risk_manager(override)
+        try:
+            self.assertIs(get_risk_manager(), override)
+        finally:
+            reset_risk_manager(token)
+
+        self.assertIs(get_risk_manager(), self.global_rm)
+        # 전역 싱글톤은 변경되지 않음
+        self.assertIs(rm_module._risk_manager, self.global_rm)
+
+    def test_nested_override(self):
+        """중첩 재정의는 토큰 순서대로 복원"""
+        outer, inner = object(), object()
+        outer_token = set_risk_manager(outer)
+        inner_token = set_risk_manager(inner)
+        self.assertIs(get_risk_manager(), inner)
+
+        reset_risk_manager(inner_token)
+        self.assertIs(get_risk_manager(), outer)
+
+        reset_risk_manager(outer_token)
+        self.assertIs(get_risk_manager(), self.global_rm)
+
+    def test_override_is_task_local(self):
+        """한 태스크의 재정의는 다른 태스크에 보이지 않음"""
+        override = object()
+        overridden = asyncio.Event()
+        seen = {}
+
+        async def overriding_task():
+            set_risk_manager(override)
+            seen['own'] = get_risk_manager()
+            overridden.set()
+
+        async def other_task():
+            await overridden.wait()
+            seen['other'] = get_risk_manager()
+
+        async def main():
+            await asyncio.gather(overriding_task(), other_task())
+            seen['parent'] = get_risk_manager()
+
+        asyncio.run(main())
+
+        self.assertIs(seen['own'], override)
+        self.assertIs(seen['other'], self.global_rm)
+        self.assertIs(seen['parent'], self.global_rm)
+
+    def test_child_task_inherits_override(self):
+        """재정의 이후 생성된 태스크는 재정의를 물려받음"""
+        override = object()
+
+        async def get_in_task():
+            return get_risk_manager()
+
+        async def main():
+            token = set_risk_manager(override)
+            try:
+                return await asyncio.create_task(get_in_task())
+            finally:
+                reset_risk_manager(token)
+
+        self.assertIs(asyncio.run(main()), override)
+
+
+if __name__ == '__main__':
+    unittest.main()